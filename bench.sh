@@ -0,0 +1 @@
+python3.7 src/benchmark_blackjack.py "$@"
@@ -0,0 +1,54 @@
+from collections import namedtuple
+import numpy as np
+from Hand import RANK_KINDS
+
+# The scores of a batch of hands, with one entry per hand (see Hand.ScoreEntry)
+BatchScores = namedtuple('BatchScores', ['best_score', 'is_bust', 'is_soft', 'priority'])
+
+PAD = -1  # card index of the empty slots of a hand shorter than the batch is wide
+
+# hard value and is ace of each card index (0-51)
+CARD_VALUES = np.array([RANK_KINDS[card_index % 13][0] for card_index in range(52)], dtype=np.int32)
+CARD_IS_ACE = np.array([RANK_KINDS[card_index % 13][1] for card_index in range(52)], dtype=bool)
+
+
+def evaluate_hands(cards: object, pad=PAD):
+    """
+    :param cards: an (N, max cards) array of the card index (0-51) of every card of N hands, where hands with
+    fewer cards are padded with pad (raises ValueError if not 2 dimensional, or if an index is not a card or pad)
+    :param pad: the card index of an empty slot
+    :return: the BatchScores of the N hands, which are the same as the scores of Hands holding the same cards
+    """
+    cards = np.asarray(cards)
+    if cards.ndim != 2:
+        raise ValueError('Expected an (N, max cards) array of card indices')
+    present = cards != pad
+    if np.any(present & ((cards < 0) | (cards >= 52))):
+        raise ValueError('Card indices must be within 0-51 (or {0} for an empty slot)'.format(pad))
+    card_indices = np.where(present, cards, 0)
+    hard_total = np.where(present, CARD_VALUES[card_indices], 0).sum(axis=1)
+    has_aces = (present & CARD_IS_ACE[card_indices]).any(axis=1)
+    return score_hands(hard_total, has_aces)
+
+
+def score_hands(hard_total: object, has_aces: object):
+    """
+    :param hard_total: an array of the score of each hand when every ace is worth 1
+    :param has_aces: an array of whether each hand has at least one ace
+    :return: the BatchScores of the hands (see lookup_score), in arrays of the same shape
+    """
+    is_bust = hard_total > 21
+    is_soft = has_aces & (hard_total + 10 <= 21)
+    best_score = hard_total + 10 * is_soft
+    return BatchScores(best_score, is_bust, is_soft, np.where(is_bust, -best_score, best_score))
+
+
+def rank_hands(priority: object):
+    """
+    :param priority: an array of the priority of each hand, where the last axis holds the hands of one game
+    (e.g. of shape (P,) for one game, or (M, P) for M games)
+    :return: an array of the same shape holding the position of each hand within its game, in the order of
+    ranking (i.e. 1st place, 2nd place, etc.) as in Game.get_rankings, where hands with the same priority are
+    ordered by their position (i.e. by seat).
+    """
+    return np.argsort(-np.asarray(priority), axis=-1, kind='stable')
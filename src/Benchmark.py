@@ -0,0 +1,265 @@
+import json
+import platform
+import random
+import tracemalloc
+from time import perf_counter
+from BinaryTree import BinaryTree
+from Card import Card
+from Deck import Deck
+from Game import Game
+from Hand import Hand
+from MaxHeap import MaxHeap
+from Simulation import Simulation, ThresholdPolicy
+try:
+    from VectorSimulation import VectorSimulation
+except ImportError:  # numpy is optional
+    VectorSimulation = None
+
+
+class _Priority(object):
+    """
+    Minimal item with a fixed priority, used to benchmark MaxHeap
+    """
+    __slots__ = ('priority',)
+
+    def __init__(self, priority: int):
+        """
+        :param priority: the priority of the item
+        """
+        self.priority = priority
+
+    def get_priority(self):
+        """
+        :return: the priority of the item
+        """
+        return self.priority
+
+
+def bench_deck_draw(scale: int):
+    """
+    Draws every card from scale fresh decks
+
+    :return: the number of draws
+    """
+    for _ in range(scale):
+        deck = Deck()
+        while deck.draw():
+            pass
+    return scale * 52
+
+
+def bench_hand_add_card(scale: int):
+    """
+    Deals scale hands of 4 cards from fresh decks
+
+    :return: the number of cards added
+    """
+    deck = Deck()
+    for _ in range(scale):
+        if deck.get_num_remaining() < 4:
+            deck.shuffle()
+        hand = Hand()
+        for _ in range(4):
+            hand.add_card(deck.draw())
+    return scale * 4
+
+
+def bench_binarytree_get_leaves(scale: int):
+    """
+    Gets the leaves of the possible score tree of a hand holding 4 aces and a king, scale times
+
+    :return: the number of calls to get_leaves
+    """
+    hand = Hand()
+    for card in [Card('ace', [1, 11])] * 4 + [Card('king', [10])]:
+        hand.add_card(card)
+    tree: BinaryTree = hand.hands
+    for _ in range(scale):
+        tree.get_leaves()
+    return scale
+
+
+def bench_maxheap_floyd_build(scale: int):
+    """
+    Builds scale MaxHeaps of 1000 items each with Floyd's Build Heap algorithm
+
+    :return: the number of items heapified
+    """
+    items = [_Priority(random.randint(-31, 21)) for _ in range(1000)]
+    for _ in range(scale):
+        MaxHeap(len(items), items)
+    return scale * len(items)
+
+
+def bench_maxheap_remove_max(scale: int):
+    """
+    Removes every item from scale MaxHeaps of 1000 items each
+
+    :return: the number of calls to removeMax
+    """
+    items = [_Priority(random.randint(-31, 21)) for _ in range(1000)]
+    for _ in range(scale):
+        heap = MaxHeap(len(items), items)
+        while not heap.isEmpty():
+            heap.removeMax()
+    return scale * len(items)
+
+
+def _bench_game_round(num_players: int):
+    """
+    :param num_players: the number of players at the table
+    :return: a benchmark playing rounds where every player hits below 17
+    """
+    def bench(scale: int):
+        """
+        Plays scale rounds of BlackJack
+
+        :return: the number of rounds played
+        """
+        names = ['Player {0}'.format(i) for i in range(num_players)]
+        simulation = Simulation(names, [ThresholdPolicy(17) for _ in names])
+        for _ in range(scale):
+            simulation.play_round().get_rankings()
+        return scale
+    return bench
+
+
+def _bench_vector_round(num_players: int):
+    """
+    :param num_players: the number of players at the table
+    :return: a benchmark playing the same rounds as _bench_game_round with VectorSimulation, so that their ops/sec
+    give the speedup of the NumPy path
+    """
+    def bench(scale: int):
+        """
+        Plays scale rounds of BlackJack at once
+
+        :return: the number of rounds played
+        """
+        names = ['Player {0}'.format(i) for i in range(num_players)]
+        return VectorSimulation(names, [ThresholdPolicy(17) for _ in names]).run(scale).rounds
+    return bench
+
+
+def bench_game_deal_26(scale: int):
+    """
+    Sets up scale pre-dealt games of 26 players, each dealing a whole fresh deck
+
+    :return: the number of games set up
+    """
+    names = ['Player {0}'.format(i) for i in range(26)]
+    for _ in range(scale):
+        Game(names, True)
+    return scale
+
+
+# name --> (benchmark, default scale)
+BENCHMARKS = {
+    'deck_draw': (bench_deck_draw, 2000),
+    'hand_add_card': (bench_hand_add_card, 20000),
+    'binarytree_get_leaves': (bench_binarytree_get_leaves, 20000),
+    'maxheap_floyd_build': (bench_maxheap_floyd_build, 50),
+    'maxheap_remove_max': (bench_maxheap_remove_max, 10),
+    'game_round_1': (_bench_game_round(1), 5000),
+    'game_round_8': (_bench_game_round(8), 1000),
+    'game_round_26': (_bench_game_round(26), 300),
+    'game_deal_26': (bench_game_deal_26, 1000),
+}
+if VectorSimulation is not None:
+    BENCHMARKS.update({
+        'vector_round_1': (_bench_vector_round(1), 500000),
+        'vector_round_8': (_bench_vector_round(8), 100000),
+        'vector_round_26': (_bench_vector_round(26), 30000),
+    })
+
+
+def run_benchmark(name: str, scale=None, repeat=3, seed=0):
+    """
+    :param name: the name of a benchmark in BENCHMARKS (raises ValueError if there is no such benchmark)
+    :param scale: the amount of work per run (the benchmark's default if not provided)
+    :param repeat: the number of timed runs, of which the fastest is kept
+    :param seed: the seed of the global RNG at the start of every run
+    :return: a dictionary of the operations per run, the operations per second of the fastest run, and the peak
+    memory (in bytes) allocated during one more run traced by tracemalloc
+    """
+    if name not in BENCHMARKS:
+        raise ValueError('No benchmark named {0}'.format(name))
+    bench, default_scale = BENCHMARKS[name]
+    scale = scale if scale is not None else default_scale
+    best = float('inf')
+    ops = 0
+    for _ in range(repeat):
+        random.seed(seed)
+        start = perf_counter()
+        ops = bench(scale)
+        best = min(best, perf_counter() - start)
+    random.seed(seed)
+    tracemalloc.start()
+    try:
+        bench(scale)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {'ops': ops, 'ops_per_sec': ops / best if best > 0 else float('inf'), 'peak_bytes': peak}
+
+
+def run_benchmarks(names=None, scale_factor=1.0, repeat=3, seed=0):
+    """
+    :param names: the names of the benchmarks to run (every benchmark if not provided)
+    :param scale_factor: multiplier applied to every benchmark's default scale
+    :param repeat: the number of timed runs per benchmark
+    :param seed: the seed of the global RNG at the start of every run
+    :return: a dictionary of the run's settings and the result of each benchmark (see run_benchmark)
+    """
+    names = names if names else list(BENCHMARKS)
+    results = {}
+    for name in names:
+        scale = max(1, int(BENCHMARKS[name][1] * scale_factor)) if name in BENCHMARKS else None
+        results[name] = run_benchmark(name, scale, repeat, seed)
+    return {
+        'python': platform.python_version(),
+        'seed': seed,
+        'repeat': repeat,
+        'scale_factor': scale_factor,
+        'benchmarks': results
+    }
+
+
+def compare_results(baseline: dict, current: dict, threshold=0.1):
+    """
+    :param baseline: results of an earlier run_benchmarks
+    :param current: results of a later run_benchmarks
+    :param threshold: the relative slowdown (or peak memory growth) above which a benchmark has regressed
+    :return: a list of (name, relative change in ops/sec, relative change in peak memory, regressed) for every
+    benchmark in both results, followed by (name, None, None, False) for every benchmark that is new in current
+    """
+    rows = []
+    for name, before in baseline['benchmarks'].items():
+        after = current['benchmarks'].get(name)
+        if after is None:
+            continue
+        speed_change = after['ops_per_sec'] / before['ops_per_sec'] - 1
+        memory_change = after['peak_bytes'] / before['peak_bytes'] - 1 if before['peak_bytes'] else 0.0
+        rows.append((name, speed_change, memory_change, speed_change < -threshold or memory_change > threshold))
+    for name in current['benchmarks']:
+        if name not in baseline['benchmarks']:
+            rows.append((name, None, None, False))
+    return rows
+
+
+def save_results(results: dict, path: str):
+    """
+    :param results: results of run_benchmarks
+    :param path: the JSON file to write
+    """
+    with open(path, 'w') as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+
+
+def load_results(path: str):
+    """
+    :param path: a JSON file written by save_results
+    :return: the results of run_benchmarks
+    """
+    with open(path) as f:
+        return json.load(f)
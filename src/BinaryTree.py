@@ -1,10 +1,14 @@
 from collections import deque
+from itertools import zip_longest
+from Instrumentation import metrics
 
 class BinaryTreeNode(object):
     """
     This class represents a single Node w/ a value within a BinaryTree that can have
-    at most 2 children (left and right)
+    at most 2 children (left and right). Once a node is part of a BinaryTree, its children can only be
+    attached through the tree (see BinaryTree.attach), which keeps the tree's frontier of leaves up to date.
     """
+    __slots__ = ('val', '_left', '_right', '_tree')
 
     def __init__(self, val, left=None, right=None):
         """
@@ -15,8 +19,51 @@ class BinaryTreeNode(object):
         :param right: BinaryTreeNode representing the right child
         """
         self.val = val
-        self.left = left
-        self.right = right
+        self._left = left
+        self._right = right
+        self._tree = None  # the BinaryTree the node is part of, if any
+        if metrics.enabled:
+            metrics.increment('binarytree.nodes')
+
+    def __ensuredetached(self):
+        """
+        Ensures the children of a node are not assigned behind the back of the BinaryTree it is part of (raises
+        AttributeError if the node is part of a BinaryTree)
+        """
+        if self._tree is not None:
+            raise AttributeError('Children of a node in a BinaryTree can only be attached with BinaryTree.attach')
+
+    @property
+    def left(self):
+        """
+        :return: the left child (or None)
+        """
+        return self._left
+
+    @left.setter
+    def left(self, node):
+        """
+        :param node: BinaryTreeNode to become the left child (raises AttributeError if this node is part of a
+        BinaryTree)
+        """
+        self.__ensuredetached()
+        self._left = node
+
+    @property
+    def right(self):
+        """
+        :return: the right child (or None)
+        """
+        return self._right
+
+    @right.setter
+    def right(self, node):
+        """
+        :param node: BinaryTreeNode to become the right child (raises AttributeError if this node is part of a
+        BinaryTree)
+        """
+        self.__ensuredetached()
+        self._right = node
 
     def get_children(self):
         """
@@ -41,15 +88,37 @@ class BinaryTree(object):
     """
     This class represents a BinaryTree, which is a Directed Acyclic Graph in which each node can have at most
     1 parent and at most 2 children, culminating in a single root that is common ancestor of all other nodes.
+    The tree keeps its leaves in pre-order as a live frontier, linked from each leaf to the next, which is updated
+    as children are attached (see attach and expand_leaves). Assigning children to the nodes of the tree directly
+    raises AttributeError, so the frontier can never go stale.
     """
     def __init__(self, root: BinaryTreeNode):
         """
         Constructs a BinaryTree with a single root node
 
-        :param root: the "top" of the BinaryTree (raises ValueError if None)
+        :param root: the "top" of the BinaryTree (raises ValueError if None, or if any of its nodes is already
+        part of a BinaryTree)
         """
         self.__ensureroot(root)
         self.root = root
+        nodes = list(self.iter_preorder())
+        if any(node._tree is not None for node in nodes):
+            raise ValueError('A node can only be part of one BinaryTree')
+        for node in nodes:
+            node._tree = self
+        self.__relink([node for node in nodes if not node.has_children()])
+
+    def __relink(self, leaves: [BinaryTreeNode]):
+        """
+        Replaces the frontier of leaves
+
+        :param leaves: the leaves of the tree in pre-order
+        """
+        self.first_leaf = leaves[0]
+        self.next_leaf = dict(zip(leaves, leaves[1:]))  # leaf --> the next leaf in pre-order
+        self.next_leaf[leaves[-1]] = None
+        self.prev_leaf = dict(zip(leaves[1:], leaves))  # leaf --> the previous leaf in pre-order
+        self.prev_leaf[leaves[0]] = None
 
     def __ensureroot(self, root: BinaryTreeNode):
         """
@@ -60,44 +129,128 @@ class BinaryTree(object):
         if not root:
             raise ValueError('Root cannot be None')
 
-    def get_preorder(self, justleaves=False):
+    def iter_preorder(self, justleaves=False):
         """
-        :param justleaves: if True, only returns the leaves (nodes without children)
-        :return: a collection of nodes resulting in a pre-order traversal of the tree
+        :param justleaves: if True, only yields the leaves (nodes without children)
+        :return: a generator of the nodes of a pre-order traversal of the tree, visiting each node only as it is
+        requested
         """
         self.__ensureroot(self.root)
-        to_explore = deque([self.root])  # collection of nodes to explore
-        nodes = deque()  # collection of nodes to return
-        while len(to_explore) > 0:
-            curr = to_explore.popleft()
-            if curr.has_children():  # non-leaf
+        to_explore = [self.root]  # stack of nodes to explore, the next one last
+        while to_explore:
+            curr = to_explore.pop()
+            left, right = curr.left, curr.right
+            if left or right:  # non-leaf
                 if not justleaves:
-                    nodes.append(curr)
-                # add the children to the front of the exploration collection
-                children = curr.get_children()
-                children.reverse()
-                to_explore.extendleft(children)
+                    yield curr
+                if right:
+                    to_explore.append(right)
+                if left:
+                    to_explore.append(left)
             else:  # leaf
-                nodes.append(curr)
-        return nodes
+                yield curr
+
+    def iter_levelorder(self):
+        """
+        :return: a generator of the nodes of a level-order (breadth-first) traversal of the tree, from left to
+        right within each level
+        """
+        self.__ensureroot(self.root)
+        to_explore = deque([self.root])  # queue of nodes to explore
+        while to_explore:
+            curr = to_explore.popleft()
+            yield curr
+            if curr.left:
+                to_explore.append(curr.left)
+            if curr.right:
+                to_explore.append(curr.right)
+
+    def iter_leaves(self):
+        """
+        :return: a generator of the leaves (nodes without children) of the tree in pre-order, read from the
+        frontier of leaves (which must not be changed while iterating)
+        """
+        leaf, next_leaf = self.first_leaf, self.next_leaf
+        while leaf is not None:
+            yield leaf
+            leaf = next_leaf[leaf]
+
+    def get_preorder(self, justleaves=False):
+        """
+        :param justleaves: if True, only returns the leaves (nodes without children)
+        :return: a collection of nodes resulting in a pre-order traversal of the tree (see iter_preorder to visit
+        the nodes without collecting them)
+        """
+        return deque(self.iter_preorder(justleaves))
 
     def get_leaves(self):
         """
-        :return: the leaves (nodes without children) of the tree resulting in a pre-order traversal
+        :return: a collection of the leaves (nodes without children) of the tree resulting in a pre-order
+        traversal, copied from the frontier of leaves in linear time in the number of leaves
+        """
+        return deque(self.iter_leaves())
+
+    def attach(self, leaf: BinaryTreeNode, left=None, right=None):
+        """
+        Attaches children to a leaf of the tree, which they replace in the frontier of leaves in constant time
+
+        :param leaf: a leaf of the tree (raises ValueError if it is not a leaf of the tree)
+        :param left: BinaryTreeNode to become the left child of the leaf (raises ValueError if it has children or
+        is already part of a BinaryTree)
+        :param right: BinaryTreeNode to become the right child of the leaf (raises ValueError if it has children or
+        is already part of a BinaryTree)
         """
-        return self.get_preorder(True)
+        if leaf not in self.next_leaf:
+            raise ValueError('Children can only be attached to a leaf of the tree')
+        children = [child for child in (left, right) if child]
+        if any(child.has_children() or child._tree is not None for child in children):
+            raise ValueError('Only new leaves can be attached')
+        if not children:
+            return
+        leaf._left, leaf._right = left, right
+        prev_leaf, next_leaf = self.prev_leaf.pop(leaf), self.next_leaf.pop(leaf)
+        for child in children:
+            child._tree = self
+            self.prev_leaf[child] = prev_leaf
+            if prev_leaf is None:
+                self.first_leaf = child
+            else:
+                self.next_leaf[prev_leaf] = child
+            prev_leaf = child
+        self.next_leaf[prev_leaf] = next_leaf
+        if next_leaf is not None:
+            self.prev_leaf[next_leaf] = prev_leaf
+
+    def expand_leaves(self, make_children):
+        """
+        Attaches children to every leaf of the tree at once, in a single pass over the frontier of leaves
+
+        :param make_children: function taking a leaf and returning its (left, right) children (either of which may
+        be None, and neither of which may have children or be part of a BinaryTree)
+        """
+        leaves = []
+        for leaf in self.iter_leaves():
+            left, right = make_children(leaf)
+            if left or right:
+                leaf._left, leaf._right = left, right
+                for child in (left, right):
+                    if child:
+                        child._tree = self
+                        leaves.append(child)
+            else:  # still a leaf
+                leaves.append(leaf)
+        self.__relink(leaves)
 
     def is_equivalent(self, other):
         """
         :param other: BinaryTree to be tested for equality against this one
         :return: True if other has the same number of nodes and with the same values in the same positions
-        resulting from a pre-order traversal (NOTE: this allows for different structures to be equivalent)
+        resulting from a pre-order traversal (NOTE: this allows for different structures to be equivalent). Both
+        trees are traversed in lockstep, stopping at the first difference.
         """
-        this_nodes = self.get_preorder()
-        other_nodes = other.get_preorder()
-        if len(this_nodes) != len(other_nodes):  # unequal number of nodes
-            return False
-        for (a, b) in zip(this_nodes, other_nodes):
+        for (a, b) in zip_longest(self.iter_preorder(), other.iter_preorder()):
+            if a is None or b is None:  # unequal number of nodes
+                return False
             if a.val != b.val:  # unequal node at a particular position in the traversal
                 return False
         return True
@@ -1,8 +1,20 @@
+from numbers import Integral
+
+SUITS = ('diamond', 'spade', 'club', 'heart')
+_VALID_SUITS = frozenset(SUITS)
+# name and values of each rank index (0-12)
+RANKS = (('ace', (1, 11)), ('two', (2,)), ('three', (3,)), ('four', (4,)), ('five', (5,)), ('six', (6,)),
+         ('seven', (7,)), ('eight', (8,)), ('nine', (9,)), ('ten', (10,)), ('jack', (10,)), ('queen', (10,)),
+         ('king', (10,)))
+
+
 class Card(object):
     """
     This class represents a standard playing card (e.g. Ace) as it
     is represented in a game of Black Jack.
     """
+    __slots__ = ('name', 'values', 'suit')
+
     def __init__(self, name: str, values: [int], suit=None):
         """
         :param name: the title of the card (e.g. king)
@@ -43,6 +55,72 @@ class Card(object):
 
         :param suit: one of 'diamond', 'spade', 'club', 'heart' (raises ValueError if not one of these)
         """
-        if suit not in ['diamond', 'spade', 'club', 'heart']:
+        if suit not in _VALID_SUITS:
             raise ValueError('invalid suit')
         self.suit = suit
+
+
+class InternedCard(Card):
+    """
+    This class represents one of the standard cards created once at import (see CARDS and GENERIC_CARDS), which
+    are shared by every Deck and Hand and therefore immutable. Each card knows its index: 0-51 (suit index * 13 +
+    rank index) for a suited card, and 52 + rank index for a card that is generic across all suits.
+    """
+    __slots__ = ('index', 'rank')
+
+    def __init__(self, index: int):
+        """
+        :param index: the index of the card (0-64)
+        """
+        rank = index % 13
+        name, values = RANKS[rank]
+        suit = SUITS[index // 13] if index < 52 else None
+        for attribute, value in zip(('name', 'values', 'suit', 'index', 'rank'), (name, values, suit, index, rank)):
+            object.__setattr__(self, attribute, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError('Interned cards are immutable')
+
+    def __reduce__(self):
+        """
+        :return: how to recreate the card, so that copies and unpickled cards are the interned card itself
+        """
+        return get_card, (self.index,)
+
+    def set_suit(self, suit: str):
+        """
+        Interned cards cannot change suit (raises ValueError)
+        """
+        raise ValueError('Interned cards are immutable')
+
+
+CARDS = tuple(InternedCard(index) for index in range(52))  # suited card of each index
+GENERIC_CARDS = tuple(InternedCard(52 + rank) for rank in range(13))  # suit-less card of each rank index
+
+
+def get_card(index: int):
+    """
+    :param index: the index of an interned card: 0-51 for a suited card, or 52 + rank index for a generic card
+    (raises ValueError if there is no such card)
+    :return: the InternedCard of the index
+    """
+    if 0 <= index < 52:
+        return CARDS[index]
+    if 52 <= index < 65:
+        return GENERIC_CARDS[index - 52]
+    raise ValueError('invalid card: {0}'.format(index))
+
+
+def to_card(card):
+    """
+    :param card: a Card, or the index of an interned card as any integer type (e.g. a NumPy integer)
+    :return: the Card itself, or the InternedCard of the index (raises ValueError if there is no such card, and
+    TypeError if card is neither a Card nor an integer)
+    """
+    if isinstance(card, Card):
+        return card
+    if type(card) is int:  # skips the slower abstract base class check for the common case
+        return get_card(card)
+    if isinstance(card, Integral) and not isinstance(card, bool):
+        return get_card(int(card))
+    raise TypeError('Expected a Card or the index of a card, not {0}'.format(type(card).__name__))
@@ -1,34 +1,142 @@
-from random import choice
-from copy import deepcopy
-from Card import Card
+import random
+from collections.abc import Sequence
+from Card import CARDS, GENERIC_CARDS, SUITS
+from Instrumentation import metrics
+
+
+def _build_card_mapping():
+    """
+    :return: a mapping of each rank index (0-12) to its generic (suit-less) interned Card
+    """
+    return dict(enumerate(GENERIC_CARDS))
+
+
+def get_card_kinds():
+    """
+    :return: (kinds, kind_of_rank), where kinds lists the (hard value, is ace) of each distinct kind of card, and
+    kind_of_rank maps each rank index (0-12) to its kind (e.g. all tens and face cards are one kind)
+    """
+    kinds, kind_of_rank = [], []
+    for rank, card in sorted(_build_card_mapping().items()):
+        kind = (card.get_values()[0], len(card.get_values()) > 1)
+        if kind not in kinds:
+            kinds.append(kind)
+        kind_of_rank.append(kinds.index(kind))
+    return kinds, kind_of_rank
+
+
+SUITED_CARDS = CARDS  # the interned suited Card of each card index, shared by every Deck
+
+
+# Hi-Lo card counting tags of each rank index (0-12): twos to sixes count +1, tens to aces count -1
+HI_LO = (-1, 1, 1, 1, 1, 1, 0, 0, 0, -1, -1, -1, -1)
+
+
+class CountsView(Sequence):
+    """
+    This class represents a read-only view of a list of counts, which reflects later changes to the list
+    """
+    __slots__ = ('_counts',)
+
+    def __init__(self, counts: [int]):
+        """
+        :param counts: the list of counts to view
+        """
+        self._counts = counts
+
+    def __getitem__(self, index):
+        return self._counts[index]
+
+    def __len__(self):
+        return len(self._counts)
+
+    def __repr__(self):
+        return 'CountsView({0})'.format(self._counts)
 
 
 class Deck(object):
     """
     This class represents a standard 52 card deck that
-    can be drawn from.
+    can be drawn from. Every Card it hands out (including the generic card of each rank in card_mapping) is
+    an interned Card shared by every Deck, so its suit cannot be changed with set_suit (use the suited cards of
+    SUITED_CARDS, or get_card, instead).
     """
-    def __init__(self):
+    def __init__(self, counting_system=HI_LO, rng=None):
         """
         Constructs a Deck
+
+        :param counting_system: the tag added to the running count for each rank index (0-12) that is drawn
+        (raises ValueError if there are not 13 tags)
+        :param rng: the random.Random that shuffles the deck (the global RNG of the random module if not provided,
+        see SeedSequence for deriving independent RNGs)
+        """
+        if len(counting_system) != 13:
+            raise ValueError('A counting system needs a tag for each of the 13 ranks')
+        self.card_mapping = _build_card_mapping()
+        self.suits = list(SUITS)
+        self.counting_system = tuple(counting_system)
+        self.rng = rng if rng is not None else random  # the module shares the global RNG
+        self.rank_counts = [0] * 13  # number of cards of rank i left in the deck
+        self.shuffle()
+
+    def shuffle(self):
+        """
+        Returns every card to the deck in a new random order, and resets the running count
+        """
+        num_decks = self.get_capacity() // 52
+        self.cards = [num_decks for _ in range(52)] # [1,1,1...] where '1' in position i means card i is in the deck
+        self.undrawn = list(range(52)) * num_decks  # indices of the undrawn cards, the next one to be drawn last
+        self.rng.shuffle(self.undrawn)
+        self.rank_counts[:] = [4 * num_decks] * 13  # updated in place, so that views stay live
+        self.running_count = 0
+        if metrics.enabled:
+            metrics.increment('deck.shuffles')
+
+    def get_rank_counts(self):
+        """
+        :return: a live read-only view of the number of cards of each rank index (0-12) left in the deck
+        """
+        return CountsView(self.rank_counts)
+
+    def get_running_count(self):
+        """
+        :return: the sum of the counting system's tags of every card drawn since the deck was last shuffled
+        """
+        return self.running_count
+
+    def get_true_count(self):
+        """
+        :return: the running count per deck's worth of cards left (0 if the deck is empty)
+        """
+        decks_remaining = len(self.undrawn) / 52
+        return self.running_count / decks_remaining if decks_remaining else 0.0
+
+    def start_round(self):
+        """
+        Prepares the deck for a new round of BlackJack (a single deck is never shuffled automatically, so cards
+        drawn in earlier rounds stay out of the deck)
+        """
+        pass
+
+    def get_capacity(self):
+        """
+        :return: the number of cards in the deck when no card has been drawn
+        """
+        return 52
+
+    def get_num_remaining(self):
+        """
+        :return: the number of cards that can still be drawn before the deck has to be shuffled
+        """
+        return len(self.undrawn)
+
+    def can_draw(self, k: int):
+        """
+        :param k: a number of cards
+        :return: True if k cards can be drawn in the current round (a single deck is never reshuffled, so only
+        the cards left can be drawn), and False otherwise
         """
-        self.cards = [1 for _ in range(52)] # [1,1,1...] where '1' in position i means card i is in the deck
-        self.card_mapping = {
-            0: Card('ace', [1, 11]),
-            1: Card('two', [2]),
-            2: Card('three', [3]),
-            3: Card('four', [4]),
-            4: Card('five', [5]),
-            5: Card('six', [6]),
-            6: Card('seven', [7]),
-            7: Card('eight', [8]),
-            8: Card('nine', [9]),
-            9: Card('ten', [10]),
-            10: Card('jack', [10]),
-            11: Card('queen', [10]),
-            12: Card('king', [10])
-        }
-        self.suits = ['diamond', 'spade', 'club', 'heart']
+        return 0 <= k <= len(self.undrawn)
 
     def __isvalidcard(self, card_index: int):
         """
@@ -37,15 +145,6 @@ class Deck(object):
         """
         return card_index >= 0 and card_index < len(self.cards)
 
-    def __getcard(self, card_index: int):
-        """
-        :param card_index: a valid card index (raises ValueError if invalid)
-        :return: the Card corresponding to card_index
-        """
-        if not self.__isvalidcard(card_index):
-            raise ValueError('invalid card: {0}'.format(card_index))
-        return self.card_mapping[card_index % 13]
-
     def get_suit(self, card_index: int):
         """
         :param card_index: a valid card index (raises ValueError if invalid)
@@ -53,25 +152,62 @@ class Deck(object):
         """
         if not self.__isvalidcard(card_index):
             raise ValueError('invalid card: {0}'.format(card_index))
-        suit_index = 0
-        while card_index >= 13:
-            card_index -= 13
-            suit_index += 1
-        return self.suits[suit_index]
+        return self.suits[card_index // 13]
 
     def draw(self):
         """
         :return: a random Card drawn from the deck, which will be removed from the deck thereafter (or None if the
-        deck is empty)
+        deck is empty). The Card is interned, and shared with every other Deck.
         """
-        undrawn_cards = [i for i,v in enumerate(self.cards) if v > 0]
-        if len(undrawn_cards) <= 0:
+        card_index = self.draw_index()
+        return CARDS[card_index] if card_index is not None else None
+
+    def draw_index(self):
+        """
+        :return: the index (0-51) of a random card drawn from the deck, which will be removed from the deck
+        thereafter (or None if the deck is empty)
+        """
+        undrawn = self.undrawn
+        if len(undrawn) <= 0:
             return None
-        card_index = choice(undrawn_cards)
+        card_index = undrawn.pop()  # the order was randomized once when the deck was shuffled
         self.cards[card_index] -= 1  # remove card from the deck
-        # return a copy of this card to be used by the client with the appropriate suit
-        card = deepcopy(self.__getcard(card_index))
-        card.set_suit(self.get_suit(card_index))
-        return card
+        rank = card_index % 13
+        self.rank_counts[rank] -= 1
+        self.running_count += self.counting_system[rank]
+        if metrics.enabled:
+            metrics.increment('deck.draws')
+        return card_index
 
+    def draw_many(self, k: int):
+        """
+        :param k: the number of cards to draw (raises ValueError if negative, or if fewer than k cards are left)
+        :return: a list of the k Cards that k calls to draw would return, in the same order, removed from the deck
+        in a single pass. The Cards are interned, and shared with every other Deck.
+        """
+        return [CARDS[card_index] for card_index in self.draw_many_indices(k)]
 
+    def draw_many_indices(self, k: int):
+        """
+        :param k: the number of cards to draw (raises ValueError if negative, or if fewer than k cards are left)
+        :return: a list of the indices (0-51) of the k cards that k calls to draw_index would return, in the same
+        order, removed from the deck in a single pass
+        """
+        undrawn = self.undrawn
+        if k < 0 or k > len(undrawn):
+            raise ValueError('Cannot draw {0} cards from {1} cards'.format(k, len(undrawn)))
+        if k == 0:
+            return []
+        card_indices = undrawn[:-k - 1:-1]  # the last k undrawn cards, in the order draw would pop them
+        del undrawn[-k:]
+        cards, rank_counts, counting_system = self.cards, self.rank_counts, self.counting_system
+        running_count = self.running_count
+        for card_index in card_indices:
+            cards[card_index] -= 1
+            rank = card_index % 13
+            rank_counts[rank] -= 1
+            running_count += counting_system[rank]
+        self.running_count = running_count
+        if metrics.enabled:
+            metrics.increment('deck.draws', k)
+        return card_indices
@@ -0,0 +1,200 @@
+import mmap
+import os
+import struct
+from collections import namedtuple
+from Card import Card, InternedCard, get_card, RANKS, SUITS
+
+# game id, player index, event type, card index
+RECORD = struct.Struct('<IHBB')
+
+# Event types
+DEAL = 0
+HIT = 1
+STAY = 2
+BUST = 3
+GAME_OVER = 4  # the player of a GAME_OVER event is the winner
+
+NO_CARD = 255  # card index of events without a card
+_RANK_NAMES = [name for name, _ in RANKS]
+
+# A single fixed-width record of the log
+Event = namedtuple('Event', ['game_id', 'player', 'event', 'card'])
+
+
+def encode_card(card: Card):
+    """
+    :param card: a Card (e.g. one drawn from a Deck)
+    :return: the index of the card: 0-51 as in Deck.cards if the card has a suit, or 52 + its rank index (0-12)
+    if it is generic across all suits, as for interned cards (raises ValueError if the card is not a standard card)
+    """
+    if isinstance(card, InternedCard):
+        return card.index
+    if card.get_name() not in _RANK_NAMES:
+        raise ValueError('invalid card: {0}'.format(card.get_name()))
+    rank = _RANK_NAMES.index(card.get_name())
+    if card.get_suit() is None:
+        return 52 + rank
+    return SUITS.index(card.get_suit()) * 13 + rank
+
+
+def decode_card(card_index: int):
+    """
+    :param card_index: the index of a card (see encode_card), raises ValueError if invalid
+    :return: the Card of the index (or None for NO_CARD)
+    """
+    if card_index == NO_CARD:
+        return None
+    return get_card(card_index)
+
+
+class EventLog(object):
+    """
+    This class represents an append-only log of the events of BlackJack games (deals, hits, stays, busts and game
+    overs), stored as fixed-width records of 8 bytes: the game id, the index of the player, the type of event,
+    and the index of the card (see encode_card). Several Games can share a log, each under its own game id (see
+    start_game), in which case their records interleave.
+    """
+    def __init__(self, path: str):
+        """
+        Opens (or creates) the log at the given path for appending. Game ids continue from the highest game id
+        already in the log (found in a single pass, as the records of several games may interleave).
+
+        :param path: the file to append to
+        """
+        self.path = path
+        self.next_game_id = 0
+        if os.path.exists(path) and os.path.getsize(path) >= RECORD.size:
+            with open(path, 'rb') as f:
+                records = f.read(os.path.getsize(path) // RECORD.size * RECORD.size)
+            self.next_game_id = max(game_id for game_id, _, _, _ in RECORD.iter_unpack(records)) + 1
+        self.file = open(path, 'ab')
+
+    def start_game(self):
+        """
+        :return: a new game id
+        """
+        game_id = self.next_game_id
+        self.next_game_id += 1
+        return game_id
+
+    def append(self, game_id: int, event: int, player: int, card_index=NO_CARD):
+        """
+        Appends a record to the log
+
+        :param game_id: the id of the game (see start_game)
+        :param event: the type of event (e.g. HIT)
+        :param player: the index of the player within the game
+        :param card_index: the index of the card (see encode_card), or NO_CARD
+        """
+        self.file.write(RECORD.pack(game_id, player, event, card_index))
+
+    def flush(self):
+        """
+        Writes any buffered records to the file
+        """
+        self.file.flush()
+
+    def close(self):
+        """
+        Writes any buffered records to the file, and closes it
+        """
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class EventLogReader(object):
+    """
+    This class reads an EventLog by memory-mapping its file, so that records are only unpacked as they are read
+    """
+    def __init__(self, path: str):
+        """
+        :param path: a file written by EventLog (raises ValueError if its size is not a whole number of records)
+        """
+        size = os.path.getsize(path)
+        if size % RECORD.size != 0:
+            raise ValueError('Not an event log: {0}'.format(path))
+        self.num_records = size // RECORD.size
+        self.mapped = None
+        if size > 0:  # an empty file cannot be memory-mapped
+            with open(path, 'rb') as f:
+                self.mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def __len__(self):
+        """
+        :return: the number of records in the log
+        """
+        return self.num_records
+
+    def __getitem__(self, index: int):
+        """
+        :param index: the index of a record (raises IndexError if out of range)
+        :return: the Event of the record
+        """
+        if index < 0:
+            index += self.num_records
+        if index < 0 or index >= self.num_records:
+            raise IndexError('record index out of range')
+        return Event(*RECORD.unpack_from(self.mapped, index * RECORD.size))
+
+    def __iter__(self):
+        """
+        :return: a generator of the Event of every record, in order
+        """
+        if self.mapped is None:
+            return iter(())
+        return (Event(*record) for record in RECORD.iter_unpack(self.mapped))
+
+    def index_games(self):
+        """
+        :return: a dictionary of each game id to the indices of its records in order, built in a single pass over
+        the log. Games are ordered by their first record, and the records of games sharing the log may interleave.
+        """
+        games = {}
+        if self.mapped is not None:
+            for index, (game_id, _, _, _) in enumerate(RECORD.iter_unpack(self.mapped)):
+                games.setdefault(game_id, []).append(index)
+        return games
+
+    def iter_games(self):
+        """
+        :return: a generator of (game id, list of Events) for every game, ordered by the first record of each game
+        (see index_games), where each game's Events are only unpacked as it is requested
+        """
+        for game_id, indices in self.index_games().items():
+            yield game_id, [self[index] for index in indices]
+
+    def close(self):
+        """
+        Releases the memory map of the log
+        """
+        if self.mapped is not None:
+            self.mapped.close()
+            self.mapped = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def replay_game(events: [Event]):
+    """
+    :param events: the Events of a single game, in order
+    :return: (cards, busted, winner) where cards maps each player index to the list of Cards they were dealt or hit,
+    busted is the set of players who busted, and winner is the index of the winner (or None if the game did not end)
+    """
+    cards, busted, winner = {}, set(), None
+    for event in events:
+        if event.event in (DEAL, HIT):
+            cards.setdefault(event.player, []).append(decode_card(event.card))
+        elif event.event == BUST:
+            busted.add(event.player)
+        elif event.event == GAME_OVER:
+            winner = event.player
+    return cards, busted, winner
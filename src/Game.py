@@ -1,29 +1,84 @@
+from bisect import bisect_right, insort
+from itertools import islice
+from time import perf_counter
+from Card import Card, CARDS, to_card
 from Hand import Hand
 from Deck import Deck
-from MaxHeap import MaxHeap
+from EventLog import EventLog, encode_card, DEAL, HIT, STAY, BUST, GAME_OVER
+from IndexedMaxHeap import IndexedMaxHeap
+from Instrumentation import metrics
 
 class Game(object):
     """
     This class manages the state of a standard game of BlackJack with N human players
     """
-    def __init__(self, player_names: [str], pre_deal=False):
+    def __init__(self, player_names: [str], pre_deal=False, deck=None, event_log=None, rng=None):
         """
         Constructs a new game of BlackJack in which the first player in the
         list of players has the first turn
 
-        :param player_names: the list of players who will be playing (raises ValueError if player_names is empty
-        """
+        :param player_names: the list of (unique) players who will be playing (raises ValueError if player_names is
+        empty or duplicated, or if there are more players than half the cards in the deck)
+        :param pre_deal: if True, every player is dealt 2 cards at the start of each round
+        :param deck: the Deck (or Shoe) to draw from (a new Deck if not provided)
+        :param event_log: the EventLog every deal, hit, stay, bust and game over is appended to (nothing is logged if
+        not provided)
+        :param rng: the random.Random that shuffles the new Deck created when no deck is provided (raises ValueError
+        if a deck is also provided, as the deck already has its own RNG)
+        """
+        if deck is not None and rng is not None:
+            raise ValueError('Cannot give an RNG along with a deck')
+        deck = deck if deck is not None else Deck(rng=rng)
+        max_players = deck.get_capacity() // 2
         if len(player_names) < 1:
             raise ValueError('Cannot create a game with no players')
-        if len(player_names) > 26:
-            raise ValueError('Cannot have more than 26 players for BlackJack')
+        if len(player_names) > max_players:
+            raise ValueError('Cannot have more than {0} players for BlackJack'.format(max_players))
+        if len(set(player_names)) != len(player_names):
+            raise ValueError('Player names must be unique')
         self.hands = [Hand(name) for name in player_names]
+        self.hands_by_name = {hand.get_name(): hand for hand in self.hands}
+        self.deck = deck
+        self.pre_deal = pre_deal
+        self.event_log: EventLog = event_log
+        self.game_id = None
+        self.new_round()
+
+    def __deal(self):
+        """
+        Deals 2 cards to every player if the game is pre-dealt (or does nothing otherwise), drawing every card in a
+        single batch (raises ValueError if the deck does not have enough cards left)
+        """
+        if self.pre_deal:
+            start = perf_counter() if metrics.enabled else None
+            card_indices = self.deck.draw_many_indices(2 * len(self.hands))  # each player takes 2 cards in turn
+            for player, hand in enumerate(self.hands):
+                for card_index in card_indices[2 * player:2 * player + 2]:
+                    hand.add_card(CARDS[card_index])
+                    if self.event_log is not None:
+                        self.event_log.append(self.game_id, DEAL, player, card_index)
+            if start is not None:
+                metrics.record_time('game.deal', perf_counter() - start)
+
+    def new_round(self):
+        """
+        Starts a new round with the same players and the same deck, in which the first player has the first turn.
+        Every hand is emptied (and pre-dealt again if the game is pre-dealt), and the round gets a new game id
+        in the event log. (raises ValueError if the game is pre-dealt and the deck cannot deal every player, in
+        which case the game is left unchanged)
+        """
+        self.deck.start_round()  # before checking the deal, so that a shoe discards the previous round's cards
+        num_dealt = 2 * len(self.hands) if self.pre_deal else 0
+        if not self.deck.can_draw(num_dealt):
+            raise ValueError('Cannot deal {0} cards from {1} cards'.format(num_dealt, self.deck.get_num_remaining()))
+        if self.event_log is not None:
+            self.game_id = self.event_log.start_game()
+        for hand in self.hands:
+            hand.clear()
         self.current_player = 0
-        self.deck = Deck()
-        if pre_deal:
-            for hand in self.hands:
-                hand.add_card(self.deck.draw())
-                hand.add_card(self.deck.draw())
+        self.standings = IndexedMaxHeap()  # hands of the players who have finished their turn
+        self.finished_priorities = []  # priorities of the finished hands, in increasing order
+        self.__deal()
 
     def is_game_over(self):
         """
@@ -33,10 +88,18 @@ class Game(object):
 
     def __finishturn(self):
         """
-        Updates the rankings of who is in the lead, and moves to the next player (or does nothing if the game is already over)
+        Updates the rankings of who is in the lead, and moves to the next player (or does nothing if the game is already over).
+        Keeping finished_priorities sorted with insort costs linear time per turn (a list shift of at most one entry
+        per player, so at most 26 with a single deck), which keeps get_rank a binary search.
         """
         if not self.is_game_over():
+            current_hand = self.hands[self.current_player]
+            self.standings.insert(current_hand)
+            insort(self.finished_priorities, current_hand.get_priority())
             self.current_player += 1
+            if self.event_log is not None and self.is_game_over():
+                winner = self.hands.index(self.standings.findMax())
+                self.event_log.append(self.game_id, GAME_OVER, winner)
 
     def get_current_hand(self):
         """
@@ -51,21 +114,36 @@ class Game(object):
 
     def hit(self, card=None):
         """
-        :param: card to use as next draw (will be drawn from the deck if not provided)
+        :param: card to use as next draw, as a Card or the index of an interned card (will be drawn from the deck
+        if not provided, raises ValueError if the index is invalid and TypeError if card is neither a Card nor an
+        integer, see to_card)
         :return: False if the hit resulted in a bust, and True otherwise. (raises ValueError if the game is already over
         or the deck is out of cards)
         """
         if self.is_game_over():
             raise ValueError('Cannot hit when game is over!')
-        card = card if card else self.deck.draw()
-        if not card:
-            raise ValueError('Ran out of cards')
+        start = perf_counter() if metrics.enabled else None
+        if card is None:
+            card = self.deck.draw()
+            if card is None:
+                raise ValueError('Ran out of cards')
+        elif not isinstance(card, Card):
+            card = to_card(card)
+        if self.event_log is not None:
+            self.event_log.append(self.game_id, HIT, self.current_player, encode_card(card))
         current_hand = self.hands[self.current_player]
         current_hand.add_card(card)
-        if current_hand.is_bust():
+        is_bust = current_hand.is_bust()
+        if is_bust and self.event_log is not None:
+            self.event_log.append(self.game_id, BUST, self.current_player)
+        if is_bust:
             self.__finishturn()
-            return False
-        return True
+        if start is not None:
+            metrics.increment('game.hits')
+            if is_bust:
+                metrics.increment('game.busts')
+            metrics.record_time('game.hit', perf_counter() - start)
+        return not is_bust
 
     def stay(self):
         """
@@ -73,24 +151,69 @@ class Game(object):
         """
         if self.is_game_over():
             raise ValueError('Cannot stay when game is over!')
+        start = perf_counter() if metrics.enabled else None
+        if self.event_log is not None:
+            self.event_log.append(self.game_id, STAY, self.current_player)
         self.__finishturn()
+        if start is not None:
+            metrics.increment('game.stays')
+            metrics.record_time('game.stay', perf_counter() - start)
 
-    def get_rankings(self):
+    def get_leader(self):
+        """
+        :return: the name of the highest ranked player among those who have finished their turn (raises ValueError
+        if no player has finished their turn yet)
         """
-        :return: the names of the players in the order of ranking (i.e. 1st place, 2nd place, etc.) (raises ValueError
-        if the game is not over yet)
+        if self.standings.isEmpty():
+            raise ValueError('No player has finished their turn yet')
+        return self.standings.findMax().get_name()
+
+    def get_rank(self, name: str):
+        """
+        :param name: the name of a player in the game (raises ValueError if there is no such player)
+        :return: the place (1st place being 1) the player's current hand would take among the players who have
+        finished their turn, in logarithmic time (the list it searches is kept sorted in linear time per turn, see
+        __finishturn). Players with the same score share the same place.
+        """
+        if name not in self.hands_by_name:
+            raise ValueError('No player named {0}'.format(name))
+        priority = self.hands_by_name[name].get_priority()
+        num_ahead = len(self.finished_priorities) - bisect_right(self.finished_priorities, priority)
+        return num_ahead + 1
+
+    def iter_rankings(self):
+        """
+        :return: a generator of the names of the players in the order of ranking (i.e. 1st place, 2nd place, etc.),
+        where each name costs logarithmic time and players with the same score are ordered by seat (raises
+        ValueError if the game is not over yet)
         """
         if not self.is_game_over():
             raise ValueError('Game is still in progress!')
-        h = MaxHeap(len(self.hands), self.hands)
-        ordered_hands = [h.removeMax() for _ in range(len(self.hands))]
-        return [hand.get_name() for hand in ordered_hands]
+        return (hand.get_name() for hand in self.standings.ranked())
 
-    def get_winner(self):
+    def get_rankings(self):
         """
-        :return: the name of the first place winner of the game (raises ValueError if the game is not over yet)
+        :return: the names of the players in the order of ranking (i.e. 1st place, 2nd place, etc.), where players with
+        the same score are ordered by seat (raises ValueError if the game is not over yet)
         """
-        return self.get_rankings()[0]
-
+        start = perf_counter() if metrics.enabled else None
+        rankings = list(self.iter_rankings())
+        if start is not None:
+            metrics.record_time('game.rankings', perf_counter() - start)
+        return rankings
 
+    def top_k(self, k: int):
+        """
+        :param k: the number of places to return
+        :return: the names of the (at most) k highest ranked players in order of ranking (raises ValueError if the
+        game is not over yet)
+        """
+        return list(islice(self.iter_rankings(), k))
 
+    def get_winner(self):
+        """
+        :return: the name of the first place winner of the game (raises ValueError if the game is not over yet)
+        """
+        if not self.is_game_over():
+            raise ValueError('Game is still in progress!')
+        return self.get_leader()
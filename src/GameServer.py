@@ -0,0 +1,360 @@
+import asyncio
+from math import ceil
+from time import perf_counter
+from Game import Game
+from SeedSequence import SeedSequence
+
+
+class Table(object):
+    """
+    This class represents a table hosted by a GameServer. Players join the table while it is open, and the
+    game (pre-dealt) starts on the first play command issued at the table, after which no one else can join.
+    Players who leave once the game has started keep their seat, and stay on each of their turns.
+    """
+    MAX_PLAYERS = 26  # a single deck deals 2 cards to at most 26 players
+
+    def __init__(self, name: str, rng=None):
+        """
+        Constructs an open table with no players
+
+        :param name: the name of the table
+        :param rng: the random.Random that shuffles the table's deck (the global RNG of the random module if
+        not provided)
+        """
+        self.name = name
+        self.rng = rng
+        self.player_names = []
+        self.departed = set()  # players who left after the game started
+        self.game = None  # created once the first play command is issued
+
+    def join(self, player: str):
+        """
+        Seats the given player at the table
+
+        :param player: the name of the player (raises ValueError if taken, if the table is full, or if the game has
+        already started)
+        """
+        if self.game is not None:
+            raise ValueError('The game at table {0} has already started'.format(self.name))
+        if player in self.player_names:
+            raise ValueError('{0} is already at table {1}'.format(player, self.name))
+        if len(self.player_names) >= Table.MAX_PLAYERS:
+            raise ValueError('Table {0} is full'.format(self.name))
+        self.player_names.append(player)
+
+    def leave(self, player: str):
+        """
+        Removes the given player from the table: their seat is freed if the game has not started yet, and
+        otherwise they stay on every turn of theirs from now on, so that the game never waits on them
+
+        :param player: the name of a player at the table (raises ValueError if there is no such player)
+        """
+        if player not in self.player_names:
+            raise ValueError('{0} is not at table {1}'.format(player, self.name))
+        if self.game is None:
+            self.player_names.remove(player)
+        else:
+            self.departed.add(player)
+            self.stand_departed()
+
+    def is_deserted(self):
+        """
+        :return: True if every player who joined the table has left it (or no one has joined it), and False
+        otherwise
+        """
+        return len(self.departed) == len(self.player_names)
+
+    def stand_departed(self):
+        """
+        Stays on behalf of the players who have left for as long as it is one of their turns
+        """
+        game = self.game
+        while game is not None and not game.is_game_over() and game.get_current_player_name() in self.departed:
+            game.stay()
+
+    def get_game(self):
+        """
+        :return: the game being played at the table, starting it if it has not been started yet
+        """
+        if self.game is None:
+            self.game = Game(self.player_names, True, rng=self.rng)
+        return self.game
+
+
+class Session(object):
+    """
+    This class represents the state of one client connection: the table it joined and the player it plays as
+    """
+    def __init__(self):
+        """
+        Constructs a session that has not joined a table
+        """
+        self.table = None
+        self.player = None
+
+
+class GameServer(object):
+    """
+    This class hosts any number of concurrent BlackJack tables over a line-based TCP protocol. Each client
+    connection plays as one player, and sends one command per line:
+
+        JOIN <table> <player>   seats the client at the table (which is created if it does not exist)
+        CHECK                   shows the client's hand
+        HIT                     draws a card for the client (only on the client's turn)
+        STAY                    ends the client's turn
+        RANKINGS                lists the players at the table from first to last place (once the game is over)
+
+    Every command is answered with a single line: "OK <result>" or "ERR <message>" (including lines that are not
+    UTF-8 text). A client that disconnects leaves its table (see Table.leave), and a table is closed once
+    everyone at it has left, freeing its name for a new table. The status of a hand is given as
+    "best=<score>;bust=<yes|no>;turn=<player whose turn it is, or over>;cards=<card>,<card>,...".
+    Commands run to completion without yielding to other clients, so tables never see each other's
+    partial state, while a slow client only ever waits on its own connection.
+    """
+    def __init__(self, host='127.0.0.1', port=0, seed=None):
+        """
+        Constructs a GameServer (which does not listen until started)
+
+        :param host: the address to listen on
+        :param port: the port to listen on (0 picks a free port)
+        :param seed: the seed from which each table's own RNG is derived by table name (and by how many tables of
+        that name were opened before), making every table reproducible (tables share the global RNG of the random module if not provided)
+        """
+        self.host = host
+        self.port = port
+        self.seeds = SeedSequence(seed) if seed is not None else None
+        self.tables = {}  # table name --> Table
+        self.num_opened = {}  # table name --> number of tables of that name opened so far
+        self.server = None
+        self.connections = {}  # handler task --> writer of every open client connection
+
+    async def start(self):
+        """
+        Starts listening for clients, setting port to the port actually listened on
+        """
+        self.server = await asyncio.start_server(self.__handle, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def close(self):
+        """
+        Stops listening for clients, then closes every open client connection and waits for its handler to finish
+        """
+        self.server.close()
+        await self.server.wait_closed()
+        handlers = list(self.connections)
+        for writer in self.connections.values():
+            writer.close()
+        await asyncio.gather(*handlers)
+
+    async def __handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """
+        Answers the commands of one client connection until it disconnects
+
+        :param reader: the stream of commands from the client
+        :param writer: the stream of responses to the client
+        """
+        session = Session()
+        self.connections[asyncio.current_task()] = writer
+        try:
+            line = await reader.readline()
+            while line:
+                try:
+                    response = self.respond(session, line.decode().strip())
+                except UnicodeDecodeError:
+                    response = 'ERR Commands must be UTF-8 text'
+                writer.write((response + '\n').encode())
+                await writer.drain()
+                line = await reader.readline()
+        except ConnectionError:
+            pass
+        finally:
+            self.leave(session)
+            writer.close()
+            del self.connections[asyncio.current_task()]
+
+    def leave(self, session: Session):
+        """
+        Removes the client's player from its table (see Table.leave), once the client has disconnected. A table
+        that everyone has left is closed, so that its name can be used for a new table.
+
+        :param session: the state of the client connection (which is left without a table)
+        """
+        table = session.table
+        if table is not None:
+            table.leave(session.player)
+            session.table, session.player = None, None
+            if table.is_deserted() and self.tables.get(table.name) is table:
+                del self.tables[table.name]
+
+    def __make_table_rng(self, name: str):
+        """
+        :param name: the name of a table being opened
+        :return: the RNG of the table (or None if the server has no seed), which differs each time a table of the
+        same name is opened again after being closed
+        """
+        num_opened = self.num_opened.get(name, 0)
+        self.num_opened[name] = num_opened + 1
+        if self.seeds is None:
+            return None
+        keys = ('table', name) if num_opened == 0 else ('table', name, num_opened)
+        return self.seeds.spawn(*keys).make_rng()
+
+    def respond(self, session: Session, line: str):
+        """
+        :param session: the state of the client connection that sent the command
+        :param line: a command (see GameServer)
+        :return: the response to the command
+        """
+        try:
+            return 'OK {0}'.format(self.execute(session, line))
+        except ValueError as e:
+            return 'ERR {0}'.format(e)
+
+    def execute(self, session: Session, line: str):
+        """
+        :param session: the state of the client connection that sent the command
+        :param line: a command (see GameServer)
+        :return: the result of the command (raises ValueError if the command is invalid or not allowed)
+        """
+        parts = line.split(' ')
+        command = parts[0].upper()
+        if command == 'JOIN':
+            player = ' '.join(parts[2:])
+            if len(parts) < 3 or not parts[1] or not player.strip():
+                raise ValueError('Usage: JOIN <table> <player>')
+            if session.table is not None:
+                raise ValueError('Already joined table {0}'.format(session.table.name))
+            table = self.tables.get(parts[1])
+            if table is None:
+                table = self.tables[parts[1]] = Table(parts[1], self.__make_table_rng(parts[1]))
+            table.join(player)
+            session.table, session.player = table, player
+            return 'joined {0} as {1}'.format(table.name, player)
+        if command not in ('CHECK', 'HIT', 'STAY', 'RANKINGS'):
+            raise ValueError('Unknown command: {0}'.format(parts[0]))
+        if session.table is None:
+            raise ValueError('Join a table first')
+        game = session.table.get_game()
+        if command == 'RANKINGS':
+            return ','.join(game.get_rankings())
+        if command != 'CHECK':
+            if game.get_current_player_name() != session.player:
+                raise ValueError('It is not your turn')
+            if command == 'HIT':
+                game.hit()
+            else:
+                game.stay()
+            session.table.stand_departed()
+        hand = game.hands_by_name[session.player]
+        turn = 'over' if game.is_game_over() else game.get_current_player_name()
+        return 'best={0};bust={1};turn={2};cards={3}'.format(hand.get_best_score(), 'yes' if hand.is_bust() else 'no',
+                                                             turn, ','.join(map(str, hand.get_cards())))
+
+
+def parse_status(result: str):
+    """
+    :param result: the result of a CHECK, HIT or STAY command
+    :return: a dictionary of the fields of the hand status (see GameServer)
+    """
+    return dict(field.split('=', 1) for field in result.split(';'))
+
+
+def percentile(sorted_values: [float], fraction: float):
+    """
+    :param sorted_values: values in increasing order (raises ValueError if empty)
+    :param fraction: the fraction of values at or below the percentile (e.g. 0.99)
+    :return: the nearest-rank percentile of the values
+    """
+    if len(sorted_values) < 1:
+        raise ValueError('Cannot take the percentile of no values')
+    rank = min(max(1, ceil(fraction * len(sorted_values))), len(sorted_values))
+    return sorted_values[rank - 1]
+
+
+class LoadGenerator(object):
+    """
+    This class plays many tables at once against a GameServer, each player hitting below a threshold, and
+    records the latency of every command it sends
+    """
+    def __init__(self, host: str, port: int, num_tables=100, players_per_table=1, threshold=17):
+        """
+        Constructs a LoadGenerator
+
+        :param host: the address of the GameServer
+        :param port: the port of the GameServer
+        :param num_tables: the number of tables played concurrently
+        :param players_per_table: the number of players (one connection each) at every table
+        :param threshold: the best score at (or above) which every player stays
+        """
+        self.host = host
+        self.port = port
+        self.num_tables = num_tables
+        self.players_per_table = players_per_table
+        self.threshold = threshold
+        self.latencies = []  # seconds per command
+
+    async def __send(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, line: str):
+        """
+        :param reader: the stream of responses from the GameServer
+        :param writer: the stream of commands to the GameServer
+        :param line: the command to send
+        :return: the result of the command (raises ValueError if the GameServer answered with an error)
+        """
+        start = perf_counter()
+        writer.write((line + '\n').encode())
+        await writer.drain()
+        response = (await reader.readline()).decode().strip()
+        self.latencies.append(perf_counter() - start)
+        status, _, result = response.partition(' ')
+        if status != 'OK':
+            raise ValueError(result)
+        return result
+
+    async def __play(self, table: str, player: str, joined: asyncio.Event, num_joined: [int]):
+        """
+        Plays one player at a table until the game is over
+
+        :param table: the name of the table
+        :param player: the name of the player
+        :param joined: set once every player at every table has joined
+        :param num_joined: single-element list counting the players who have joined
+        """
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        try:
+            await self.__send(reader, writer, 'JOIN {0} {1}'.format(table, player))
+            num_joined[0] += 1
+            if num_joined[0] == self.num_tables * self.players_per_table:
+                joined.set()
+            await joined.wait()
+            status = parse_status(await self.__send(reader, writer, 'CHECK'))
+            while status['turn'] != 'over':
+                if status['turn'] != player:
+                    await asyncio.sleep(0.001)  # wait for the players ahead to finish
+                    status = parse_status(await self.__send(reader, writer, 'CHECK'))
+                elif int(status['best']) < self.threshold:
+                    status = parse_status(await self.__send(reader, writer, 'HIT'))
+                else:
+                    status = parse_status(await self.__send(reader, writer, 'STAY'))
+            await self.__send(reader, writer, 'RANKINGS')
+        finally:
+            writer.close()
+
+    async def run(self):
+        """
+        :return: a dictionary of the number of commands sent, the elapsed seconds, and the p50/p99 command
+        latency in milliseconds
+        """
+        self.latencies = []
+        joined, num_joined = asyncio.Event(), [0]
+        start = perf_counter()
+        await asyncio.gather(*[self.__play('table{0}'.format(t), 'player{0}'.format(p), joined, num_joined)
+                               for t in range(self.num_tables) for p in range(self.players_per_table)])
+        elapsed = perf_counter() - start
+        latencies = sorted(self.latencies)
+        return {
+            'tables': self.num_tables,
+            'commands': len(latencies),
+            'elapsed': elapsed,
+            'p50_ms': percentile(latencies, 0.5) * 1000,
+            'p99_ms': percentile(latencies, 0.99) * 1000
+        }
@@ -1,6 +1,49 @@
-from collections import deque
+from collections import deque, namedtuple
 from BinaryTree import BinaryTree, BinaryTreeNode
-from Card import Card
+from Card import Card, InternedCard, to_card
+from Deck import Deck, get_card_kinds
+from Instrumentation import metrics
+
+
+# The score of a hand, derived from its hard total (every ace worth 1) and its number of soft aces
+ScoreEntry = namedtuple('ScoreEntry', ['best_score', 'is_bust', 'is_soft', 'priority'])
+
+
+def _score_entry(hard_total: int, soft_aces: int):
+    """
+    :param hard_total: the score of a hand when every ace is worth 1
+    :param soft_aces: the number of aces in the hand
+    :return: the ScoreEntry of the hand, where the hand is soft if one of its aces can be worth 11 without busting
+    """
+    is_bust = hard_total > 21
+    is_soft = not is_bust and soft_aces > 0 and hard_total + 10 <= 21
+    best_score = hard_total + 10 if is_soft else hard_total
+    return ScoreEntry(best_score, is_bust, is_soft, -best_score if is_bust else best_score)
+
+
+MAX_TABLE_TOTAL = 31  # the highest hard total reachable by hitting a non-bust hand (21 + a ten)
+# SCORE_TABLE[hard_total][has_aces] is the ScoreEntry of every hard total up to MAX_TABLE_TOTAL. At most one
+# ace can ever be worth 11, so only whether the hand has any aces matters.
+SCORE_TABLE = tuple((_score_entry(hard_total, 0), _score_entry(hard_total, 1))
+                    for hard_total in range(MAX_TABLE_TOTAL + 1))
+
+
+def lookup_score(hard_total: int, soft_aces: int):
+    """
+    :param hard_total: the score of a hand when every ace is worth 1
+    :param soft_aces: the number of aces in the hand
+    :return: the ScoreEntry of the hand (looked up in SCORE_TABLE, or computed if the hard total is beyond it)
+    """
+    if hard_total <= MAX_TABLE_TOTAL:
+        return SCORE_TABLE[hard_total][soft_aces > 0]
+    return _score_entry(hard_total, soft_aces)
+
+
+# The chance of busting with one more card, and the chance of each best score the hand could end up with
+HitOutcome = namedtuple('HitOutcome', ['bust_probability', 'score_distribution'])
+
+_KINDS, _KIND_OF_RANK = get_card_kinds()
+RANK_KINDS = tuple(_KINDS[kind] for kind in _KIND_OF_RANK)  # (hard value, is ace) of each rank index (0-12)
 
 
 class Hand(object):
@@ -15,10 +58,48 @@ class Hand(object):
         Constructs a 0 card hand
         """
         self.name = name
-        self.hands: BinaryTree = BinaryTree(BinaryTreeNode(0))  # The root of the BinaryTree represents an "empty" hand
+        self.clear()
+
+    def clear(self):
+        """
+        Removes every card from the hand, so it can be played again in a new round
+        """
         self.cards: [Card] = deque()  # each individual card in the hand
-        self.possible_scores = deque()  # can be multiple different scores due to aces double value possibilities
-        self.has_non_bust = True  # if at least possible scoring is <= 21
+        self.hard_total = 0  # the score of the hand when every ace is worth 1
+        self.soft_aces = 0  # the number of aces in the hand, each of which can be worth 10 more as an 11
+        self.score: ScoreEntry = SCORE_TABLE[0][0]  # the score of the current hard total and soft aces
+        self.__tree = None  # BinaryTree of possible scores, only built when requested (see hands)
+
+    @property
+    def hands(self):
+        """
+        :return: a BinaryTree representing the possible scores of the hand, where the root is an "empty" hand, each
+        level is a card in the hand, and each node is a possible score. The tree is built on first request (which
+        costs a node per possible score, doubling with each ace) and is kept up to date as cards are added.
+        """
+        if self.__tree is None:
+            self.__tree = BinaryTree(BinaryTreeNode(0))
+            for card in self.cards:
+                self.__extendtree(card)
+        return self.__tree
+
+    def __extendtree(self, card: Card):
+        """
+        Adds a level for the given card to the BinaryTree of possible scores
+
+        :param card: a Card from a standard deck (e.g. ace)
+        """
+        values = card.get_values()
+
+        def make_children(leaf: BinaryTreeNode):
+            """
+            :return: a branch for each possible value of the card, added to the score of the leaf
+            """
+            left = BinaryTreeNode(leaf.val + values[0])
+            right = BinaryTreeNode(leaf.val + values[1]) if len(values) > 1 else None
+            return left, right
+
+        self.__tree.expand_leaves(make_children)  # the most recent scores at play
 
     def get_name(self):
         """
@@ -31,23 +112,26 @@ class Hand(object):
         Adds the given card to the current hand and recalculates the possible scores
         given this new addition.
 
-        :param card: a Card from a standard deck (e.g. ace)
-        """
+        :param card: a Card from a standard deck (e.g. ace), whose values are either a single value, or a low and
+        a high value 10 apart (as with aces), or the index of an interned card (raises ValueError if the values are
+        neither or the index is invalid, and TypeError if card is neither a Card nor an integer, see to_card)
+        """
+        if type(card) is not InternedCard:  # interned cards are standard, so only other cards need checking
+            card = to_card(card)
+            values = card.values
+            if len(values) != 1 and (len(values) != 2 or values[1] != values[0] + 10):
+                raise ValueError('Expected a single value or a low and a high value 10 apart, not {0}'.format(
+                    list(values)))
+        values = card.values
         self.cards.append(card)  # maintain the card for future reference
-        self.possible_scores.clear()  # clear past scores
-        leaves = self.hands.get_leaves() # get the most recent scores at play
-        has_non_bust = False
-        for leaf in leaves:
-            for i, val in enumerate(card.get_values()):  # go through each possible value of this card
-                possible_score = leaf.val + val
-                # each branch of the BinaryTree is a possible value of the current hand
-                if i == 0:
-                    leaf.left = BinaryTreeNode(possible_score)
-                else:
-                    leaf.right = BinaryTreeNode(possible_score)
-                has_non_bust = has_non_bust or possible_score <= 21  # bust is greater than 21
-                self.possible_scores.append(possible_score)
-            self.has_non_bust = has_non_bust
+        self.hard_total += values[0]
+        if len(values) > 1:
+            self.soft_aces += 1
+        self.score = lookup_score(self.hard_total, self.soft_aces)
+        if metrics.enabled:
+            metrics.increment('hand.cards')
+        if self.__tree is not None:
+            self.__extendtree(card)
 
     def get_most_recent_card(self):
         """
@@ -66,24 +150,28 @@ class Hand(object):
 
     def get_possible_scores(self):
         """
-        :return: the possible scores (as defined by standard Black Jack) for the
-        current hand (0 if the hand is empty)
+        :return: the distinct possible scores (as defined by standard Black Jack) for the
+        current hand, in increasing order (0 if the hand is empty)
         """
-        if len(self.possible_scores) < 1:
-            return deque([0])
-        return self.possible_scores
+        return deque(self.hard_total + 10 * i for i in range(self.soft_aces + 1))
 
     def has_blackjack(self):
         """
         :return: True if one of the possible hands is "21", and False otherwise
         """
-        return 21 in self.get_possible_scores()
+        return self.score.best_score == 21
 
     def is_bust(self):
         """
         :return: True if the only hands possible are > 21, and False otherwise
         """
-        return not self.has_non_bust
+        return self.score.is_bust
+
+    def is_soft(self):
+        """
+        :return: True if the best score counts an ace as 11, and False otherwise
+        """
+        return self.score.is_soft
 
     def get_best_score(self):
         """
@@ -93,11 +181,29 @@ class Hand(object):
         If bust, returns the lowest possible busted score. If non-bust, returns the
         highest possible non-bust.
         """
-        scores = self.get_possible_scores()
-        if self.is_bust():
-            return min(scores)
-        non_bust_scores = filter(lambda x: x <= 21, scores)
-        return max(non_bust_scores)
+        return self.score.best_score
+
+    def get_hit_outcome(self, deck: Deck):
+        """
+        :param deck: the Deck (or Shoe) the next card would be drawn from (raises ValueError if it is empty)
+        :return: the HitOutcome of drawing one more card, computed from the number of cards of each rank left in
+        the deck
+        """
+        rank_counts = deck.get_rank_counts()
+        total = sum(rank_counts)
+        if total <= 0:
+            raise ValueError('Cannot hit from an empty deck')
+        bust_count = 0
+        score_counts = {}
+        for rank, count in enumerate(rank_counts):
+            if count == 0:
+                continue
+            value, is_ace = RANK_KINDS[rank]
+            score = lookup_score(self.hard_total + value, self.soft_aces + is_ace)
+            score_counts[score.best_score] = score_counts.get(score.best_score, 0) + count
+            if score.is_bust:
+                bust_count += count
+        return HitOutcome(bust_count / total, {score: count / total for score, count in score_counts.items()})
 
     def get_priority(self):
         """
@@ -105,5 +211,4 @@ class Hand(object):
         If non-bust, returns the absolute value of the hand, where higher is greater priority
         If bust, returns the negative value of the hand, where higher magnitude negative is lower priority
         """
-        best_score = self.get_best_score()
-        return -best_score if self.is_bust() else best_score
+        return self.score.priority
@@ -0,0 +1,204 @@
+from array import array
+from Instrumentation import metrics
+
+
+class IndexedMaxHeap(object):
+    """
+    This class represents a binary MaxHeap (see MaxHeap) in which every item is given a handle when it is
+    inserted. The MaxHeap keeps track of where each handle is within heap_arr, so that an item whose priority
+    changed can be moved, and any item can be removed, in logarithmic time without rebuilding the MaxHeap.
+    Items of equal priority are ordered by when they were inserted (the earliest first).
+    """
+
+    def __init__(self):
+        """
+        Constructs an empty IndexedMaxHeap
+        """
+        self.size = 0
+        self.heap_arr = []  # handles in heap order
+        self.priority_arr = array('d')  # priority of the handle at the same index of heap_arr
+        self.items = {}  # handle --> item
+        self.positions = {}  # handle --> index within heap_arr
+        self.next_handle = 0
+
+    def __gt__(self, a: int, b: int):
+        """
+        :param a: index within heap_arr
+        :param b: index within heap_arr
+        :return: True if the item at index a has a higher priority than the item at index b (or the same priority,
+        and was inserted earlier), and False otherwise
+        """
+        if metrics.enabled:
+            metrics.increment('maxheap.comparisons')
+        priority_a, priority_b = self.priority_arr[a], self.priority_arr[b]
+        return priority_a > priority_b or (priority_a == priority_b and self.heap_arr[a] < self.heap_arr[b])
+
+    def __swap(self, a: int, b: int):
+        """
+        Switches the element in index a with the element in index b, updating their positions
+
+        :param a: index within heap_arr
+        :param b: index within heap_arr
+        """
+        heap_arr, priority_arr = self.heap_arr, self.priority_arr
+        heap_arr[a], heap_arr[b] = heap_arr[b], heap_arr[a]
+        priority_arr[a], priority_arr[b] = priority_arr[b], priority_arr[a]
+        self.positions[heap_arr[a]] = a
+        self.positions[heap_arr[b]] = b
+
+    def __percolateUp(self, out_of_order: int):
+        """
+        Swaps elements from out_of_order up the hierarchy until the MaxHeap property is restored.
+
+        :param out_of_order: the index that violates the MaxHeap properties
+        :return: the index where the element came to rest
+        """
+        while out_of_order > 0:
+            parent = (out_of_order - 1) // 2
+            if not self.__gt__(out_of_order, parent):
+                break
+            self.__swap(out_of_order, parent)
+            out_of_order = parent
+        return out_of_order
+
+    def __percolateDown(self, out_of_order: int):
+        """
+        Swaps elements from out_of_order down the hierarchy until the MaxHeap property is restored.
+
+        :param out_of_order: the index that violates the MaxHeap properties
+        """
+        while True:
+            to_swap = 2 * out_of_order + 1  # left child
+            if to_swap >= self.size:
+                return
+            if to_swap + 1 < self.size and self.__gt__(to_swap + 1, to_swap):
+                to_swap += 1  # right child is bigger
+            if not self.__gt__(to_swap, out_of_order):
+                return
+            self.__swap(to_swap, out_of_order)
+            out_of_order = to_swap
+
+    def __ensurehandle(self, handle: int):
+        """
+        :param handle: a handle returned by insert (raises ValueError if it is not in the MaxHeap)
+        :return: the index within heap_arr of handle
+        """
+        if handle not in self.positions:
+            raise ValueError('Handle is not in the MaxHeap: {0}'.format(handle))
+        return self.positions[handle]
+
+    def insert(self, item: object):
+        """
+        Inserts a value into the MaxHeap, re-arranging the structure
+        to maintain the MaxHeap properties
+
+        :param item: item to be inserted (must have a get_priority method)
+        :return: the handle of the item, used to update or remove it later
+        """
+        handle = self.next_handle
+        self.next_handle += 1
+        self.items[handle] = item
+        self.positions[handle] = self.size
+        self.heap_arr.append(handle)
+        self.priority_arr.append(item.get_priority())
+        self.size += 1
+        self.__percolateUp(self.size - 1)
+        return handle
+
+    def contains(self, handle: int):
+        """
+        :param handle: a handle returned by insert
+        :return: True if the item of handle is still in the MaxHeap, and False otherwise
+        """
+        return handle in self.positions
+
+    def get(self, handle: int):
+        """
+        :param handle: a handle returned by insert (raises ValueError if it is not in the MaxHeap)
+        :return: the item of handle
+        """
+        self.__ensurehandle(handle)
+        return self.items[handle]
+
+    def update(self, handle: int):
+        """
+        Recomputes the priority of the item of handle after it has changed, re-arranging the structure
+        to maintain the MaxHeap properties
+
+        :param handle: a handle returned by insert (raises ValueError if it is not in the MaxHeap)
+        """
+        index = self.__ensurehandle(handle)
+        self.priority_arr[index] = self.items[handle].get_priority()
+        if self.__percolateUp(index) == index:
+            self.__percolateDown(index)
+
+    def remove(self, handle: int):
+        """
+        :param handle: a handle returned by insert (raises ValueError if it is not in the MaxHeap)
+        :return: the item of handle, which is removed from the MaxHeap
+        """
+        index = self.__ensurehandle(handle)
+        last = self.size - 1
+        if index != last:
+            self.__swap(index, last)
+        self.heap_arr.pop()
+        self.priority_arr.pop()
+        self.size -= 1
+        del self.positions[handle]
+        item = self.items.pop(handle)
+        if index != last:  # the element moved into index may violate the MaxHeap properties either way
+            if self.__percolateUp(index) == index:
+                self.__percolateDown(index)
+        return item
+
+    def findMaxHandle(self):
+        """
+        :return: the handle of the highest priority item (raises a ValueError if the MaxHeap is empty)
+        """
+        if self.isEmpty():
+            raise ValueError('Cannot perform operation on empty MaxHeap')
+        return self.heap_arr[0]
+
+    def findMax(self):
+        """
+        :return: the maximum item from the MaxHeap, defined as the highest
+        priority item. (raises a ValueError if the MaxHeap is empty).
+        """
+        return self.items[self.findMaxHandle()]
+
+    def removeMax(self):
+        """
+        :return: the maximum item from the MaxHeap, defined as the highest
+        priority item. (raises a ValueError if the MaxHeap is empty). The item
+        is removed from the MaxHeap, and causes it to re-arrange the structure to maintain
+        the MaxHeap properties.
+        """
+        return self.remove(self.findMaxHandle())
+
+    def isEmpty(self):
+        """
+        :return: True if there are no items left in the MaxHeap, and False otherwise.
+        """
+        return self.size == 0
+
+    def copy(self):
+        """
+        :return: a new IndexedMaxHeap holding the same items under the same handles, which can be changed without
+        affecting this MaxHeap
+        """
+        clone = IndexedMaxHeap()
+        clone.size = self.size
+        clone.heap_arr = list(self.heap_arr)
+        clone.priority_arr = array('d', self.priority_arr)
+        clone.items = dict(self.items)
+        clone.positions = dict(self.positions)
+        clone.next_handle = self.next_handle
+        return clone
+
+    def ranked(self):
+        """
+        :return: a generator of the items in order of priority (highest first, ties in order of insertion),
+        removing one maximum at a time from a copy of the MaxHeap, so this MaxHeap is left unchanged
+        """
+        snapshot = self.copy()
+        return (snapshot.removeMax() for _ in range(snapshot.size))
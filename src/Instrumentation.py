@@ -0,0 +1,115 @@
+import json
+
+
+class TimingHistogram(object):
+    """
+    This class represents the distribution of the durations of a step, bucketed by powers of 2 microseconds
+    (bucket i holds durations of less than 2^i microseconds that are not in an earlier bucket)
+    """
+    def __init__(self):
+        """
+        Constructs an empty TimingHistogram
+        """
+        self.count = 0
+        self.total = 0.0
+        self.min = float('inf')
+        self.max = 0.0
+        self.buckets = []
+
+    def record(self, seconds: float):
+        """
+        Adds a duration to the histogram
+
+        :param seconds: the duration of one step
+        """
+        self.count += 1
+        self.total += seconds
+        self.min = min(self.min, seconds)
+        self.max = max(self.max, seconds)
+        bucket = int(seconds * 1e6).bit_length()
+        if bucket >= len(self.buckets):
+            self.buckets.extend([0] * (bucket + 1 - len(self.buckets)))
+        self.buckets[bucket] += 1
+
+    def snapshot(self):
+        """
+        :return: a dictionary of the count, total, min, max and mean seconds, along with the number of durations
+        below each power of 2 microseconds (keyed by e.g. '<4us')
+        """
+        return {
+            'count': self.count,
+            'total': self.total,
+            'min': self.min if self.count else 0.0,
+            'max': self.max,
+            'mean': self.total / self.count if self.count else 0.0,
+            'buckets': {'<{0}us'.format(1 << i): n for i, n in enumerate(self.buckets) if n}
+        }
+
+
+class Metrics(object):
+    """
+    This class collects counters and timing histograms of the hot paths of Deck, Hand, BinaryTree, MaxHeap and
+    Game. Collection is disabled by default: every instrumented call site first checks enabled, so that a
+    disabled Metrics costs a single attribute lookup.
+    """
+    def __init__(self):
+        """
+        Constructs an empty, disabled Metrics
+        """
+        self.enabled = False
+        self.counters = {}  # name --> count
+        self.timings = {}  # name --> TimingHistogram
+
+    def enable(self):
+        """
+        Starts collecting counters and timings
+        """
+        self.enabled = True
+
+    def disable(self):
+        """
+        Stops collecting counters and timings (those already collected are kept)
+        """
+        self.enabled = False
+
+    def reset(self):
+        """
+        Clears every counter and timing
+        """
+        self.counters = {}
+        self.timings = {}
+
+    def increment(self, name: str, amount=1):
+        """
+        :param name: the name of the counter (e.g. 'deck.draws')
+        :param amount: the amount to add to the counter
+        """
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def record_time(self, name: str, seconds: float):
+        """
+        :param name: the name of the step (e.g. 'game.hit')
+        :param seconds: the duration of one step
+        """
+        histogram = self.timings.get(name)
+        if histogram is None:
+            histogram = self.timings[name] = TimingHistogram()
+        histogram.record(seconds)
+
+    def snapshot(self):
+        """
+        :return: a dictionary of every counter and the snapshot of every timing histogram
+        """
+        return {
+            'counters': dict(self.counters),
+            'timings': {name: histogram.snapshot() for name, histogram in self.timings.items()}
+        }
+
+    def to_json(self):
+        """
+        :return: the snapshot as a JSON string
+        """
+        return json.dumps(self.snapshot(), sort_keys=True)
+
+
+metrics = Metrics()  # shared by every instrumented class
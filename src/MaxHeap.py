@@ -1,3 +1,10 @@
+from array import array
+from itertools import islice
+from Instrumentation import metrics
+
+NO_PRIORITY = float('-inf')  # priority of an empty slot
+
+
 class MaxHeap(object):
     """
     This class represents a binary (at most 2 children) MaxHeap, defined as a
@@ -5,6 +12,9 @@ class MaxHeap(object):
 
         1. All children are less than or equal to their parents in priority
         2. If a parent has children, it must have a left child. A right child is optional.
+
+    The (numeric) priority of each item is computed once, when the item enters the MaxHeap, and is kept in
+    priority_arr alongside heap_arr. An item whose priority changes afterwards must be refreshed.
     """
 
     def __init__(self, initial_capacity=10, initial_heap=None):
@@ -20,16 +30,21 @@ class MaxHeap(object):
         else:
             self.size = 0
             self.heap_arr = [None] * initial_capacity
+            self.priority_arr = array('d', [NO_PRIORITY]) * initial_capacity
 
     def __doublecapacity(self):
         """
-        Copies the elements of heap_arr into a list with
-        length = size * 2
+        Copies the elements of heap_arr (and their priorities) into a list with
+        length = size * 2 (or 2 if the MaxHeap is empty)
         """
-        doubled_heap_arr = [None] * self.size * 2
+        capacity = max(2, self.size * 2)
+        doubled_heap_arr = [None] * capacity
+        doubled_priority_arr = array('d', [NO_PRIORITY]) * capacity
         for i in range(self.size):
             doubled_heap_arr[i] = self.heap_arr[i]
+            doubled_priority_arr[i] = self.priority_arr[i]
         self.heap_arr = doubled_heap_arr
+        self.priority_arr = doubled_priority_arr
 
     def __gt__(self, a: int, b: int):
         """
@@ -37,8 +52,10 @@ class MaxHeap(object):
         :param b: index within heap_arr
         :return: True if the item at index a has a higher priority than the item at index b, and False otherwise
         """
-        priority_a = float('-inf') if (a is None or self.heap_arr[a] is None) else self.heap_arr[a].get_priority()
-        priority_b = float('-inf') if (b is None or self.heap_arr[b] is None) else self.heap_arr[b].get_priority()
+        if metrics.enabled:
+            metrics.increment('maxheap.comparisons')
+        priority_a = NO_PRIORITY if a is None else self.priority_arr[a]
+        priority_b = NO_PRIORITY if b is None else self.priority_arr[b]
         return priority_a > priority_b
 
     def __swap(self, a: int, b: int):
@@ -48,9 +65,9 @@ class MaxHeap(object):
         :param a: index within heap_arr
         :param b: index within heap_arr
         """
-        tmp = self.heap_arr[a]
-        self.heap_arr[a] = self.heap_arr[b]
-        self.heap_arr[b] = tmp
+        heap_arr, priority_arr = self.heap_arr, self.priority_arr
+        heap_arr[a], heap_arr[b] = heap_arr[b], heap_arr[a]
+        priority_arr[a], priority_arr[b] = priority_arr[b], priority_arr[a]
 
     def __percolateUp(self, out_of_order: int):
         """
@@ -69,9 +86,10 @@ class MaxHeap(object):
 
         :param item: item to be inserted (must have a get_priority method)
         """
-        if self.size == len(self.heap_arr) - 1:
+        if self.size >= len(self.heap_arr) - 1:
             self.__doublecapacity()
         self.heap_arr[self.size] = item
+        self.priority_arr[self.size] = item.get_priority()
         self.__percolateUp(self.size)
         self.size += 1
 
@@ -113,10 +131,38 @@ class MaxHeap(object):
         """
         ret = self.findMax()
         self.heap_arr[0] = self.heap_arr[self.size - 1]
+        self.priority_arr[0] = self.priority_arr[self.size - 1]
         self.size -= 1
         self.__percolateDown(0)
         return ret
 
+    def copy(self):
+        """
+        :return: a new MaxHeap with the same items and priorities as this one (in linear time)
+        """
+        clone = MaxHeap(0)
+        clone.size = self.size
+        clone.heap_arr = self.heap_arr[:self.size]
+        clone.priority_arr = self.priority_arr[:self.size]
+        return clone
+
+    def ranked(self):
+        """
+        :return: a generator of the items in order of priority (highest first), removing one maximum at a time
+        from a copy of the MaxHeap, so this MaxHeap is left unchanged
+        """
+        clone = self.copy()
+        while not clone.isEmpty():
+            yield clone.removeMax()
+
+    def top_k(self, k: int):
+        """
+        :param k: the number of items to return
+        :return: the (at most) k highest priority items in order of priority (highest first), in O(n + k log n)
+        time, leaving this MaxHeap unchanged
+        """
+        return list(islice(self.ranked(), k))
+
     def isEmpty(self):
         """
         :return: True if there are no items left in the MaxHeap, and False otherwise.
@@ -164,5 +210,21 @@ class MaxHeap(object):
         """
         start = int((self.size + 1) / 2)
         self.heap_arr = [item for item in items]
+        self.priority_arr = array('d', [item.get_priority() for item in self.heap_arr])
         for i in range(start, -1, -1):
-            self.__percolateDown(i)
\ No newline at end of file
+            self.__percolateDown(i)
+
+    def refresh(self, item: object):
+        """
+        Recomputes the priority of an item already in the MaxHeap whose priority has changed, re-arranging the
+        structure to maintain the MaxHeap properties. Finding the item takes linear time.
+
+        :param item: item within the MaxHeap (raises ValueError if it is not in the MaxHeap)
+        """
+        for i in range(self.size):
+            if self.heap_arr[i] is item:
+                self.priority_arr[i] = item.get_priority()
+                self.__percolateUp(i)
+                self.__percolateDown(i)
+                return
+        raise ValueError('Item is not in the MaxHeap')
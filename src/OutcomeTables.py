@@ -0,0 +1,176 @@
+import mmap
+import struct
+import sys
+from array import array
+from Deck import get_card_kinds
+from Hand import Hand, lookup_score
+
+# magic, version, threshold, number of decks, exact, number of rows, number of columns (padded to 16 bytes)
+HEADER = struct.Struct('<4sHBBBxHHxx')
+MAGIC = b'BJOT'
+VERSION = 1
+NUM_ROWS = 22 * 2  # one row per starting (hard total 0-21, has aces) state
+
+
+def get_row(hard_total: int, soft_aces: int):
+    """
+    :param hard_total: the score of the starting hand when every ace is worth 1 (raises ValueError if bust)
+    :param soft_aces: the number of aces in the starting hand
+    :return: the row of the starting hand within an outcome table
+    """
+    if hard_total < 0 or hard_total > 21:
+        raise ValueError('No outcomes for a hard total of {0}'.format(hard_total))
+    return hard_total * 2 + (soft_aces > 0)
+
+
+class OutcomeTable(object):
+    """
+    This class represents the distribution of the final score of a hand that keeps hitting until its best score
+    reaches a stand threshold (e.g. 17), for every non-bust starting hand. Each row holds the probability of
+    finishing on each score from the threshold up to 21, followed by the probability of busting. Tables are
+    saved in a compact binary format (a 16 byte header followed by little-endian doubles), and memory-mapped
+    when loaded.
+    """
+    def __init__(self, threshold: int, num_decks: int, exact: bool, data: object, mapped=None):
+        """
+        Constructs an OutcomeTable (see build_outcome_table and OutcomeTable.load)
+
+        :param threshold: the best score at (or above) which the hand stands
+        :param num_decks: the number of decks the cards are drawn from
+        :param exact: True if cards are drawn without replacement from the decks, and False if every card is
+        drawn from an infinite number of decks in the same proportions
+        :param data: the probabilities in row-major order
+        :param mapped: the memory map holding data (or None if data is in memory)
+        """
+        self.threshold = threshold
+        self.num_decks = num_decks
+        self.exact = exact
+        self.num_columns = 21 - threshold + 2
+        self.data = data
+        self.mapped = mapped
+
+    def get_outcomes(self):
+        """
+        :return: the label of each column: the final scores from the threshold up to 21, followed by 'bust'
+        """
+        return list(range(self.threshold, 22)) + ['bust']
+
+    def get_distribution(self, hard_total: int, soft_aces: int):
+        """
+        :param hard_total: the score of the starting hand when every ace is worth 1 (raises ValueError if bust)
+        :param soft_aces: the number of aces in the starting hand
+        :return: the probability of each outcome (see get_outcomes) for the starting hand
+        """
+        start = get_row(hard_total, soft_aces) * self.num_columns
+        return list(self.data[start:start + self.num_columns])
+
+    def get_hand_distribution(self, hand: Hand):
+        """
+        :param hand: the starting hand (raises ValueError if bust)
+        :return: the probability of each outcome (see get_outcomes) for the starting hand
+        """
+        return self.get_distribution(hand.hard_total, hand.soft_aces)
+
+    def save(self, path: str):
+        """
+        Writes the table to the given file
+
+        :param path: the file to write
+        """
+        with open(path, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, VERSION, self.threshold, self.num_decks, self.exact, NUM_ROWS, self.num_columns))
+            data = array('d', self.data)
+            if sys.byteorder != 'little':
+                data.byteswap()
+            f.write(data.tobytes())
+
+    @staticmethod
+    def load(path: str):
+        """
+        :param path: a file written by OutcomeTable.save (raises ValueError if it is not an outcome table, or if its
+        header does not describe a valid table)
+        :return: the OutcomeTable, reading its probabilities straight from a memory map of the file on
+        little-endian machines (big-endian machines read a byte-swapped copy instead, as the file is little-endian)
+        """
+        with open(path, 'rb') as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(mapped) < HEADER.size:
+            mapped.close()
+            raise ValueError('Not an outcome table: {0}'.format(path))
+        magic, version, threshold, num_decks, exact, num_rows, num_columns = HEADER.unpack_from(mapped)
+        if magic != MAGIC or version != VERSION or len(mapped) != HEADER.size + num_rows * num_columns * 8:
+            mapped.close()
+            raise ValueError('Not an outcome table: {0}'.format(path))
+        if not 1 <= threshold <= 21 or not 1 <= num_decks <= 8 or exact > 1 or num_rows != NUM_ROWS \
+                or num_columns != 21 - threshold + 2:
+            mapped.close()
+            raise ValueError('Invalid outcome table header: {0}'.format(path))
+        if sys.byteorder == 'little':
+            data = memoryview(mapped)[HEADER.size:].cast('d')
+        else:
+            data = array('d', mapped[HEADER.size:])
+            data.byteswap()
+            mapped.close()
+            mapped = None
+        return OutcomeTable(threshold, num_decks, bool(exact), data, mapped)
+
+    def close(self):
+        """
+        Releases the memory map of a loaded table (the table cannot be read afterwards)
+        """
+        if self.mapped is not None:
+            self.data.release()
+            self.mapped.close()
+            self.mapped = None
+
+
+def build_outcome_table(threshold=17, num_decks=1, exact=False):
+    """
+    :param threshold: the best score at (or above) which the hand stands (raises ValueError if not within 1-21)
+    :param num_decks: the number of decks the cards are drawn from (raises ValueError if not within 1-8)
+    :param exact: True to draw cards without replacement from the full decks (the starting hand's own cards are
+    not removed), and False to draw every card from an infinite number of decks in the same proportions
+    :return: the OutcomeTable of every non-bust starting hand
+    """
+    if threshold < 1 or threshold > 21:
+        raise ValueError('Threshold must be between 1 and 21')
+    if num_decks < 1 or num_decks > 8:
+        raise ValueError('Number of decks must be between 1 and 8')
+    kinds, kind_of_rank = get_card_kinds()
+    counts = [0] * len(kinds)
+    for kind in kind_of_rank:
+        counts[kind] += 4 * num_decks
+    num_columns = 21 - threshold + 2
+    memo = {}
+
+    def outcomes(hard_total: int, has_aces: bool, counts: tuple):
+        """
+        :return: the probability of each outcome of the hand, drawing from the given counts of each kind of card
+        """
+        key = (hard_total, has_aces, counts if exact else None)
+        if key in memo:
+            return memo[key]
+        score = lookup_score(hard_total, has_aces)
+        distribution = [0.0] * num_columns
+        if score.is_bust:
+            distribution[-1] = 1.0
+        elif score.best_score >= threshold:
+            distribution[score.best_score - threshold] = 1.0
+        else:
+            total = sum(counts)
+            if total == 0:
+                raise ValueError('Ran out of cards before reaching the threshold')
+            for i, count in enumerate(counts):
+                if count == 0:
+                    continue
+                value, is_ace = kinds[i]
+                next_counts = counts[:i] + (count - 1,) + counts[i + 1:] if exact else counts
+                for j, p in enumerate(outcomes(hard_total + value, has_aces or is_ace, next_counts)):
+                    distribution[j] += p * count / total
+        memo[key] = distribution
+        return distribution
+
+    data = array('d')
+    for row in range(NUM_ROWS):
+        data.extend(outcomes(row // 2, row % 2 == 1, tuple(counts)))
+    return OutcomeTable(threshold, num_decks, exact, data)
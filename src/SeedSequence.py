@@ -0,0 +1,39 @@
+import hashlib
+import random
+
+
+class SeedSequence(object):
+    """
+    This class represents a splittable source of seeds: a root seed followed by a path of keys (e.g. a worker,
+    table or round number). Each distinct path hashes to its own 64 bit seed, so that spawning children by key
+    derives independent, reproducible RNG streams without any shared state.
+    """
+    def __init__(self, seed=0, path=()):
+        """
+        Constructs a SeedSequence
+
+        :param seed: the root seed (an int or str)
+        :param path: the keys (ints or strs) leading from the root seed to this sequence
+        """
+        self.seed = seed
+        self.path = tuple(path)
+
+    def spawn(self, *keys):
+        """
+        :param keys: the keys (ints or strs) to append to the path (e.g. 'table', 3)
+        :return: the child SeedSequence at the given keys
+        """
+        return SeedSequence(self.seed, self.path + keys)
+
+    def get_seed(self):
+        """
+        :return: the 64 bit seed of this sequence, which only depends on the root seed and the path
+        """
+        digest = hashlib.sha256(repr((self.seed,) + self.path).encode()).digest()
+        return int.from_bytes(digest[:8], 'little')
+
+    def make_rng(self):
+        """
+        :return: a new random.Random seeded with this sequence's seed
+        """
+        return random.Random(self.get_seed())
@@ -0,0 +1,151 @@
+from Deck import Deck, HI_LO
+from Instrumentation import metrics
+
+
+class Shoe(Deck):
+    """
+    This class represents a dealing shoe holding between 1 and 8 standard decks that have been shuffled together.
+    A cut card is placed in the shoe, and once it has been reached, the shoe is reshuffled at the start of the
+    next round. If the shoe empties mid-round, the cards discarded in earlier rounds are reshuffled on the spot,
+    while the cards in play this round stay out of the shoe (so its rank counts and running count still account for
+    them), and a round never deals the same card twice. Only a round that draws every card in the shoe runs out.
+    """
+    def __init__(self, num_decks=6, penetration=0.75, cut_card=None, counting_system=HI_LO, rng=None):
+        """
+        Constructs a Shoe
+
+        :param num_decks: the number of standard decks in the shoe (raises ValueError if not between 1 and 8)
+        :param penetration: the fraction of the shoe dealt before the cut card is reached (raises ValueError
+        if not within (0, 1])
+        :param cut_card: the number of cards dealt before the cut card is reached, overriding penetration
+        (raises ValueError if not between 1 and the number of cards in the shoe)
+        :param counting_system: the tag added to the running count for each rank index (0-12) that is drawn
+        :param rng: the random.Random that shuffles the shoe (the global RNG of the random module if not provided)
+        """
+        if num_decks < 1 or num_decks > 8:
+            raise ValueError('A shoe holds between 1 and 8 decks')
+        self.num_decks = num_decks
+        if cut_card is None:
+            if penetration <= 0 or penetration > 1:
+                raise ValueError('Penetration must be within (0, 1]')
+            cut_card = max(1, int(penetration * self.get_capacity()))
+        if cut_card < 1 or cut_card > self.get_capacity():
+            raise ValueError('invalid cut card position: {0}'.format(cut_card))
+        self.cut_card = cut_card
+        self.num_shuffles = 0
+        super().__init__(counting_system, rng)
+
+    def shuffle(self):
+        """
+        Returns every card to the shoe in a new random order, and resets the running count
+        """
+        super().shuffle()
+        self.num_shuffles += 1
+        self.__mark_shuffled([])
+
+    def __mark_shuffled(self, held: [int]):
+        """
+        Records the order of the freshly shuffled shoe, from which the cards drawn since are recovered (see
+        get_cards_in_play), so that drawing a card costs nothing extra
+
+        :param held: the indices of the cards in play this round that were drawn before the shoe was shuffled
+        """
+        self.shuffled = list(self.undrawn)
+        self.round_start = len(self.undrawn)  # the cards drawn this round are shuffled[len(undrawn):round_start]
+        self.held = held
+
+    def __reshuffle_discards(self):
+        """
+        Shuffles the cards discarded in earlier rounds back into the empty shoe, leaving out the cards in play this
+        round, whose ranks stay out of the rank counts and whose tags make up the running count
+        """
+        held = self.get_cards_in_play()
+        cards = [self.num_decks] * 52
+        rank_counts = [4 * self.num_decks] * 13
+        running_count = 0
+        for card_index in held:
+            cards[card_index] -= 1
+            rank = card_index % 13
+            rank_counts[rank] -= 1
+            running_count += self.counting_system[rank]
+        self.cards = cards
+        self.undrawn = [card_index for card_index in range(52) for _ in range(cards[card_index])]
+        self.rng.shuffle(self.undrawn)
+        self.rank_counts[:] = rank_counts  # updated in place, so that views stay live
+        self.running_count = running_count
+        self.num_shuffles += 1
+        if metrics.enabled:
+            metrics.increment('deck.shuffles')
+        self.__mark_shuffled(held)
+
+    def get_cards_in_play(self):
+        """
+        :return: the indices (0-51) of the cards drawn since the current round started (in no particular order),
+        which stay out of the shoe until the next round
+        """
+        return self.held + self.shuffled[len(self.undrawn):self.round_start]
+
+    def start_round(self):
+        """
+        Prepares the shoe for a new round of BlackJack, reshuffling it if the cut card has been reached. The cards
+        in play in the previous round are discarded.
+        """
+        if self.is_cut_card_reached():
+            self.shuffle()
+        else:
+            self.round_start, self.held = len(self.undrawn), []
+
+    def get_capacity(self):
+        """
+        :return: the number of cards in the shoe when no card has been drawn
+        """
+        return 52 * self.num_decks
+
+    def get_num_drawn(self):
+        """
+        :return: the number of cards out of the shoe: those drawn since it was last shuffled, along with those still
+        in play if it was reshuffled mid-round
+        """
+        return self.get_capacity() - len(self.undrawn)
+
+    def is_cut_card_reached(self):
+        """
+        :return: True if at least as many cards as the cut card position have been drawn since the last shuffle
+        """
+        return self.get_num_drawn() >= self.cut_card
+
+    def can_draw(self, k: int):
+        """
+        :param k: a number of cards
+        :return: True if k cards can be drawn in the current round (the shoe is reshuffled whenever it empties, but
+        the cards in play this round cannot be drawn again), and False otherwise
+        """
+        num_in_play = len(self.held) + self.round_start - len(self.undrawn)
+        return 0 <= k <= self.get_capacity() - num_in_play
+
+    def draw_index(self):
+        """
+        :return: the index (0-51) of a random card drawn from the shoe, which will be removed from the shoe
+        thereafter (or None if every card in the shoe is in play this round). The discarded cards are reshuffled
+        first if the shoe is empty.
+        """
+        if len(self.undrawn) <= 0 and self.can_draw(1):
+            self.__reshuffle_discards()
+        return super().draw_index()
+
+    def draw_many_indices(self, k: int):
+        """
+        :param k: the number of cards to draw (raises ValueError if negative, or if fewer than k cards are out of
+        play this round, see can_draw)
+        :return: a list of the indices (0-51) of the k cards that k calls to draw_index would return, in the same
+        order, reshuffling the discarded cards whenever the shoe empties along the way
+        """
+        if not self.can_draw(k):
+            raise ValueError('Cannot draw {0} cards from a shoe of {1} cards with {2} in play'.format(
+                k, self.get_capacity(), len(self.get_cards_in_play())))
+        card_indices = []
+        while len(card_indices) < k:
+            if len(self.undrawn) <= 0:
+                self.__reshuffle_discards()
+            card_indices.extend(super().draw_many_indices(min(k - len(card_indices), len(self.undrawn))))
+        return card_indices
@@ -0,0 +1,244 @@
+import random
+from concurrent.futures import ProcessPoolExecutor
+from os import cpu_count
+from time import perf_counter
+from Game import Game
+from Hand import Hand
+from SeedSequence import SeedSequence
+
+
+class ThresholdPolicy(object):
+    """
+    This class represents a simple playing policy that keeps hitting while the best
+    score of the hand is below a fixed threshold (e.g. "hit below 17")
+    """
+    def __init__(self, threshold=17):
+        """
+        Constructs a ThresholdPolicy
+
+        :param threshold: the best score at (or above) which the policy stays
+        """
+        self.threshold = threshold
+
+    def __call__(self, hand: Hand):
+        """
+        :param hand: the hand of the player whose turn it is
+        :return: True if the player should hit, and False if the player should stay
+        """
+        return hand.get_best_score() < self.threshold
+
+
+class SimulationResults(object):
+    """
+    This class represents the aggregate results of a number of simulated rounds of BlackJack,
+    tallied per player
+    """
+    def __init__(self, player_names: [str]):
+        """
+        Constructs an empty set of results
+
+        :param player_names: the players whose results are being tallied
+        """
+        self.player_names = list(player_names)
+        self.rounds = 0
+        self.elapsed = 0.0  # wall-clock seconds spent simulating
+        self.wins = {name: 0 for name in self.player_names}
+        self.busts = {name: 0 for name in self.player_names}
+        self.total_best_score = {name: 0 for name in self.player_names}
+
+    def record(self, game: Game):
+        """
+        Tallies the outcome of a finished game
+
+        :param game: a game that is over (raises ValueError if the game is still in progress)
+        """
+        self.wins[game.get_winner()] += 1
+        for hand in game.hands:
+            name = hand.get_name()
+            if hand.is_bust():
+                self.busts[name] += 1
+            self.total_best_score[name] += hand.get_best_score()
+        self.rounds += 1
+
+    def merge(self, other):
+        """
+        Adds the tallies of other into these results
+
+        :param other: SimulationResults for the same players (raises ValueError if the players differ)
+        """
+        if other.player_names != self.player_names:
+            raise ValueError('Cannot merge results of different players')
+        for name in self.player_names:
+            self.wins[name] += other.wins[name]
+            self.busts[name] += other.busts[name]
+            self.total_best_score[name] += other.total_best_score[name]
+        self.rounds += other.rounds
+
+    def get_win_rate(self, name: str):
+        """
+        :param name: the name of a player
+        :return: the fraction of rounds won by the player (0 if no rounds were played)
+        """
+        return self.wins[name] / self.rounds if self.rounds else 0.0
+
+    def get_bust_rate(self, name: str):
+        """
+        :param name: the name of a player
+        :return: the fraction of rounds in which the player busted (0 if no rounds were played)
+        """
+        return self.busts[name] / self.rounds if self.rounds else 0.0
+
+    def get_average_best_score(self, name: str):
+        """
+        :param name: the name of a player
+        :return: the average best score of the player's final hand (0 if no rounds were played)
+        """
+        return self.total_best_score[name] / self.rounds if self.rounds else 0.0
+
+    def get_rounds_per_second(self):
+        """
+        :return: the throughput of the simulation (0 if no time was recorded)
+        """
+        return self.rounds / self.elapsed if self.elapsed > 0 else 0.0
+
+    def summary(self):
+        """
+        :return: a dictionary of the throughput and the per-player win rate, bust rate, and average best score
+        """
+        return {
+            'rounds': self.rounds,
+            'elapsed': self.elapsed,
+            'rounds_per_second': self.get_rounds_per_second(),
+            'players': {
+                name: {
+                    'win_rate': self.get_win_rate(name),
+                    'bust_rate': self.get_bust_rate(name),
+                    'average_best_score': self.get_average_best_score(name)
+                } for name in self.player_names
+            }
+        }
+
+
+class Simulation(object):
+    """
+    This class runs headless rounds of BlackJack, where each player's decisions are made by a policy
+    (a callable taking the player's Hand and returning True to hit or False to stay)
+    """
+    def __init__(self, player_names: [str], policies: [object], pre_deal=True, rng=None):
+        """
+        Constructs a Simulation
+
+        :param player_names: the (unique) players at the table (raises ValueError if empty or duplicated)
+        :param policies: one policy per player, in the same order as player_names (raises ValueError if the
+        number of policies does not match the number of players)
+        :param pre_deal: if True, every player is dealt 2 cards at the start of each round
+        :param rng: the random.Random that shuffles the deck of every round (the global RNG of the random module
+        if not provided)
+        """
+        if len(player_names) != len(policies):
+            raise ValueError('Each player needs exactly one policy')
+        if len(set(player_names)) != len(player_names):
+            raise ValueError('Player names must be unique')
+        self.player_names = list(player_names)
+        self.policies = list(policies)
+        self.pre_deal = pre_deal
+        self.rng = rng
+
+    def play_round(self):
+        """
+        :return: a finished game played entirely by the policies. A player who wants to hit when
+        the deck is out of cards stays instead.
+        """
+        game = Game(self.player_names, self.pre_deal, rng=self.rng)
+        policies = self.policies
+        while not game.is_game_over():
+            if policies[game.current_player](game.get_current_hand()):
+                try:
+                    game.hit()
+                except ValueError:  # out of cards
+                    game.stay()
+            else:
+                game.stay()
+        return game
+
+    def run(self, num_rounds: int):
+        """
+        :param num_rounds: the number of rounds to simulate
+        :return: SimulationResults tallying every round played
+        """
+        results = SimulationResults(self.player_names)
+        start = perf_counter()
+        for _ in range(num_rounds):
+            results.record(self.play_round())
+        results.elapsed = perf_counter() - start
+        return results
+
+
+def _run_shard(player_names: [str], policies: [object], pre_deal: bool, num_rounds: int, seed: int):
+    """
+    Runs one worker's share of a ParallelSimulation. The worker's Deck RNG is created from the shard's seed,
+    so the shard's results only depend on its arguments.
+
+    :param player_names: the players at the table
+    :param policies: one policy per player
+    :param pre_deal: if True, every player is dealt 2 cards at the start of each round
+    :param num_rounds: the number of rounds this shard plays
+    :param seed: the seed of this shard's Deck RNG stream
+    :return: SimulationResults tallying the shard's rounds
+    """
+    return Simulation(player_names, policies, pre_deal, random.Random(seed)).run(num_rounds)
+
+
+class ParallelSimulation(object):
+    """
+    This class splits a Simulation across a pool of worker processes, giving each worker an independently
+    seeded stream of shuffles and merging the per-worker tallies once all of them have finished. For a given
+    seed and number of workers, the tallies are identical from run to run.
+    """
+    def __init__(self, player_names: [str], policies: [object], pre_deal=True, num_workers=None):
+        """
+        Constructs a ParallelSimulation
+
+        :param player_names: the (unique) players at the table (raises ValueError if empty or duplicated)
+        :param policies: one picklable policy per player, in the same order as player_names (raises
+        ValueError if the number of policies does not match the number of players)
+        :param pre_deal: if True, every player is dealt 2 cards at the start of each round
+        :param num_workers: the number of worker processes (defaults to the number of cores, raises ValueError
+        if less than 1)
+        """
+        Simulation(player_names, policies, pre_deal)  # validate the table up-front
+        num_workers = num_workers if num_workers is not None else (cpu_count() or 1)
+        if num_workers < 1:
+            raise ValueError('Need at least one worker')
+        self.player_names = list(player_names)
+        self.policies = list(policies)
+        self.pre_deal = pre_deal
+        self.num_workers = num_workers
+
+    def get_shards(self, num_rounds: int, seed: int):
+        """
+        :param num_rounds: the total number of rounds to simulate
+        :param seed: the seed of the whole simulation
+        :return: a list of (num_rounds, seed) pairs, one per worker, where the rounds add up to num_rounds
+        and each worker's seed is derived from the given seed and the worker's index (see SeedSequence)
+        """
+        seeds = SeedSequence(seed)
+        base, remainder = divmod(num_rounds, self.num_workers)
+        return [(base + (1 if i < remainder else 0), seeds.spawn('worker', i).get_seed())
+                for i in range(self.num_workers)]
+
+    def run(self, num_rounds: int, seed=0):
+        """
+        :param num_rounds: the total number of rounds to simulate
+        :param seed: the seed from which every worker's Deck RNG stream is derived
+        :return: SimulationResults merging the tallies of every worker, in shard order
+        """
+        results = SimulationResults(self.player_names)
+        start = perf_counter()
+        with ProcessPoolExecutor(max_workers=self.num_workers) as executor:
+            futures = [executor.submit(_run_shard, self.player_names, self.policies, self.pre_deal, rounds, shard_seed)
+                       for rounds, shard_seed in self.get_shards(num_rounds, seed)]
+            for future in futures:
+                results.merge(future.result())
+        results.elapsed = perf_counter() - start
+        return results
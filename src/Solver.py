@@ -0,0 +1,152 @@
+from collections import OrderedDict, namedtuple
+from Deck import Deck, get_card_kinds
+from Hand import Hand, lookup_score
+
+# The best action for a hand, along with the expected value of hitting and of staying
+Decision = namedtuple('Decision', ['action', 'hit_ev', 'stay_ev'])
+
+
+class LRUCache(object):
+    """
+    This class represents a bounded memo table that evicts the least recently used entry once it is full,
+    and keeps track of how often it was hit and missed
+    """
+    def __init__(self, max_size=1 << 20):
+        """
+        Constructs an empty LRUCache
+
+        :param max_size: the maximum number of entries kept (raises ValueError if less than 1)
+        """
+        if max_size < 1:
+            raise ValueError('Cache must hold at least one entry')
+        self.max_size = max_size
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: object):
+        """
+        :param key: the key to look up
+        :return: the value cached for key (or None if there is none), marking it as the most recently used
+        """
+        value = self.entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: object, value: object):
+        """
+        Caches the given value for key, evicting the least recently used entry if the cache is full
+
+        :param key: the key to cache the value under
+        :param value: the value to cache (must not be None)
+        """
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+    def clear(self):
+        """
+        Removes every entry and resets the statistics
+        """
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def info(self):
+        """
+        :return: a dictionary of the hits, misses, current size, and maximum size of the cache
+        """
+        return {'hits': self.hits, 'misses': self.misses, 'size': len(self.entries), 'max_size': self.max_size}
+
+
+def default_utility(score):
+    """
+    :param score: the ScoreEntry of a final hand
+    :return: the priority of the hand, which is what Game ranks players by
+    """
+    return score.priority
+
+
+class Solver(object):
+    """
+    This class finds the action (hit or stay) that maximizes the expected value of a hand given the cards still
+    in the deck, assuming every later decision is also made optimally. Values are computed by dynamic programming
+    over the hand's (hard total, has aces) score state and the number of cards of each kind left, and memoized
+    in an LRUCache shared by every decision the Solver makes.
+    """
+    def __init__(self, utility=default_utility, max_cache_size=1 << 20):
+        """
+        Constructs a Solver
+
+        :param utility: function giving the value of a final hand from its ScoreEntry (by default its priority)
+        :param max_cache_size: the maximum number of states memoized (raises ValueError if less than 1)
+        """
+        self.utility = utility
+        self.cache = LRUCache(max_cache_size)
+        self.kinds, self.kind_of_rank = get_card_kinds()
+
+    def cache_info(self):
+        """
+        :return: a dictionary of the hits, misses, current size, and maximum size of the memo table
+        """
+        return self.cache.info()
+
+    def solve(self, hand: Hand, deck: Deck):
+        """
+        :param hand: the hand to decide for
+        :param deck: the Deck (or Shoe) the next cards are drawn from
+        :return: the Decision for the hand
+        """
+        return self.solve_counts(hand.hard_total, hand.soft_aces, deck.get_rank_counts())
+
+    def solve_counts(self, hard_total: int, soft_aces: int, rank_counts: [int]):
+        """
+        :param hard_total: the score of the hand when every ace is worth 1
+        :param soft_aces: the number of aces in the hand
+        :param rank_counts: the number of cards of each rank index (0-12) left to draw from
+        :return: the Decision for the hand, where hitting is only chosen if it is strictly better. The hit EV is
+        -inf if hitting is not possible (the hand is bust or there are no cards left).
+        """
+        counts = [0] * len(self.kinds)
+        for rank, count in enumerate(rank_counts):
+            counts[self.kind_of_rank[rank]] += count
+        hit_ev, stay_ev = self.__evaluate(hard_total, soft_aces > 0, tuple(counts))
+        return Decision('hit' if hit_ev > stay_ev else 'stay', hit_ev, stay_ev)
+
+    def __evaluate(self, hard_total: int, has_aces: bool, counts: tuple):
+        """
+        :param hard_total: the score of the hand when every ace is worth 1
+        :param has_aces: True if the hand has at least one ace
+        :param counts: the number of cards of each kind left to draw from
+        :return: (hit EV, stay EV) of the hand
+        """
+        key = (hard_total, has_aces, counts)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        score = lookup_score(hard_total, has_aces)
+        stay_ev = self.utility(score)
+        total = sum(counts)
+        if score.is_bust or total == 0:
+            result = (float('-inf'), stay_ev)
+        else:
+            hit_ev = 0.0
+            for i, count in enumerate(counts):
+                if count == 0:
+                    continue
+                value, is_ace = self.kinds[i]
+                next_hard, next_has_aces = hard_total + value, has_aces or is_ace
+                next_score = lookup_score(next_hard, next_has_aces)
+                if next_score.is_bust:  # the turn is over
+                    ev = self.utility(next_score)
+                else:
+                    ev = max(self.__evaluate(next_hard, next_has_aces, counts[:i] + (count - 1,) + counts[i + 1:]))
+                hit_ev += ev * count / total
+            result = (hit_ev, stay_ev)
+        self.cache.put(key, result)
+        return result
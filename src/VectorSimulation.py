@@ -0,0 +1,132 @@
+from time import perf_counter
+import numpy as np
+from BatchEvaluation import CARD_VALUES, CARD_IS_ACE, score_hands, rank_hands
+from SeedSequence import SeedSequence
+from Simulation import Simulation, SimulationResults, ThresholdPolicy
+
+
+class VectorSimulation(object):
+    """
+    This class simulates many rounds of BlackJack at once with NumPy, for players who all follow a ThresholdPolicy.
+    Every round is played as by Simulation (a fresh shuffled deck per round, the players taking their turns in order,
+    and a player who wants to hit when the deck is out of cards staying instead), but each step is an array operation
+    over every round: the decks are M permutations of the 52 cards, and a player's turn is a few passes of hits over
+    the rounds in which they are still below the threshold. The decks are only shuffled as far as cards are drawn
+    from them, so a round costs a handful of array operations rather than a full shuffle.
+    """
+    def __init__(self, player_names: [str], policies: [ThresholdPolicy], pre_deal=True):
+        """
+        Constructs a VectorSimulation
+
+        :param player_names: the (unique) players at the table (raises ValueError if empty, duplicated, or
+        more than half the cards in a deck)
+        :param policies: one ThresholdPolicy per player, in the same order as player_names (raises ValueError if
+        any policy is not a ThresholdPolicy, or if the number of policies does not match the number of players)
+        :param pre_deal: if True, every player is dealt 2 cards at the start of each round
+        """
+        Simulation(player_names, policies, pre_deal)  # validate the table up-front
+        if not player_names or len(player_names) > 26:
+            raise ValueError('Need between 1 and 26 players')
+        if not all(isinstance(policy, ThresholdPolicy) for policy in policies):
+            raise ValueError('Every policy must be a ThresholdPolicy')
+        self.player_names = list(player_names)
+        self.thresholds = [policy.threshold for policy in policies]
+        self.pre_deal = pre_deal
+
+    def play_rounds(self, num_rounds: int, rng: object):
+        """
+        :param num_rounds: the number of rounds M to play
+        :param rng: the numpy.random.Generator that shuffles the decks
+        :return: (scores, rankings) where scores are the BatchScores of the final hands as (M, P) arrays, and
+        rankings is the (M, P) array of the player indices of each round in the order of ranking (players with the
+        same score being ordered by seat, as in Game)
+        """
+        scores = self.__play_hands(num_rounds, rng)
+        return scores, rank_hands(scores.priority)
+
+    def __play_hands(self, num_rounds: int, rng: object):
+        """
+        :param num_rounds: the number of rounds M to play
+        :param rng: the numpy.random.Generator that shuffles the decks
+        :return: the BatchScores of the final hands as (M, P) arrays
+        """
+        num_players = len(self.player_names)
+        # one deck of 52 card indices per round, laid end to end, and shuffled lazily: drawing the card at a
+        # position swaps it with a random undrawn card (a Fisher-Yates shuffle that stops at the last card drawn).
+        # Drawn positions are never read again, so only the undrawn half of each swap is written back.
+        decks = np.tile(np.arange(52, dtype=np.int8), num_rounds)
+        every_round = np.arange(num_rounds)
+        deck_starts = every_round * 52
+        position = np.zeros(num_rounds, dtype=np.intp)  # number of cards drawn from each deck
+        hard_total = np.zeros((num_players, num_rounds), dtype=np.int16)
+        has_aces = np.zeros((num_players, num_rounds), dtype=bool)
+        if self.pre_deal:  # every player is dealt 2 cards, in turn order, with the random swaps drawn at once
+            num_dealt = 2 * num_players
+            dealt = np.arange(num_dealt)[:, None]
+            swaps = (rng.random((num_dealt, num_rounds)) * (52 - dealt)).astype(np.intp)
+            swaps += dealt
+            swaps += deck_starts
+            cards = np.empty((num_dealt, num_rounds), dtype=np.int8)
+            by_round = decks.reshape(num_rounds, 52)
+            for drawn, swap in enumerate(swaps):
+                cards[drawn] = decks[swap]
+                decks[swap] = by_round[:, drawn]
+            hard_total += CARD_VALUES[cards].reshape(num_players, 2, num_rounds).sum(axis=1, dtype=np.int16)
+            has_aces |= CARD_IS_ACE[cards].reshape(num_players, 2, num_rounds).any(axis=1)
+            position[:] = num_dealt
+        # the rounds in which each player hits at least once only depend on the dealt hands
+        wants_hit = score_hands(hard_total, has_aces).best_score < np.array(self.thresholds)[:, None]
+        for player, threshold in enumerate(self.thresholds):
+            hard, aces = hard_total[player], has_aces[player]
+            rounds = np.flatnonzero(wants_hit[player])
+            round_hard, round_aces = hard[rounds], aces[rounds]
+            while len(rounds):
+                drawn = position[rounds]
+                has_cards = drawn < 52
+                if not has_cards.all():  # only a big table can run out of cards
+                    rounds, drawn = rounds[has_cards], drawn[has_cards]
+                    round_hard, round_aces = round_hard[has_cards], round_aces[has_cards]
+                here = deck_starts[rounds] + drawn
+                swap = (rng.random(len(rounds)) * (52 - drawn)).astype(np.intp)
+                swap += here
+                card = decks[swap]
+                decks[swap] = decks[here]
+                position[rounds] = drawn + 1
+                round_hard = round_hard + CARD_VALUES[card]
+                round_aces = round_aces | CARD_IS_ACE[card]
+                hard[rounds] = round_hard
+                aces[rounds] = round_aces
+                best_score = round_hard + 10 * (round_aces & (round_hard <= 11))
+                hitting = best_score < threshold
+                rounds, round_hard, round_aces = rounds[hitting], round_hard[hitting], round_aces[hitting]
+        return score_hands(hard_total.T, has_aces.T)
+
+    def run(self, num_rounds: int, seed=0, batch_size=1 << 16):
+        """
+        :param num_rounds: the number of rounds to simulate
+        :param seed: the seed of the decks' RNG
+        :param batch_size: the maximum number of rounds played at once (bounding memory use)
+        :return: SimulationResults tallying every round played
+        """
+        results = SimulationResults(self.player_names)
+        rng = np.random.default_rng(SeedSequence(seed).get_seed())
+        start = perf_counter()
+        num_players = len(self.player_names)
+        wins = np.zeros(num_players, dtype=np.int64)
+        busts = np.zeros(num_players, dtype=np.int64)
+        total_best_score = np.zeros(num_players, dtype=np.int64)
+        remaining = num_rounds
+        while remaining > 0:
+            scores = self.__play_hands(min(batch_size, remaining), rng)
+            # the first of the highest priorities is the winner, as ranked first by rank_hands
+            wins += np.bincount(scores.priority.argmax(axis=1), minlength=num_players)
+            busts += scores.is_bust.sum(axis=0)
+            total_best_score += scores.best_score.sum(axis=0)
+            remaining -= len(scores.priority)
+        for player, name in enumerate(self.player_names):
+            results.wins[name] = int(wins[player])
+            results.busts[name] = int(busts[player])
+            results.total_best_score[name] = int(total_best_score[player])
+        results.rounds = num_rounds
+        results.elapsed = perf_counter() - start
+        return results
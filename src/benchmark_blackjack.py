@@ -0,0 +1,46 @@
+import sys
+from argparse import ArgumentParser
+from Benchmark import BENCHMARKS, compare_results, load_results, run_benchmarks, save_results
+
+
+def run(args):
+    results = run_benchmarks(args.only, args.scale, args.repeat, args.seed)
+    for name, result in results['benchmarks'].items():
+        print('{0:<24} {1:>14,.0f} ops/sec {2:>12,} bytes peak'.format(name, result['ops_per_sec'], result['peak_bytes']))
+    if args.output:
+        save_results(results, args.output)
+        print('Saved results to {0}'.format(args.output))
+    return 0
+
+
+def compare(args):
+    rows = compare_results(load_results(args.baseline), load_results(args.current), args.threshold)
+    for name, speed_change, memory_change, regressed in rows:
+        if speed_change is None:
+            print('{0:<24} NEW (not in the baseline)'.format(name))
+            continue
+        print('{0:<24} {1:>+8.1%} ops/sec {2:>+8.1%} peak {3}'.format(name, speed_change, memory_change,
+                                                                       'REGRESSION' if regressed else ''))
+    return 1 if any(row[3] for row in rows) else 0
+
+
+# Main process
+if __name__ == '__main__':
+    parser = ArgumentParser(description='Benchmark the BlackJack hot paths, or compare two benchmark runs')
+    commands = parser.add_subparsers(dest='command')
+    run_parser = commands.add_parser('run', help='run the benchmarks')
+    run_parser.add_argument('--output', help='JSON file to write the results to')
+    run_parser.add_argument('--only', nargs='+', choices=list(BENCHMARKS), help='benchmarks to run (default: all)')
+    run_parser.add_argument('--scale', type=float, default=1.0, help='multiplier of the work per benchmark')
+    run_parser.add_argument('--repeat', type=int, default=3, help='timed runs per benchmark (fastest is kept)')
+    run_parser.add_argument('--seed', type=int, default=0)
+    compare_parser = commands.add_parser('compare', help='flag regressions between two saved runs')
+    compare_parser.add_argument('baseline')
+    compare_parser.add_argument('current')
+    compare_parser.add_argument('--threshold', type=float, default=0.1, help='relative change that is a regression')
+    args = parser.parse_args()
+    if args.command == 'run':
+        sys.exit(run(args))
+    elif args.command == 'compare':
+        sys.exit(compare(args))
+    parser.print_help()
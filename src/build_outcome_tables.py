@@ -0,0 +1,15 @@
+from argparse import ArgumentParser
+from OutcomeTables import build_outcome_table
+
+# Main process
+if __name__ == '__main__':
+    parser = ArgumentParser(description='Compute the final score distributions of a stand threshold, and save them')
+    parser.add_argument('path', help='file to write the table to')
+    parser.add_argument('--threshold', type=int, default=17)
+    parser.add_argument('--decks', type=int, default=1)
+    parser.add_argument('--exact', action='store_true', help='draw without replacement from the decks')
+    args = parser.parse_args()
+    table = build_outcome_table(args.threshold, args.decks, args.exact)
+    table.save(args.path)
+    print('Saved the outcomes of a {0} threshold ({1} deck(s), {2}) to {3}'.format(
+        args.threshold, args.decks, 'exact' if args.exact else 'infinite deck', args.path))
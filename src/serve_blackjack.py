@@ -0,0 +1,39 @@
+import asyncio
+from argparse import ArgumentParser
+from GameServer import GameServer, LoadGenerator
+
+
+async def serve(host: str, port: int, seed: int):
+    server = GameServer(host, port, seed)
+    await server.start()
+    print('Serving BlackJack tables on {0}:{1}'.format(server.host, server.port))
+    await server.server.serve_forever()
+
+
+async def load(host: str, port: int, num_tables: int, players_per_table: int, spawn: bool):
+    server = None
+    if spawn:  # host the tables in this process
+        server = GameServer(host, 0)
+        await server.start()
+        port = server.port
+    report = await LoadGenerator(host, port, num_tables, players_per_table).run()
+    print('{tables} tables, {commands} commands in {elapsed:.2f}s: p50 {p50_ms:.3f}ms, p99 {p99_ms:.3f}ms'.format(**report))
+    if server:
+        await server.close()
+
+
+# Main process
+if __name__ == '__main__':
+    parser = ArgumentParser(description='Host BlackJack tables over TCP, or generate load against them')
+    parser.add_argument('mode', choices=['serve', 'load'])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8021)
+    parser.add_argument('--tables', type=int, default=300, help='number of tables played concurrently (load)')
+    parser.add_argument('--players', type=int, default=1, help='number of players at every table (load)')
+    parser.add_argument('--seed', type=int, default=None, help='seed every table\'s deck reproducibly (serve)')
+    parser.add_argument('--spawn', action='store_true', help='host the tables in the load generator process (load)')
+    args = parser.parse_args()
+    if args.mode == 'serve':
+        asyncio.run(serve(args.host, args.port, args.seed))
+    else:
+        asyncio.run(load(args.host, args.port, args.tables, args.players, args.spawn))
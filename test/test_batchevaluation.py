@@ -0,0 +1,90 @@
+import unittest
+from random import Random
+from src.Hand import Hand
+from src.Deck import Deck, SUITED_CARDS
+from src.Game import Game
+from src.Card import Card
+try:
+    import numpy as np
+    from src.BatchEvaluation import evaluate_hands, rank_hands, PAD
+except ImportError:  # numpy is optional
+    np = None
+
+
+@unittest.skipIf(np is None, 'numpy is not installed')
+class TestBatchEvaluation(unittest.TestCase):
+    """
+    This class tests the batch hand evaluation
+    """
+
+    def test_matches_hand(self):
+        """
+        Tests that the batch scores match the scores of Hands holding the same random cards
+        """
+        rng = Random(1)
+        deck = Deck(rng=rng)
+        rows, hands = [], []
+        for _ in range(2000):
+            deck.shuffle()
+            num_cards = rng.randint(0, 8)
+            row = [deck.undrawn[-1 - i] for i in range(num_cards)] + [PAD] * (8 - num_cards)
+            hand = Hand()
+            for card_index in row[:num_cards]:
+                hand.add_card(SUITED_CARDS[card_index])
+            rows.append(row)
+            hands.append(hand)
+        scores = evaluate_hands(np.array(rows))
+        self.assertListEqual(scores.best_score.tolist(), [hand.get_best_score() for hand in hands])
+        self.assertListEqual(scores.is_bust.tolist(), [hand.is_bust() for hand in hands])
+        self.assertListEqual(scores.is_soft.tolist(), [hand.is_soft() for hand in hands])
+        self.assertListEqual(scores.priority.tolist(), [hand.get_priority() for hand in hands])
+
+    def test_invalid(self):
+        """
+        Tests that arrays of the wrong shape, or holding invalid card indices, are rejected
+        """
+        with self.assertRaises(ValueError):
+            evaluate_hands(np.array([0, 1]))
+        with self.assertRaises(ValueError):
+            evaluate_hands(np.array([[0, 52]]))
+        with self.assertRaises(ValueError):
+            evaluate_hands(np.array([[0, -2]]))
+        self.assertListEqual(evaluate_hands(np.array([[9, 99]]), pad=99).best_score.tolist(), [10])
+
+    def test_rank_hands(self):
+        """
+        Tests that ranking the batch gives the same order of priorities as Game.get_rankings
+        """
+        king, ace, six = Card('king', [10]), Card('ace', [1, 11]), Card('six', [6])
+        g = Game(['bob', 'jane', 'joe', 'katy'])
+        cards = [[king, six, king], [king, six], [ace, king], [king, king]]
+        for hand, hand_cards in zip(g.hands, cards):
+            for card in hand_cards:
+                g.hit(card)
+            if not hand.is_bust():
+                g.stay()
+        ranks = [card.get_name() for card in Deck().card_mapping.values()]  # diamonds have card indices 0-12
+        rows = [[ranks.index(card.get_name()) for card in hand_cards] + [PAD] * (3 - len(hand_cards))
+                for hand_cards in cards]
+        order = rank_hands(evaluate_hands(np.array(rows)).priority)
+        names = [hand.get_name() for hand in g.hands]
+        self.assertListEqual([names[i] for i in order], g.get_rankings())
+        self.assertListEqual(rank_hands(np.array([[1, 3, 2], [5, 5, -4]])).tolist(), [[1, 2, 0], [0, 1, 2]])
+
+    def test_rank_hands_ties(self):
+        """
+        Tests that tied hands are ranked by seat, as in Game.get_rankings, for every mix of 19s and 20s
+        """
+        king, queen, nine = Card('king', [10]), Card('queen', [10]), Card('nine', [9])
+        names = ['p0', 'p1', 'p2', 'p3', 'p4']
+        for mask in range(32):
+            g = Game(names)
+            rows = []
+            for i in range(5):
+                second = queen if mask >> i & 1 else nine
+                g.hit(king)
+                g.hit(second)
+                g.stay()
+                rows.append([12, 11 if second is queen else 8])  # king and queen or nine of diamonds
+            order = rank_hands(evaluate_hands(np.array(rows)).priority)
+            self.assertListEqual([names[i] for i in order], g.get_rankings())
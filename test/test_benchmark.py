@@ -0,0 +1,69 @@
+import os
+import tempfile
+import unittest
+from src.Benchmark import BENCHMARKS, compare_results, load_results, run_benchmark, run_benchmarks, save_results
+
+
+class TestBenchmark(unittest.TestCase):
+    """
+    This class tests the benchmark suite
+    """
+
+    def test_run_benchmarks(self):
+        """
+        Tests that every benchmark runs and reports its throughput and peak memory
+        """
+        results = run_benchmarks(scale_factor=0.001, repeat=1)
+        self.assertSetEqual(set(results['benchmarks']), set(BENCHMARKS))
+        for result in results['benchmarks'].values():
+            self.assertGreater(result['ops'], 0)
+            self.assertGreater(result['ops_per_sec'], 0)
+            self.assertGreater(result['peak_bytes'], 0)
+        with self.assertRaises(ValueError):
+            run_benchmark('no_such_benchmark')
+
+    def test_repeatable(self):
+        """
+        Tests that the same seed does the same work (peak memory depends on the interpreter's caches, so it is not
+        compared)
+        """
+        a = run_benchmark('game_round_8', scale=20, repeat=1, seed=5)
+        b = run_benchmark('game_round_8', scale=20, repeat=1, seed=5)
+        self.assertEqual(a['ops'], b['ops'])
+        self.assertGreater(a['peak_bytes'], 0)
+        self.assertGreater(b['peak_bytes'], 0)
+
+    def test_compare(self):
+        """
+        Tests that slowdowns and memory growth above the threshold are flagged as regressions
+        """
+        baseline = {'benchmarks': {
+            'a': {'ops_per_sec': 100.0, 'peak_bytes': 1000},
+            'b': {'ops_per_sec': 100.0, 'peak_bytes': 1000},
+            'c': {'ops_per_sec': 100.0, 'peak_bytes': 1000},
+            'd': {'ops_per_sec': 100.0, 'peak_bytes': 1000}}}
+        current = {'benchmarks': {
+            'a': {'ops_per_sec': 95.0, 'peak_bytes': 1000},
+            'b': {'ops_per_sec': 80.0, 'peak_bytes': 1000},
+            'c': {'ops_per_sec': 150.0, 'peak_bytes': 1500},
+            'e': {'ops_per_sec': 100.0, 'peak_bytes': 1000}}}
+        rows = {row[0]: row for row in compare_results(baseline, current, 0.1)}
+        self.assertSetEqual(set(rows), {'a', 'b', 'c', 'e'})
+        self.assertTupleEqual(rows['e'], ('e', None, None, False))  # new, with nothing to compare against
+        self.assertFalse(rows['a'][3])
+        self.assertTrue(rows['b'][3])
+        self.assertTrue(rows['c'][3])
+        self.assertAlmostEqual(rows['b'][1], -0.2)
+
+    def test_save_load(self):
+        """
+        Tests that saved results load back unchanged
+        """
+        results = run_benchmarks(['deck_draw'], scale_factor=0.001, repeat=1)
+        fd, path = tempfile.mkstemp(suffix='.json')
+        os.close(fd)
+        try:
+            save_results(results, path)
+            self.assertDictEqual(load_results(path), results)
+        finally:
+            os.remove(path)
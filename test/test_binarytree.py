@@ -62,4 +62,100 @@ class TestBinaryTree(unittest.TestCase):
         parent1, parent2 = BinaryTreeNode(5, leaf1, leaf2), BinaryTreeNode(15, leaf3)
         root = BinaryTreeNode(0, parent1, parent2)
         bt = BinaryTree(root)
-        self.assertListEqual(list(bt.get_preorder()), [root, parent1, leaf1, leaf2, parent2, leaf3])
\ No newline at end of file
+        self.assertListEqual(list(bt.get_preorder()), [root, parent1, leaf1, leaf2, parent2, leaf3])
+
+    def test_attach(self):
+        """
+        Tests that attaching children to leaves keeps the frontier of leaves in pre-order
+        """
+        root = BinaryTreeNode(0)
+        bt = BinaryTree(root)
+        left, right = BinaryTreeNode(1), BinaryTreeNode(2)
+        bt.attach(root, left, right)
+        self.assertListEqual(list(bt.get_leaves()), [left, right])
+        grandchild = BinaryTreeNode(3)
+        bt.attach(left, right=grandchild)
+        self.assertListEqual(list(bt.get_leaves()), [grandchild, right])
+        self.assertListEqual(list(bt.get_leaves()), list(bt.get_preorder(True)))
+        with self.assertRaises(ValueError):
+            bt.attach(left, BinaryTreeNode(4))  # no longer a leaf
+        with self.assertRaises(ValueError):
+            bt.attach(BinaryTreeNode(5), BinaryTreeNode(4))  # not in the tree
+        with self.assertRaises(ValueError):
+            bt.attach(right, BinaryTreeNode(4, BinaryTreeNode(5)))  # not a new leaf
+        with self.assertRaises(ValueError):
+            bt.attach(right, left)  # already in the tree
+        self.assertListEqual(list(bt.get_leaves()), [grandchild, right])
+
+    def test_direct_assignment(self):
+        """
+        Tests that children can be assigned to nodes before they are part of a tree, but not after, so that the
+        frontier of leaves never goes stale
+        """
+        root = BinaryTreeNode(0)
+        root.left = BinaryTreeNode(1)
+        bt = BinaryTree(root)
+        with self.assertRaises(AttributeError):
+            root.right = BinaryTreeNode(2)
+        with self.assertRaises(AttributeError):
+            root.left.left = BinaryTreeNode(3)
+        self.assertIsNone(root.right)
+        self.assertListEqual(list(bt.get_leaves()), [root.left])
+        with self.assertRaises(ValueError):
+            BinaryTree(root.left)  # already part of a tree
+
+    def test_expand_leaves(self):
+        """
+        Tests that expanding every leaf at once matches a fresh pre-order traversal
+        """
+        leaf1, leaf2 = BinaryTreeNode(1), BinaryTreeNode(2)
+        bt = BinaryTree(BinaryTreeNode(0, leaf1, leaf2))
+        bt.expand_leaves(lambda leaf: (BinaryTreeNode(leaf.val * 10), BinaryTreeNode(leaf.val * 11)))
+        bt.expand_leaves(lambda leaf: (BinaryTreeNode(leaf.val + 1), None) if leaf.val > 15 else (None, None))
+        self.assertListEqual([leaf.val for leaf in bt.get_leaves()], [10, 11, 21, 23])
+        self.assertListEqual(list(bt.get_leaves()), list(bt.get_preorder(True)))
+        leaves = bt.get_leaves()
+        leaves.clear()  # a copy, which leaves the frontier untouched
+        self.assertListEqual([leaf.val for leaf in bt.get_leaves()], [10, 11, 21, 23])
+
+    def test_iterators(self):
+        """
+        Tests the nodes yielded by the pre-order, level-order, and leaves-only iterators of a 3-generation tree
+        """
+        leaf1, leaf2, leaf3 = BinaryTreeNode(10), BinaryTreeNode(20), BinaryTreeNode(30)
+        parent1, parent2 = BinaryTreeNode(5, leaf1, leaf2), BinaryTreeNode(15, None, leaf3)
+        root = BinaryTreeNode(0, parent1, parent2)
+        bt = BinaryTree(root)
+        self.assertListEqual(list(bt.iter_preorder()), [root, parent1, leaf1, leaf2, parent2, leaf3])
+        self.assertListEqual(list(bt.iter_preorder(True)), [leaf1, leaf2, leaf3])
+        self.assertListEqual(list(bt.iter_levelorder()), [root, parent1, parent2, leaf1, leaf2, leaf3])
+        self.assertListEqual(list(bt.iter_leaves()), [leaf1, leaf2, leaf3])
+        preorder = bt.iter_preorder()
+        self.assertIs(next(preorder), root)  # nothing else is visited yet
+        self.assertIs(next(preorder), parent1)
+
+    def test_equivalent_early_exit(self):
+        """
+        Tests that comparing trees stops at the first difference, and handles trees of different sizes
+        """
+        class CountingNode(BinaryTreeNode):
+            visits = 0
+
+            __slots__ = ()
+
+            @property
+            def left(self):
+                CountingNode.visits += 1
+                return self._left
+
+        deep = CountingNode(0)
+        node = deep
+        for i in range(1000):
+            node.right = CountingNode(i)
+            node = node.right
+        bt1, bt2 = BinaryTree(deep), BinaryTree(BinaryTreeNode(1, None, BinaryTreeNode(0)))
+        CountingNode.visits = 0
+        self.assertFalse(bt1.is_equivalent(bt2))
+        self.assertLess(CountingNode.visits, 5)
+        self.assertFalse(BinaryTree(BinaryTreeNode(0, BinaryTreeNode(1))).is_equivalent(BinaryTree(BinaryTreeNode(0))))
+        self.assertFalse(BinaryTree(BinaryTreeNode(0)).is_equivalent(BinaryTree(BinaryTreeNode(0, BinaryTreeNode(1)))))
@@ -47,5 +47,11 @@ class TestBinaryTreeNode(unittest.TestCase):
         self.assertEqual(node.right.val, 3)
         self.assertListEqual(list(node.get_children()), [node.left, node.right])
 
-
-
+    def test_slots(self):
+        """
+        Tests that nodes only hold their value and children (no per-node attribute dictionary)
+        """
+        node = BinaryTreeNode(1)
+        self.assertFalse(hasattr(node, '__dict__'))
+        with self.assertRaises(AttributeError):
+            node.parent = None
@@ -0,0 +1,78 @@
+import copy
+import pickle
+import unittest
+from src.Card import Card, InternedCard, CARDS, GENERIC_CARDS, get_card, to_card
+try:
+    import numpy as np
+except ImportError:  # numpy is optional
+    np = None
+
+
+class TestCard(unittest.TestCase):
+    """
+    This class tests the Card and InternedCard classes
+    """
+
+    def test_card(self):
+        """
+        Tests the state of a card, and changing its suit
+        """
+        card = Card('ace', [1, 11])
+        self.assertEqual(str(card), 'ace of None')
+        card.set_suit('heart')
+        self.assertEqual(str(card), 'ace of heart')
+        self.assertListEqual(card.get_values(), [1, 11])
+        with self.assertRaises(ValueError):
+            card.set_suit('joker')
+        self.assertFalse(hasattr(card, '__dict__'))
+
+    def test_interned_cards(self):
+        """
+        Tests that every interned card has the rank, suit and values of its index
+        """
+        self.assertEqual(len(CARDS), 52)
+        self.assertEqual(len(set(map(str, CARDS))), 52)
+        for index, card in enumerate(CARDS):
+            self.assertEqual((card.index, card.rank), (index, index % 13))
+            self.assertIs(get_card(index), card)
+        self.assertEqual(str(CARDS[0]), 'ace of diamond')
+        self.assertEqual(CARDS[0].get_values(), (1, 11))
+        self.assertEqual(str(CARDS[51]), 'king of heart')
+        self.assertEqual(str(GENERIC_CARDS[12]), 'king of None')
+        self.assertIs(get_card(64), GENERIC_CARDS[12])
+        for index in [-1, 65]:
+            with self.assertRaises(ValueError):
+                get_card(index)
+
+    def test_immutable(self):
+        """
+        Tests that interned cards cannot be changed, and that copies are the interned card itself
+        """
+        card = CARDS[13]
+        with self.assertRaises(AttributeError):
+            card.suit = 'heart'
+        with self.assertRaises(ValueError):
+            card.set_suit('heart')
+        self.assertEqual(card.get_suit(), 'spade')
+        self.assertIsInstance(card, Card)
+        self.assertIs(copy.deepcopy(card), card)
+        self.assertIs(pickle.loads(pickle.dumps(card)), card)
+        self.assertIsInstance(pickle.loads(pickle.dumps(card)), InternedCard)
+
+    def test_to_card(self):
+        """
+        Tests that cards are given as is, indices of any integer type give their interned card, and anything else
+        is rejected with a TypeError
+        """
+        card = Card('king', [10])
+        self.assertIs(to_card(card), card)
+        self.assertIs(to_card(0), CARDS[0])
+        self.assertIs(to_card(64), GENERIC_CARDS[12])
+        if np is not None:
+            self.assertIs(to_card(np.int64(13)), CARDS[13])
+            self.assertIs(to_card(np.uint8(52)), GENERIC_CARDS[0])
+        with self.assertRaises(ValueError):
+            to_card(65)
+        for invalid in [None, '3', 3.0, True]:
+            with self.assertRaises(TypeError):
+                to_card(invalid)
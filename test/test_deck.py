@@ -1,5 +1,7 @@
 import unittest
+from random import Random
 from src.Deck import Deck
+from src.Card import CARDS
 
 
 class TestDeck(unittest.TestCase):
@@ -39,3 +41,100 @@ class TestDeck(unittest.TestCase):
         while d.draw():
             curr_num_cards -= 1
             self.assertEqual(sum(d.cards), curr_num_cards)
+
+    def test_draw_unique(self):
+        """
+        This tests whether every card is drawn exactly once, with the suit matching its index
+        """
+        d = Deck()
+        drawn = [d.draw() for _ in range(52)]
+        self.assertIsNone(d.draw())
+        self.assertListEqual(d.cards, [0] * 52)
+        self.assertEqual(len(set(map(str, drawn))), 52)
+        self.assertEqual(sum(1 for card in drawn if card.get_suit() == 'heart'), 13)
+
+    def test_draw_shared_cards(self):
+        """
+        This tests whether decks hand out the same shared card objects rather than copies
+        """
+        a, b = Deck(), Deck()
+        from_a = {str(card): card for card in iter(a.draw, None)}
+        for card in iter(b.draw, None):
+            self.assertIs(from_a[str(card)], card)
+
+    def test_rank_counts(self):
+        """
+        This tests whether the live rank counts match the cards left in the deck after every draw
+        """
+        d = Deck()
+        counts = d.get_rank_counts()
+        self.assertListEqual(list(counts), [4] * 13)
+        while d.draw():
+            expected = [sum(d.cards[rank::13]) for rank in range(13)]
+            self.assertListEqual(list(counts), expected)
+        with self.assertRaises(TypeError):
+            counts[0] = 4
+        d.shuffle()
+        self.assertListEqual(list(counts), [4] * 13)
+
+    def test_running_count(self):
+        """
+        This tests whether the Hi-Lo running count balances out over a full deck, and the true count scales with
+        the cards left
+        """
+        d = Deck()
+        tags = []
+        for _ in range(26):
+            card = d.draw()
+            rank = [c.get_name() for c in d.card_mapping.values()].index(card.get_name())
+            tags.append(d.counting_system[rank])
+        self.assertEqual(d.get_running_count(), sum(tags))
+        self.assertAlmostEqual(d.get_true_count(), sum(tags) * 2)
+        while d.draw():
+            pass
+        self.assertEqual(d.get_running_count(), 0)
+        self.assertEqual(d.get_true_count(), 0)
+        with self.assertRaises(ValueError):
+            Deck(counting_system=(1, 2))
+
+    def test_draw_many(self):
+        """
+        This tests whether drawing cards in a batch gives the same cards and counts as drawing them one by one
+        """
+        a, b = Deck(rng=Random(2)), Deck(rng=Random(2))
+        self.assertListEqual(a.draw_many(0), [])
+        self.assertListEqual(a.draw_many(30), [b.draw() for _ in range(30)])
+        self.assertListEqual(a.cards, b.cards)
+        self.assertListEqual(list(a.get_rank_counts()), list(b.get_rank_counts()))
+        self.assertEqual(a.get_running_count(), b.get_running_count())
+        self.assertTrue(a.can_draw(22))
+        self.assertFalse(a.can_draw(23))
+        self.assertFalse(a.can_draw(-1))
+        with self.assertRaises(ValueError):
+            a.draw_many(23)
+        with self.assertRaises(ValueError):
+            a.draw_many(-1)
+        self.assertEqual(len(a.draw_many(22)), 22)
+        self.assertIsNone(a.draw())
+
+    def test_draw_index(self):
+        """
+        This tests whether cards can be drawn as indices of the interned cards, in the same order as Cards
+        """
+        a, b = Deck(rng=Random(8)), Deck(rng=Random(8))
+        self.assertListEqual([CARDS[a.draw_index()] for _ in range(10)], [b.draw() for _ in range(10)])
+        self.assertListEqual([CARDS[i] for i in a.draw_many_indices(42)], b.draw_many(42))
+        self.assertIsNone(a.draw_index())
+        self.assertListEqual(a.cards, [0] * 52)
+
+    def test_rng(self):
+        """
+        This tests whether decks shuffled by equally seeded RNGs deal the same cards, across reshuffles
+        """
+        a, b = Deck(rng=Random(5)), Deck(rng=Random(5))
+        for _ in range(2):
+            self.assertListEqual(list(iter(a.draw, None)), list(iter(b.draw, None)))
+            a.shuffle()
+            b.shuffle()
+        c = Deck(rng=Random(6))
+        self.assertNotEqual([a.draw() for _ in range(52)], [c.draw() for _ in range(52)])
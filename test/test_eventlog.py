@@ -0,0 +1,133 @@
+import os
+import random
+import tempfile
+import unittest
+from src.EventLog import EventLog, EventLogReader, Event, encode_card, decode_card, replay_game, \
+    DEAL, STAY, GAME_OVER, NO_CARD, RECORD
+from src.Deck import SUITED_CARDS
+from src.Card import Card
+from src.Game import Game
+from src.Shoe import Shoe
+
+
+class TestEventLog(unittest.TestCase):
+    """
+    This class tests the EventLog and EventLogReader classes
+    """
+
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp()
+        os.close(fd)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_card_encoding(self):
+        """
+        Tests that suited cards encode to 0-51 and generic cards to 52-64, and that both decode back
+        """
+        for i, card in enumerate(SUITED_CARDS):
+            self.assertEqual(encode_card(card), i)
+            self.assertIs(decode_card(i), card)
+        self.assertEqual(encode_card(Card('ace', [1, 11])), 52)
+        self.assertEqual(encode_card(Card('king', [10])), 64)
+        self.assertEqual(decode_card(64).get_name(), 'king')
+        self.assertIsNone(decode_card(NO_CARD))
+        with self.assertRaises(ValueError):
+            encode_card(Card('joker', [0]))
+        with self.assertRaises(ValueError):
+            decode_card(65)
+
+    def test_records(self):
+        """
+        Tests that records are fixed-width, and read back in order
+        """
+        with EventLog(self.path) as log:
+            game_id = log.start_game()
+            log.append(game_id, DEAL, 0, 5)
+            log.append(game_id, STAY, 0)
+        self.assertEqual(os.path.getsize(self.path), 2 * RECORD.size)
+        with EventLogReader(self.path) as reader:
+            self.assertEqual(len(reader), 2)
+            self.assertListEqual(list(reader), [Event(0, 0, DEAL, 5), Event(0, 0, STAY, NO_CARD)])
+            self.assertEqual(reader[-1], Event(0, 0, STAY, NO_CARD))
+            with self.assertRaises(IndexError):
+                reader[2]
+
+    def test_empty_and_invalid(self):
+        """
+        Tests reading an empty log, and rejecting a file that is not a whole number of records
+        """
+        with EventLogReader(self.path) as reader:
+            self.assertEqual(len(reader), 0)
+            self.assertListEqual(list(reader.iter_games()), [])
+        with open(self.path, 'wb') as f:
+            f.write(b'abc')
+        with self.assertRaises(ValueError):
+            EventLogReader(self.path)
+
+    def test_append_continues_game_ids(self):
+        """
+        Tests that reopening a log continues after its highest game id, even if it is not in the last record
+        """
+        with EventLog(self.path) as log:
+            log.append(log.start_game(), STAY, 0)
+            log.append(log.start_game(), STAY, 0)
+        with EventLog(self.path) as log:
+            game_id = log.start_game()
+            self.assertEqual(game_id, 2)
+            log.append(game_id, STAY, 0)
+            log.append(1, STAY, 0)  # the last record is of a game that ends after a later one started
+        with EventLog(self.path) as log:
+            self.assertEqual(log.start_game(), 3)
+
+    def test_shared_log(self):
+        """
+        Tests that two games writing to the same log in alternation are each replayed whole
+        """
+        with EventLog(self.path) as log:
+            games = [Game(['A', 'B'], pre_deal=True, event_log=log) for _ in range(2)]
+            for _ in range(2):
+                for game in games:
+                    game.stay()
+            winners = [[hand.get_name() for hand in game.hands].index(game.get_winner()) for game in games]
+            cards = [[list(hand.get_cards()) for hand in game.hands] for game in games]
+        with EventLogReader(self.path) as reader:
+            replayed = list(reader.iter_games())
+            self.assertListEqual([game_id for game_id, _ in replayed], [0, 1])
+            self.assertListEqual([len(events) for _, events in replayed], [7, 7])  # 4 deals, 2 stays, game over
+            self.assertListEqual(reader.index_games()[1], [4, 5, 6, 7, 9, 12, 13])
+            for (game_id, events), expected_cards, expected_winner in zip(replayed, cards, winners):
+                self.assertTrue(all(event.game_id == game_id for event in events))
+                replayed_cards, _, winner = replay_game(events)
+                self.assertListEqual([replayed_cards[i] for i in range(2)], expected_cards)
+                self.assertEqual(winner, expected_winner)
+
+    def test_game_replay(self):
+        """
+        Tests that replaying the logged games gives back the cards, busts and winner of every round
+        """
+        random.seed(3)
+        expected = []
+        with EventLog(self.path) as log:
+            game = Game(['A', 'B', 'C'], pre_deal=True, deck=Shoe(2), event_log=log)
+            for i in range(20):
+                if i > 0:
+                    game.new_round()
+                while not game.is_game_over():
+                    if game.get_current_hand().get_best_score() < 17:
+                        game.hit()
+                    else:
+                        game.stay()
+                busted = {i for i, hand in enumerate(game.hands) if hand.is_bust()}
+                winner = [hand.get_name() for hand in game.hands].index(game.get_winner())
+                expected.append(([list(hand.get_cards()) for hand in game.hands], busted, winner))
+        with EventLogReader(self.path) as reader:
+            games = list(reader.iter_games())
+            self.assertListEqual([game_id for game_id, _ in games], list(range(20)))
+            for (_, events), (cards, busted, winner) in zip(games, expected):
+                self.assertEqual(events[-1].event, GAME_OVER)
+                replayed_cards, replayed_busted, replayed_winner = replay_game(events)
+                self.assertListEqual([replayed_cards[i] for i in range(3)], cards)
+                self.assertSetEqual(replayed_busted, busted)
+                self.assertEqual(replayed_winner, winner)
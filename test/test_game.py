@@ -1,6 +1,11 @@
+import os
+import tempfile
 import unittest
-from src.Card import Card
+from random import Random
+from src.Card import Card, CARDS
+from src.EventLog import EventLog
 from src.Game import Game
+from src.Shoe import Shoe
 
 class TestGame(unittest.TestCase):
     """
@@ -17,6 +22,15 @@ class TestGame(unittest.TestCase):
         except ValueError:
             self.assertTrue(True)
 
+    def test_duplicate_names(self):
+        """
+        Tests that players cannot share a name, as ranks are looked up by name
+        """
+        with self.assertRaises(ValueError):
+            Game(['bob', 'jane', 'bob'])
+        g = Game(['bob', 'Bob'])
+        self.assertEqual(len(g.hands_by_name), 2)
+
     def test_singleplayer(self):
         """
         Tests a simple single-player game of blackjack
@@ -91,4 +105,158 @@ class TestGame(unittest.TestCase):
         # get the winner
         self.assertListEqual(g.get_rankings(), ['katy', 'joe', 'jane', 'bob'])
 
+    def test_max_players(self):
+        """
+        Tests that a single deck seats at most 26 players, while a multi-deck shoe seats more
+        """
+        names = ['Player {0}'.format(i) for i in range(27)]
+        with self.assertRaises(ValueError):
+            Game(names)
+        g = Game(names, True, Shoe(num_decks=2))
+        self.assertTrue(all(len(hand.get_cards()) == 2 for hand in g.hands))
+        g = Game(names[:26], True)  # the deal takes the whole deck
+        self.assertTrue(all(len(hand.get_cards()) == 2 for hand in g.hands))
+        self.assertEqual(g.deck.get_num_remaining(), 0)
+        self.assertEqual(len(set(str(card) for hand in g.hands for card in hand.get_cards())), 52)
+        with self.assertRaises(ValueError):
+            g.new_round()  # a single deck is not reshuffled between rounds
+
+    def test_deck_runs_low(self):
+        """
+        Tests that a new round on a plain deck without enough cards left for the deal fails before changing the game
+        """
+        with tempfile.TemporaryDirectory() as directory, EventLog(os.path.join(directory, 'games.log')) as log:
+            g = Game(['bob', 'jane', 'joe'], True, event_log=log)
+            for _ in range(7):  # 8 deals of 6 cards leave 4 cards in the deck
+                while not g.is_game_over():
+                    g.stay()
+                g.new_round()
+            self.assertEqual(g.deck.get_num_remaining(), 4)
+            g.stay()
+            hands = [list(hand.get_cards()) for hand in g.hands]
+            game_id, next_game_id = g.game_id, log.next_game_id
+            for _ in range(3):
+                with self.assertRaises(ValueError):
+                    g.new_round()
+                self.assertListEqual([list(hand.get_cards()) for hand in g.hands], hands)
+                self.assertEqual(g.get_current_player_name(), 'jane')
+                self.assertEqual(g.get_leader(), 'bob')
+                self.assertEqual((g.game_id, log.next_game_id), (game_id, next_game_id))
+                self.assertEqual(g.deck.get_num_remaining(), 4)
+            g.hit()  # the round in progress can still be played out
+            self.assertEqual(g.deck.get_num_remaining(), 3)
 
+    def test_new_round(self):
+        """
+        Tests that a new round resets the hands and turns while continuing to draw from the same deck
+        """
+        shoe = Shoe(num_decks=1, cut_card=40)
+        g = Game(['bob', 'jane'], True, shoe)
+        hands = list(g.hands)
+        g.stay()
+        g.stay()
+        self.assertTrue(g.is_game_over())
+        g.new_round()
+        self.assertFalse(g.is_game_over())
+        self.assertEqual(g.get_current_player_name(), 'bob')
+        self.assertListEqual(g.hands, hands)
+        self.assertTrue(all(len(hand.get_cards()) == 2 for hand in g.hands))
+        self.assertEqual(shoe.get_num_drawn(), 8)
+        for _ in range(10):  # the shoe is reshuffled once the cut card is reached
+            g.new_round()
+        self.assertLess(shoe.get_num_drawn(), 40)
+
+    def test_hit_index(self):
+        """
+        Tests hitting with the indices of interned cards, including index 0 (the ace of diamonds)
+        """
+        g = Game(['bob', 'jane'])
+        self.assertTrue(g.hit(0))
+        self.assertTrue(g.hit(12))  # king of diamonds
+        self.assertEqual(g.get_current_hand().get_best_score(), 21)
+        self.assertIs(g.get_current_hand().get_cards()[0], CARDS[0])
+        with self.assertRaises(ValueError):
+            g.hit(99)
+        with self.assertRaises(TypeError):
+            g.hit('king')
+        self.assertEqual(len(g.get_current_hand().get_cards()), 2)
+        g.stay()
+        self.assertEqual(g.get_rank('bob'), 1)
+
+    def test_ties_ranked_by_seat(self):
+        """
+        Tests that players with the same score are ranked by seat, for every mix of tied and untied scores
+        """
+        king, queen, nine = Card('king', [10]), Card('queen', [10]), Card('nine', [9])
+        names = ['p0', 'p1', 'p2', 'p3', 'p4']
+        for mask in range(32):  # each player stays on either 20 or 19
+            g = Game(names)
+            scores = []
+            for i in range(5):
+                g.hit(king)
+                g.hit(queen if mask >> i & 1 else nine)
+                scores.append(20 if mask >> i & 1 else 19)
+                g.stay()
+            expected = sorted(names, key=lambda name: (-scores[names.index(name)], names.index(name)))
+            self.assertListEqual(g.get_rankings(), expected)
+            self.assertEqual(g.get_winner(), expected[0])
+
+    def test_rng(self):
+        """
+        Tests that games given equally seeded RNGs deal the same cards, and that an RNG cannot come with a deck
+        """
+        a, b = Game(['bob', 'jane'], True, rng=Random(9)), Game(['bob', 'jane'], True, rng=Random(9))
+        self.assertListEqual([h.get_cards() for h in a.hands], [h.get_cards() for h in b.hands])
+        with self.assertRaises(ValueError):
+            Game(['bob'], deck=Shoe(), rng=Random(9))
+
+    def test_top_k(self):
+        """
+        Tests the lazy rankings, and that they are only available once the game is over
+        """
+        g = Game(['bob', 'jane', 'joe'])
+        king = Card('king', [10])
+        five = Card('five', [5])
+        with self.assertRaises(ValueError):
+            g.top_k(1)
+        with self.assertRaises(ValueError):
+            g.get_winner()
+        g.hit(five)
+        g.stay()
+        g.hit(king)
+        g.hit(king)
+        g.stay()
+        g.hit(king)
+        g.stay()
+        self.assertListEqual(g.top_k(2), ['jane', 'joe'])
+        self.assertListEqual(list(g.iter_rankings()), ['jane', 'joe', 'bob'])
+        self.assertEqual(g.get_winner(), 'jane')
+
+    def test_live_standings(self):
+        """
+        Tests the leader and ranks of the players while the game is in progress
+        """
+        g = Game(['bob', 'jane', 'joe'])
+        king = Card('king', [10])
+        five = Card('five', [5])
+        with self.assertRaises(ValueError):
+            g.get_leader()
+        with self.assertRaises(ValueError):
+            g.get_rank('katy')
+        g.hit(king)
+        g.hit(five)
+        g.stay()  # bob --> 15
+        self.assertEqual(g.get_leader(), 'bob')
+        self.assertEqual(g.get_rank('bob'), 1)
+        self.assertEqual(g.get_rank('jane'), 2)  # empty hand
+        g.hit(king)
+        g.hit(king)
+        self.assertEqual(g.get_rank('jane'), 1)  # in progress with 20
+        g.stay()
+        self.assertEqual(g.get_leader(), 'jane')
+        self.assertEqual(g.get_rank('bob'), 2)
+        g.hit(king)
+        g.hit(king)
+        self.assertFalse(g.hit(king))  # joe --> bust
+        self.assertEqual(g.get_rank('joe'), 3)
+        self.assertListEqual(g.get_rankings(), ['jane', 'bob', 'joe'])
@@ -0,0 +1,185 @@
+import asyncio
+import unittest
+from src.GameServer import GameServer, LoadGenerator, Session, parse_status, percentile
+
+
+class TestGameServer(unittest.TestCase):
+    """
+    This class tests the GameServer class
+    """
+
+    def test_join(self):
+        """
+        Tests joining tables, including joining twice, duplicate names, and commands before joining
+        """
+        server = GameServer()
+        bob, jane, other = Session(), Session(), Session()
+        self.assertTrue(server.respond(other, 'CHECK').startswith('ERR'))
+        self.assertTrue(server.respond(other, 'FOLD').startswith('ERR'))
+        self.assertEqual(server.respond(bob, 'JOIN t1 bob'), 'OK joined t1 as bob')
+        self.assertTrue(server.respond(bob, 'JOIN t2 bob').startswith('ERR'))
+        self.assertTrue(server.respond(jane, 'JOIN t1 bob').startswith('ERR'))
+        self.assertTrue(server.respond(jane, 'join t1 jane').startswith('OK'))
+        self.assertListEqual(server.tables['t1'].player_names, ['bob', 'jane'])
+
+    def test_turns(self):
+        """
+        Tests that players can only act on their own turn, and that the rankings are given once the game is over
+        """
+        server = GameServer()
+        bob, jane, late = Session(), Session(), Session()
+        server.respond(bob, 'JOIN t1 bob')
+        server.respond(jane, 'JOIN t1 jane')
+        status = parse_status(server.execute(jane, 'CHECK'))
+        self.assertEqual(status['turn'], 'bob')
+        self.assertEqual(len(status['cards'].split(',')), 2)  # pre-dealt
+        self.assertTrue(server.respond(late, 'JOIN t1 joe').startswith('ERR'))  # game has started
+        self.assertTrue(server.respond(jane, 'STAY').startswith('ERR'))
+        self.assertTrue(server.respond(bob, 'RANKINGS').startswith('ERR'))
+        self.assertEqual(parse_status(server.execute(bob, 'STAY'))['turn'], 'jane')
+        self.assertEqual(parse_status(server.execute(jane, 'STAY'))['turn'], 'over')
+        self.assertSetEqual(set(server.execute(bob, 'RANKINGS').split(',')), {'bob', 'jane'})
+
+    def test_full_table(self):
+        """
+        Tests that a table seats at most as many players as a single deck can deal to
+        """
+        server = GameServer()
+        sessions = [Session() for _ in range(27)]
+        for i, session in enumerate(sessions[:26]):
+            self.assertTrue(server.respond(session, 'JOIN t1 p{0}'.format(i)).startswith('OK'))
+        self.assertEqual(server.respond(sessions[26], 'JOIN t1 p26'), 'ERR Table t1 is full')
+        server.leave(sessions[0])
+        self.assertTrue(server.respond(sessions[26], 'JOIN t1 p26').startswith('OK'))
+        self.assertEqual(parse_status(server.execute(sessions[26], 'CHECK'))['turn'], 'p1')
+
+    def test_leave(self):
+        """
+        Tests that a player who leaves frees their seat before the game starts, and stays on their turns after
+        """
+        server = GameServer()
+        bob, jane, joe = Session(), Session(), Session()
+        server.respond(bob, 'JOIN t1 bob')
+        server.respond(jane, 'JOIN t1 jane')
+        server.leave(bob)
+        self.assertListEqual(server.tables['t1'].player_names, ['jane'])
+        self.assertIsNone(bob.table)
+        server.leave(jane)
+        self.assertNotIn('t1', server.tables)  # closed, as everyone left
+        for session, name in [(bob, 'bob'), (jane, 'jane'), (joe, 'joe')]:
+            server.respond(session, 'JOIN t1 {0}'.format(name))
+        self.assertEqual(parse_status(server.execute(joe, 'CHECK'))['turn'], 'bob')
+        server.leave(jane)
+        self.assertEqual(parse_status(server.execute(bob, 'STAY'))['turn'], 'joe')  # jane is stood
+        server.leave(joe)
+        self.assertEqual(parse_status(server.execute(bob, 'CHECK'))['turn'], 'over')
+        self.assertSetEqual(set(server.execute(bob, 'RANKINGS').split(',')), {'bob', 'jane', 'joe'})
+        self.assertIn('t1', server.tables)  # bob is still at the finished table
+        server.leave(bob)
+        server.leave(bob)  # leaving twice does nothing
+        self.assertNotIn('t1', server.tables)
+
+    def test_reuse_table_name(self):
+        """
+        Tests that the name of a table is freed for a new game once everyone at its finished game has left, and
+        that the new table deals from a different RNG stream
+        """
+        server = GameServer(seed=1)
+        bob, jane = Session(), Session()
+        server.respond(bob, 'JOIN t1 bob')
+        first_table = server.tables['t1']
+        first = parse_status(server.execute(bob, 'STAY'))
+        self.assertEqual(first['turn'], 'over')
+        self.assertTrue(server.respond(jane, 'JOIN t1 jane').startswith('ERR'))  # bob has not left yet
+        server.leave(bob)
+        self.assertEqual(server.respond(bob, 'JOIN t1 bob'), 'OK joined t1 as bob')
+        self.assertEqual(server.respond(jane, 'JOIN t1 jane'), 'OK joined t1 as jane')
+        self.assertIsNot(server.tables['t1'], first_table)
+        second = parse_status(server.execute(jane, 'CHECK'))
+        self.assertEqual(second['turn'], 'bob')
+        self.assertNotEqual(parse_status(server.execute(bob, 'CHECK'))['cards'], first['cards'])
+
+    def test_blank_player_name(self):
+        """
+        Tests that a player name must not be blank
+        """
+        server = GameServer()
+        session = Session()
+        for line in ['JOIN t1 ', 'JOIN t1   ', 'JOIN t1']:
+            self.assertEqual(server.respond(session, line), 'ERR Usage: JOIN <table> <player>')
+        self.assertDictEqual(server.tables, {})
+        self.assertTrue(server.respond(session, 'JOIN t1 bob').startswith('OK'))
+
+    def test_disconnect(self):
+        """
+        Tests that invalid UTF-8 is answered with an error, and that a client disconnecting mid-game over TCP does
+        not stall the table
+        """
+        async def send(reader, writer, line: bytes):
+            writer.write(line + b'\n')
+            await writer.drain()
+            return (await reader.readline()).decode().strip()
+
+        async def run():
+            server = GameServer()
+            await server.start()
+            bob = await asyncio.open_connection(server.host, server.port)
+            jane = await asyncio.open_connection(server.host, server.port)
+            responses = [await send(*bob, b'\xff\xfe'), await send(*bob, b'JOIN t1 bob'),
+                         await send(*jane, b'JOIN t1 jane'), await send(*jane, b'CHECK')]
+            bob[1].close()
+            turn = parse_status(responses[-1][3:])['turn']
+            for _ in range(100):  # wait for the server to notice the disconnection
+                if turn == 'jane':
+                    break
+                await asyncio.sleep(0.01)
+                turn = parse_status((await send(*jane, b'CHECK'))[3:])['turn']
+            await server.close()  # closes jane's connection, and waits for every handler to finish
+            eof = await jane[0].read()
+            jane[1].close()
+            return responses, turn, eof, server
+        responses, turn, eof, server = asyncio.run(run())
+        self.assertEqual(eof, b'')
+        self.assertDictEqual(server.connections, {})
+        self.assertDictEqual(server.tables, {})
+        self.assertEqual(responses[0], 'ERR Commands must be UTF-8 text')
+        self.assertTrue(all(response.startswith('OK') for response in responses[1:]))
+        self.assertEqual(turn, 'jane')
+
+    def test_tables_isolated(self):
+        """
+        Tests that playing at one table does not affect another
+        """
+        server = GameServer()
+        a, b = Session(), Session()
+        server.respond(a, 'JOIN t1 bob')
+        server.respond(b, 'JOIN t2 bob')
+        server.execute(a, 'STAY')
+        self.assertEqual(parse_status(server.execute(b, 'CHECK'))['turn'], 'bob')
+
+    def test_percentile(self):
+        """
+        Tests nearest-rank percentiles
+        """
+        values = list(range(1, 101))
+        self.assertEqual(percentile(values, 0.5), 50)
+        self.assertEqual(percentile(values, 0.99), 99)
+        self.assertEqual(percentile([7], 0.99), 7)
+        with self.assertRaises(ValueError):
+            percentile([], 0.5)
+
+    def test_load(self):
+        """
+        Tests that the load generator plays every table to the end over TCP
+        """
+        async def run():
+            server = GameServer()
+            await server.start()
+            report = await LoadGenerator(server.host, server.port, num_tables=20, players_per_table=2).run()
+            await server.close()
+            return server, report
+        server, report = asyncio.run(run())
+        self.assertDictEqual(server.tables, {})  # every table was closed as its players left
+        self.assertDictEqual(server.connections, {})
+        self.assertGreaterEqual(report['commands'], 20 * 2 * 4)
+        self.assertLessEqual(report['p50_ms'], report['p99_ms'])
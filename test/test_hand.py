@@ -1,6 +1,7 @@
 import unittest
-from src.Hand import Hand
-from src.Card import Card
+from src.Hand import Hand, SCORE_TABLE, MAX_TABLE_TOTAL, lookup_score
+from src.Card import Card, CARDS, GENERIC_CARDS
+from src.Deck import Deck
 from src.BinaryTree import BinaryTreeNode, BinaryTree
 
 class TestHand(unittest.TestCase):
@@ -170,5 +171,142 @@ class TestHand(unittest.TestCase):
         h.add_card(card2)
         self.assertEqual(h.get_priority(), -31)
 
+    def test_possible_scores_deduplicated(self):
+        """
+        Tests that the possible scores of a hand with multiple aces are distinct
+        """
+        h = Hand()
+        ace = Card('ace', [1, 11])
+        h.add_card(ace)
+        h.add_card(ace)
+        self.assertListEqual(list(h.get_possible_scores()), [2, 12, 22])
+        self.assertEqual(h.get_best_score(), 12)
+        h.add_card(Card('nine', [9]))
+        self.assertEqual(h.get_best_score(), 21)
+        self.assertTrue(h.has_blackjack())
+
+    def test_tree_built_on_request(self):
+        """
+        Tests that the BinaryTree view is built from the cards already in the hand, and kept up to date after
+        """
+        h = Hand()
+        card1 = Card('ace', [1, 11])
+        card2 = Card('king', [10])
+        h.add_card(card1)
+        expected_tree = BinaryTree(BinaryTreeNode(0, BinaryTreeNode(1), BinaryTreeNode(11)))
+        self.assertTrue(h.hands.is_equivalent(expected_tree))
+        h.add_card(card2)
+        expected_tree = BinaryTree(BinaryTreeNode(0, BinaryTreeNode(1, BinaryTreeNode(11)), BinaryTreeNode(11, BinaryTreeNode(21))))
+        self.assertTrue(h.hands.is_equivalent(expected_tree))
+
+    def test_add_card_index(self):
+        """
+        Tests that cards can be added as indices of the interned cards
+        """
+        h = Hand()
+        h.add_card(0)  # ace of diamonds
+        h.add_card(64)  # generic king
+        self.assertTrue(h.has_blackjack())
+        self.assertListEqual(list(h.get_cards()), [CARDS[0], GENERIC_CARDS[12]])
+        self.assertEqual(str(h.get_most_recent_card()), 'king of None')
+        with self.assertRaises(ValueError):
+            h.add_card(65)
+        for invalid in [None, 'ace']:
+            with self.assertRaises(TypeError):
+                h.add_card(invalid)
+        self.assertEqual(len(h.get_cards()), 2)
+
+    def test_add_card_invalid_values(self):
+        """
+        Tests that cards whose values are not a single value, or a low and a high value 10 apart, are rejected
+        """
+        h = Hand()
+        for values in [[11, 1], [1, 5], [1, 11, 21], []]:
+            with self.assertRaises(ValueError):
+                h.add_card(Card('ace', values))
+        self.assertEqual(len(h.get_cards()), 0)
+        self.assertEqual(h.get_best_score(), 0)
+        h.add_card(Card('ace', (1, 11)))
+        self.assertEqual(h.get_best_score(), 11)
+
+    def test_clear(self):
+        """
+        Tests that clearing a hand returns it to the state of an empty hand
+        """
+        h = Hand('bob')
+        h.add_card(Card('ace', [1, 11]))
+        h.add_card(Card('king', [10]))
+        h.clear()
+        self.assertEqual(h.get_name(), 'bob')
+        self.assertListEqual(list(h.get_possible_scores()), [0])
+        self.assertListEqual(list(h.get_cards()), [])
+        self.assertEqual(h.hands.root.val, 0)
+        self.assertFalse(h.hands.root.has_children())
 
+    def test_score_table(self):
+        """
+        Tests that every score lookup agrees with the possible scores of the hand
+        """
+        self.assertEqual(len(SCORE_TABLE), MAX_TABLE_TOTAL + 1)
+        for hard_total in range(45):
+            for soft_aces in range(min(hard_total, 4) + 1):
+                scores = [hard_total + 10 * i for i in range(soft_aces + 1)]
+                non_bust = [score for score in scores if score <= 21]
+                entry = lookup_score(hard_total, soft_aces)
+                self.assertEqual(entry.is_bust, not non_bust)
+                self.assertEqual(entry.best_score, max(non_bust) if non_bust else min(scores))
+                self.assertEqual(entry.is_soft, entry.best_score != hard_total)
+                self.assertEqual(entry.priority, -entry.best_score if entry.is_bust else entry.best_score)
 
+    def test_is_soft(self):
+        """
+        Tests whether a hand is soft only while one of its aces counts as 11
+        """
+        h = Hand()
+        h.add_card(Card('ace', [1, 11]))
+        self.assertTrue(h.is_soft())
+        h.add_card(Card('six', [6]))
+        self.assertTrue(h.is_soft())
+        h.add_card(Card('king', [10]))
+        self.assertFalse(h.is_soft())
+        self.assertEqual(h.get_best_score(), 17)
+
+    def test_hit_outcome(self):
+        """
+        Tests the bust probability and score distribution of one more hit against a deck
+        """
+        d = Deck()
+        h = Hand()
+        h.add_card(Card('king', [10]))
+        h.add_card(Card('six', [6]))
+        outcome = h.get_hit_outcome(d)
+        self.assertAlmostEqual(outcome.bust_probability, 32 / 52)  # sixes and up
+        self.assertAlmostEqual(outcome.score_distribution[17], 4 / 52)  # aces
+        self.assertAlmostEqual(outcome.score_distribution[26], 16 / 52)  # tens and face cards
+        self.assertAlmostEqual(sum(outcome.score_distribution.values()), 1.0)
+        soft = Hand()
+        soft.add_card(Card('ace', [1, 11]))
+        soft.add_card(Card('six', [6]))
+        self.assertEqual(soft.get_hit_outcome(d).bust_probability, 0)
+        while d.draw():
+            pass
+        with self.assertRaises(ValueError):
+            h.get_hit_outcome(d)
+
+    def test_hit_outcome_matches_draws(self):
+        """
+        Tests the hit outcome against adding every card left in a partly drawn deck
+        """
+        d = Deck()
+        h = Hand()
+        for _ in range(3):
+            h.add_card(d.draw())
+        outcome = h.get_hit_outcome(d)
+        remaining = [card for card in iter(d.draw, None)]
+        busts = 0
+        for card in remaining:
+            trial = Hand()
+            for c in list(h.get_cards()) + [card]:
+                trial.add_card(c)
+            busts += trial.is_bust()
+        self.assertAlmostEqual(outcome.bust_probability, busts / len(remaining))
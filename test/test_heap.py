@@ -11,11 +11,13 @@ class HeapTestClass(object):
         Constructor
         """
         self.val = val
+        self.priority_calls = 0
 
     def get_priority(self):
         """
         :return: the value of self
         """
+        self.priority_calls += 1
         return self.val
 
 
@@ -163,5 +165,65 @@ class TestHeap(unittest.TestCase):
         self.assertEqual(item2, h.findMax())
         self.assertListEqual(h.heap_arr, [item2, item1])
 
+    def test_priority_computed_once(self):
+        """
+        Tests that the priority of each item is only computed when it enters the MaxHeap
+        """
+        items = [HeapTestClass(i % 7) for i in range(50)]
+        h = MaxHeap(len(items), items)
+        extra = HeapTestClass(3)
+        h.insert(extra)
+        removed = [h.removeMax() for _ in range(51)]
+        self.assertListEqual([item.val for item in removed], sorted([item.val for item in items + [extra]], reverse=True))
+        self.assertTrue(all(item.priority_calls == 1 for item in items + [extra]))
 
-
+    def test_refresh(self):
+        """
+        Tests that refreshing an item whose priority changed moves it to its new position
+        """
+        items = [HeapTestClass(i) for i in range(1, 6)]
+        h = MaxHeap(6)
+        for item in items:
+            h.insert(item)
+        items[0].val = 10  # lowest --> highest
+        h.refresh(items[0])
+        self.assertEqual(items[0], h.findMax())
+        items[0].val = 0  # highest --> lowest
+        h.refresh(items[0])
+        removed = [h.removeMax() for _ in range(5)]
+        self.assertListEqual([item.val for item in removed], [5, 4, 3, 2, 0])
+        with self.assertRaises(ValueError):
+            h.refresh(items[0])
+
+    def test_insert_grows(self):
+        """
+        Tests that inserting beyond the initial capacity (including no capacity) resizes the MaxHeap
+        """
+        for capacity in [0, 1, 2]:
+            h = MaxHeap(capacity)
+            for i in range(10):
+                h.insert(HeapTestClass(i))
+            self.assertEqual(h.size, 10)
+            self.assertEqual(h.findMax().val, 9)
+
+    def test_ranked(self):
+        """
+        Tests that iterating the ranked items yields them in order without emptying the MaxHeap
+        """
+        items = [HeapTestClass(i) for i in [3, 1, 4, 1, 5, 9, 2, 6]]
+        h = MaxHeap(len(items), items)
+        arr = list(h.heap_arr)
+        self.assertListEqual([item.val for item in h.ranked()], [9, 6, 5, 4, 3, 2, 1, 1])
+        self.assertEqual(h.size, 8)
+        self.assertListEqual(h.heap_arr, arr)
+
+    def test_top_k(self):
+        """
+        Tests the top k items, including asking for more items than the MaxHeap holds
+        """
+        items = [HeapTestClass(i) for i in [3, 1, 4, 1, 5]]
+        h = MaxHeap(len(items), items)
+        self.assertListEqual([item.val for item in h.top_k(2)], [5, 4])
+        self.assertEqual(len(h.top_k(10)), 5)
+        self.assertListEqual(h.top_k(0), [])
+        self.assertEqual(h.findMax().val, 5)
@@ -0,0 +1,111 @@
+import unittest
+from random import Random
+from src.IndexedMaxHeap import IndexedMaxHeap
+
+
+class HeapTestClass(object):
+    """
+    Simple test class with a changeable priority to use in unit tests for IndexedMaxHeap
+    """
+    def __init__(self, val):
+        """
+        Constructor
+        """
+        self.val = val
+
+    def get_priority(self):
+        """
+        :return: the value of self
+        """
+        return self.val
+
+
+class TestIndexedHeap(unittest.TestCase):
+    """
+    This class tests the IndexedMaxHeap class
+    """
+
+    def test_insert_remove_max(self):
+        """
+        Tests that items are removed in order of priority
+        """
+        h = IndexedMaxHeap()
+        for val in [3, 1, 4, 1, 5, 9, 2, 6]:
+            h.insert(HeapTestClass(val))
+        self.assertEqual(h.findMax().val, 9)
+        self.assertListEqual([h.removeMax().val for _ in range(8)], [9, 6, 5, 4, 3, 2, 1, 1])
+        self.assertTrue(h.isEmpty())
+        with self.assertRaises(ValueError):
+            h.removeMax()
+
+    def test_handles(self):
+        """
+        Tests that handles identify their items until the items are removed
+        """
+        h = IndexedMaxHeap()
+        a, b = HeapTestClass(1), HeapTestClass(2)
+        handle_a, handle_b = h.insert(a), h.insert(b)
+        self.assertNotEqual(handle_a, handle_b)
+        self.assertTrue(h.contains(handle_a))
+        self.assertIs(h.get(handle_a), a)
+        self.assertIs(h.remove(handle_a), a)
+        self.assertFalse(h.contains(handle_a))
+        with self.assertRaises(ValueError):
+            h.remove(handle_a)
+        with self.assertRaises(ValueError):
+            h.update(handle_a)
+        self.assertIs(h.findMax(), b)
+
+    def test_update(self):
+        """
+        Tests that updating an item whose priority changed moves it up or down the MaxHeap
+        """
+        h = IndexedMaxHeap()
+        items = [HeapTestClass(i) for i in range(10)]
+        handles = [h.insert(item) for item in items]
+        items[0].val = 100
+        h.update(handles[0])
+        self.assertIs(h.findMax(), items[0])
+        items[0].val = -1
+        h.update(handles[0])
+        self.assertListEqual([item.val for item in h.ranked()], [9, 8, 7, 6, 5, 4, 3, 2, 1, -1])
+        self.assertEqual(h.size, 10)
+
+    def test_ties(self):
+        """
+        Tests that items of equal priority come out in order of insertion, even after updates and removals
+        """
+        h = IndexedMaxHeap()
+        items = [HeapTestClass(v) for v in [5, 7, 5, 5, 7, 5]]
+        handles = [h.insert(item) for item in items]
+        self.assertListEqual(list(h.ranked()), [items[1], items[4], items[0], items[2], items[3], items[5]])
+        items[3].val = 7
+        h.update(handles[3])
+        h.remove(handles[2])
+        self.assertListEqual(list(h.ranked()), [items[1], items[3], items[4], items[0], items[5]])
+        self.assertEqual(h.size, 5)  # ranked leaves the MaxHeap unchanged
+
+    def test_random_operations(self):
+        """
+        Tests a long random sequence of inserts, updates, and removals against a sorted reference
+        """
+        rng = Random(0)
+        h = IndexedMaxHeap()
+        live = {}
+        for _ in range(2000):
+            op = rng.random()
+            if op < 0.4 or not live:
+                item = HeapTestClass(rng.randint(-50, 50))
+                live[h.insert(item)] = item
+            elif op < 0.7:
+                handle = rng.choice(list(live))
+                live[handle].val = rng.randint(-50, 50)
+                h.update(handle)
+            elif op < 0.9:
+                handle = rng.choice(list(live))
+                self.assertIs(h.remove(handle), live.pop(handle))
+            else:
+                self.assertEqual(h.removeMax().val, max(item.val for item in live.values()))
+                live = {handle: item for handle, item in live.items() if h.contains(handle)}
+            self.assertEqual(h.size, len(live))
+        self.assertListEqual([item.val for item in h.ranked()], sorted([item.val for item in live.values()], reverse=True))
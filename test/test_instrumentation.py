@@ -0,0 +1,81 @@
+import json
+import unittest
+from src.Instrumentation import metrics, TimingHistogram
+from src.Card import Card
+from src.Game import Game
+from src.Hand import Hand
+
+
+class TestInstrumentation(unittest.TestCase):
+    """
+    This class tests the Metrics collected across the hot paths
+    """
+
+    def setUp(self):
+        """
+        Starts every test with no metrics collected
+        """
+        metrics.reset()
+
+    def tearDown(self):
+        """
+        Leaves metrics disabled and empty for other tests
+        """
+        metrics.disable()
+        metrics.reset()
+
+    def test_disabled(self):
+        """
+        Tests that nothing is collected while metrics are disabled
+        """
+        g = Game(['bob', 'jane'], True)
+        g.stay()
+        g.stay()
+        g.get_rankings()
+        self.assertDictEqual(metrics.snapshot(), {'counters': {}, 'timings': {}})
+
+    def test_game_counters(self):
+        """
+        Tests the counters and timings collected over a game
+        """
+        metrics.enable()
+        g = Game(['bob', 'jane'], True)
+        self.assertFalse(g.hit(Card('twenty', [20])))  # any 2 cards and 20 more bust, whatever bob was dealt
+        g.stay()
+        g.get_rankings()
+        snapshot = metrics.snapshot()
+        counters = snapshot['counters']
+        self.assertEqual(counters['deck.draws'], 4)
+        self.assertEqual(counters['deck.shuffles'], 1)
+        self.assertEqual(counters['hand.cards'], 5)
+        self.assertEqual(counters['game.hits'], 1)
+        self.assertEqual(counters['game.busts'], 1)
+        self.assertEqual(counters['game.stays'], 1)
+        self.assertGreaterEqual(counters['maxheap.comparisons'], 1)
+        self.assertEqual(snapshot['timings']['game.hit']['count'], 1)
+        self.assertEqual(snapshot['timings']['game.deal']['count'], 1)
+        self.assertEqual(snapshot['timings']['game.rankings']['count'], 1)
+        self.assertDictEqual(json.loads(metrics.to_json()), json.loads(json.dumps(snapshot)))
+
+    def test_tree_nodes(self):
+        """
+        Tests that tree nodes are only allocated once the BinaryTree view of a hand is requested
+        """
+        metrics.enable()
+        h = Hand()
+        h.add_card(Card('ace', [1, 11]))
+        self.assertNotIn('binarytree.nodes', metrics.counters)
+        h.hands
+        self.assertEqual(metrics.counters['binarytree.nodes'], 3)
+
+    def test_histogram(self):
+        """
+        Tests that durations are bucketed by powers of 2 microseconds
+        """
+        histogram = TimingHistogram()
+        for seconds in [0.0000005, 0.000003, 0.000003, 0.001]:
+            histogram.record(seconds)
+        snapshot = histogram.snapshot()
+        self.assertEqual(snapshot['count'], 4)
+        self.assertEqual(snapshot['max'], 0.001)
+        self.assertDictEqual(snapshot['buckets'], {'<1us': 1, '<4us': 2, '<1024us': 1})
@@ -0,0 +1,101 @@
+import os
+import struct
+import tempfile
+import unittest
+from src.OutcomeTables import HEADER, MAGIC, NUM_ROWS, VERSION, OutcomeTable, build_outcome_table
+from src.Hand import Hand
+from src.Card import Card
+
+
+class TestOutcomeTables(unittest.TestCase):
+    """
+    This class tests building, saving, and loading OutcomeTables
+    """
+
+    def test_initialization_edge(self):
+        """
+        Tests that invalid thresholds and numbers of decks are rejected
+        """
+        for kwargs in [{'threshold': 0}, {'threshold': 22}, {'num_decks': 0}, {'num_decks': 9}]:
+            with self.assertRaises(ValueError):
+                build_outcome_table(**kwargs)
+
+    def test_distributions(self):
+        """
+        Tests that every distribution sums to 1, and that hands at or above the threshold already stand
+        """
+        for exact in [False, True]:
+            table = build_outcome_table(17, 1, exact)
+            self.assertListEqual(table.get_outcomes(), [17, 18, 19, 20, 21, 'bust'])
+            for hard_total in range(22):
+                for soft_aces in [0, 1]:
+                    self.assertAlmostEqual(sum(table.get_distribution(hard_total, soft_aces)), 1.0)
+            self.assertListEqual(table.get_distribution(19, 0), [0, 0, 1, 0, 0, 0])
+            self.assertListEqual(table.get_distribution(8, 1), [0, 1, 0, 0, 0, 0])  # soft 18
+            with self.assertRaises(ValueError):
+                table.get_distribution(22, 0)
+
+    def test_infinite_deck(self):
+        """
+        Tests a distribution that can be worked out by hand for an infinite deck
+        """
+        table = build_outcome_table(17, 1, False)
+        # hard 16: an ace makes 17, a two to five make 18-21, anything else busts
+        self.assertListEqual([round(p * 13, 9) for p in table.get_distribution(16, 0)], [1, 1, 1, 1, 1, 8])
+
+    def test_exact_composition(self):
+        """
+        Tests that drawing without replacement differs from the infinite deck, and shrinks as decks are added
+        """
+        infinite = build_outcome_table(17, 1, False).get_distribution(12, 0)
+        one_deck = build_outcome_table(17, 1, True).get_distribution(12, 0)
+        eight_decks = build_outcome_table(17, 8, True).get_distribution(12, 0)
+        self.assertNotAlmostEqual(one_deck[-1], infinite[-1], places=4)
+        self.assertLess(abs(eight_decks[-1] - infinite[-1]), abs(one_deck[-1] - infinite[-1]))
+
+    def test_save_load(self):
+        """
+        Tests that a saved table loads back (memory-mapped) with the same settings and probabilities
+        """
+        table = build_outcome_table(16, 2, True)
+        fd, path = tempfile.mkstemp()
+        os.close(fd)
+        try:
+            table.save(path)
+            loaded = OutcomeTable.load(path)
+            self.assertEqual((loaded.threshold, loaded.num_decks, loaded.exact), (16, 2, True))
+            h = Hand()
+            h.add_card(Card('ace', [1, 11]))
+            h.add_card(Card('two', [2]))
+            self.assertListEqual(loaded.get_hand_distribution(h), table.get_distribution(3, 1))
+            self.assertEqual(list(loaded.data), list(table.data))
+            loaded.close()
+            with open(path, 'wb') as f:
+                f.write(b'not a table')
+            with self.assertRaises(ValueError):
+                OutcomeTable.load(path)
+        finally:
+            os.remove(path)
+
+    def test_corrupt_header(self):
+        """
+        Tests that the file is little-endian whatever the machine, and that a header whose threshold, rows or
+        columns do not describe a valid table is rejected even when the size of the file matches
+        """
+        table = build_outcome_table(15)  # 8 columns
+        fd, path = tempfile.mkstemp()
+        os.close(fd)
+        try:
+            table.save(path)
+            with open(path, 'rb') as f:
+                contents = f.read()
+            self.assertEqual(struct.unpack_from('<d', contents, HEADER.size)[0], table.data[0])
+            for threshold, num_rows, num_columns in [(16, NUM_ROWS, 8), (15, 88, 4), (0, NUM_ROWS, 8),
+                                                     (22, NUM_ROWS, 8)]:
+                with open(path, 'wb') as f:
+                    f.write(HEADER.pack(MAGIC, VERSION, threshold, 1, False, num_rows, num_columns))
+                    f.write(contents[HEADER.size:])
+                with self.assertRaises(ValueError):
+                    OutcomeTable.load(path)
+        finally:
+            os.remove(path)
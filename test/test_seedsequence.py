@@ -0,0 +1,26 @@
+import unittest
+from src.SeedSequence import SeedSequence
+
+
+class TestSeedSequence(unittest.TestCase):
+    """
+    This class tests the SeedSequence class
+    """
+
+    def test_reproducible(self):
+        """
+        Tests that the same root seed and path always give the same seed and RNG stream
+        """
+        a, b = SeedSequence(7).spawn('table', 3), SeedSequence(7, ('table', 3))
+        self.assertEqual(a.get_seed(), b.get_seed())
+        self.assertListEqual([a.make_rng().random() for _ in range(3)], [b.make_rng().random() for _ in range(3)])
+        self.assertLess(a.get_seed(), 1 << 64)
+
+    def test_independent(self):
+        """
+        Tests that different root seeds and paths give different seeds
+        """
+        root = SeedSequence(7)
+        seeds = {root.get_seed(), SeedSequence(8).get_seed(), root.spawn(0).get_seed(), root.spawn(1).get_seed(),
+                 root.spawn('0').get_seed(), root.spawn(0, 0).get_seed(), root.spawn(0).spawn(1).get_seed()}
+        self.assertEqual(len(seeds), 7)
@@ -0,0 +1,123 @@
+import unittest
+from random import Random
+from src.Shoe import Shoe
+
+
+class TestShoe(unittest.TestCase):
+    """
+    This class tests the Shoe class
+    """
+
+    def test_initialization_edge(self):
+        """
+        Tests that invalid deck counts, penetrations, and cut card positions are rejected
+        """
+        for kwargs in [{'num_decks': 0}, {'num_decks': 9}, {'penetration': 0}, {'penetration': 1.5},
+                       {'num_decks': 1, 'cut_card': 53}, {'cut_card': 0}]:
+            with self.assertRaises(ValueError):
+                Shoe(**kwargs)
+
+    def test_initial_state(self):
+        """
+        Tests the per-slot counts and cut card position of a new shoe
+        """
+        s = Shoe(num_decks=2, penetration=0.5)
+        self.assertListEqual(s.cards, [2] * 52)
+        self.assertEqual(s.get_capacity(), 104)
+        self.assertEqual(s.cut_card, 52)
+        self.assertFalse(s.is_cut_card_reached())
+
+    def test_draw_counts(self):
+        """
+        Tests that drawing every card of a multi-deck shoe draws each slot once per deck
+        """
+        s = Shoe(num_decks=3, cut_card=156)
+        drawn = [str(s.draw()) for _ in range(156)]
+        self.assertListEqual(s.cards, [0] * 52)
+        self.assertEqual(len(set(drawn)), 52)
+        self.assertTrue(all(drawn.count(card) == 3 for card in set(drawn)))
+
+    def test_cut_card(self):
+        """
+        Tests that the shoe is reshuffled at the start of a round once the cut card is reached
+        """
+        s = Shoe(num_decks=1, cut_card=10)
+        for _ in range(9):
+            s.draw()
+        s.start_round()
+        self.assertEqual(s.get_num_drawn(), 9)
+        s.draw()
+        self.assertTrue(s.is_cut_card_reached())
+        s.start_round()
+        self.assertEqual(s.get_num_drawn(), 0)
+        self.assertListEqual(s.cards, [1] * 52)
+
+    def test_never_empty(self):
+        """
+        Tests that an empty shoe reshuffles the cards discarded in earlier rounds rather than running out of cards
+        """
+        s = Shoe(num_decks=1, cut_card=52)
+        for _ in range(52):
+            s.draw()
+            s.start_round()
+        self.assertIsNotNone(s.draw())
+        self.assertEqual(s.get_num_drawn(), 1)
+        self.assertEqual(s.num_shuffles, 2)
+
+    def test_reshuffle_mid_round(self):
+        """
+        Tests that a shoe emptying mid-round only reshuffles the discarded cards, so that no card is dealt twice in a
+        round and the rank counts and running count still account for the cards in play
+        """
+        s = Shoe(num_decks=1, cut_card=52, rng=Random(2))
+        s.draw_many(30)
+        s.start_round()
+        drawn = s.draw_many_indices(30)  # the last 8 after reshuffling the 30 discarded cards
+        self.assertEqual(s.num_shuffles, 2)
+        self.assertEqual(len(set(drawn)), 30)
+        self.assertListEqual(sorted(s.get_cards_in_play()), sorted(drawn))
+        self.assertListEqual(sorted(s.undrawn), sorted(set(range(52)) - set(drawn)))
+        self.assertListEqual(list(s.get_rank_counts()), [4 - [i % 13 for i in drawn].count(rank) for rank in range(13)])
+        self.assertEqual(s.get_running_count(), sum(s.counting_system[i % 13] for i in drawn))
+        self.assertTrue(s.can_draw(22))
+        self.assertFalse(s.can_draw(23))
+        s.draw_many(22)
+        self.assertIsNone(s.draw())  # every card is in play
+        with self.assertRaises(ValueError):
+            s.draw_many(1)
+        self.assertEqual(s.num_shuffles, 2)
+        s.start_round()
+        self.assertEqual(s.num_shuffles, 3)
+        self.assertEqual(len(s.get_cards_in_play()), 0)
+        self.assertTrue(s.can_draw(52))
+
+    def test_draw_many(self):
+        """
+        Tests that drawing cards in a batch gives the same cards as drawing them one by one, across reshuffles
+        """
+        a, b = Shoe(num_decks=1, rng=Random(4)), Shoe(num_decks=1, rng=Random(4))
+        for _ in range(5):
+            a.start_round()
+            b.start_round()
+            self.assertListEqual(a.draw_many(30), [b.draw() for _ in range(30)])  # empties the shoe mid-round
+        self.assertEqual(a.num_shuffles, 5)
+        self.assertEqual(a.get_num_drawn(), 30)
+        self.assertTrue(a.can_draw(22))
+        self.assertFalse(a.can_draw(23))
+        self.assertFalse(a.can_draw(-1))
+        with self.assertRaises(ValueError):
+            a.draw_many(-1)
+
+    def test_rank_counts(self):
+        """
+        Tests that the rank counts and running count cover every deck, and are reset when reshuffled
+        """
+        s = Shoe(num_decks=2, cut_card=5)
+        counts = s.get_rank_counts()
+        self.assertListEqual(list(counts), [8] * 13)
+        for _ in range(5):
+            s.draw()
+        self.assertEqual(sum(counts), 99)
+        s.start_round()
+        self.assertListEqual(list(counts), [8] * 13)
+        self.assertEqual(s.get_running_count(), 0)
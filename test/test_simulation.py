@@ -0,0 +1,129 @@
+import unittest
+from random import Random
+from src.Simulation import Simulation, SimulationResults, ThresholdPolicy, ParallelSimulation
+from src.Game import Game
+from src.Hand import Hand
+from src.Card import Card
+
+
+class TestSimulation(unittest.TestCase):
+    """
+    This class tests the Simulation class
+    """
+
+    def test_initialization_edge(self):
+        """
+        Tests that mismatched policies and duplicate player names are rejected
+        """
+        with self.assertRaises(ValueError):
+            Simulation(['bob', 'jane'], [ThresholdPolicy()])
+        with self.assertRaises(ValueError):
+            Simulation(['bob', 'bob'], [ThresholdPolicy(), ThresholdPolicy()])
+
+    def test_threshold_policy(self):
+        """
+        Tests that the threshold policy hits below its threshold and stays at or above it
+        """
+        policy = ThresholdPolicy(17)
+        h = Hand()
+        h.add_card(Card('king', [10]))
+        self.assertTrue(policy(h))
+        h.add_card(Card('seven', [7]))
+        self.assertFalse(policy(h))
+
+    def test_play_round(self):
+        """
+        Tests that a simulated round is played through to game over
+        """
+        sim = Simulation(['bob', 'jane'], [ThresholdPolicy(17), ThresholdPolicy(0)])
+        game = sim.play_round()
+        self.assertTrue(game.is_game_over())
+        self.assertEqual(len(game.hands[1].get_cards()), 2)  # jane always stays on the dealt cards
+        self.assertTrue(game.hands[0].is_bust() or game.hands[0].get_best_score() >= 17)
+
+    def test_run_tallies(self):
+        """
+        Tests that the aggregate results are consistent with the number of rounds played
+        """
+        names = ['bob', 'jane', 'joe']
+        sim = Simulation(names, [ThresholdPolicy(15), ThresholdPolicy(17), ThresholdPolicy(22)])
+        results = sim.run(200)
+        self.assertEqual(results.rounds, 200)
+        self.assertEqual(sum(results.wins.values()), 200)
+        self.assertEqual(results.get_bust_rate('joe'), 1.0)  # always hits until bust
+        self.assertGreater(results.get_rounds_per_second(), 0)
+        summary = results.summary()
+        self.assertAlmostEqual(sum(p['win_rate'] for p in summary['players'].values()), 1.0)
+
+    def test_full_table_runs_out_of_cards(self):
+        """
+        Tests that a player who wants to hit on an empty deck stays instead
+        """
+        names = ['Player {0}'.format(i) for i in range(26)]
+        sim = Simulation(names, [ThresholdPolicy(22) for _ in names])
+        results = sim.run(5)
+        self.assertEqual(results.rounds, 5)
+
+    def test_rng(self):
+        """
+        Tests that simulations given equally seeded RNGs tally the same results
+        """
+        names = ['bob', 'jane']
+        a = Simulation(names, [ThresholdPolicy(16), ThresholdPolicy(18)], rng=Random(4)).run(50)
+        b = Simulation(names, [ThresholdPolicy(16), ThresholdPolicy(18)], rng=Random(4)).run(50)
+        self.assertDictEqual(a.wins, b.wins)
+        self.assertDictEqual(a.total_best_score, b.total_best_score)
+
+    def test_merge(self):
+        """
+        Tests that merging results adds up the tallies of both
+        """
+        a, b = SimulationResults(['bob']), SimulationResults(['bob'])
+        for results in (a, b):
+            game = Game(['bob'])
+            game.hit(Card('king', [10]))
+            game.stay()
+            results.record(game)
+        a.merge(b)
+        self.assertEqual(a.rounds, 2)
+        self.assertEqual(a.get_win_rate('bob'), 1.0)
+        self.assertEqual(a.get_average_best_score('bob'), 10)
+        with self.assertRaises(ValueError):
+            a.merge(SimulationResults(['jane']))
+
+
+class TestParallelSimulation(unittest.TestCase):
+    """
+    This class tests the ParallelSimulation class
+    """
+
+    def test_initialization_edge(self):
+        """
+        Tests that invalid tables and worker counts are rejected
+        """
+        with self.assertRaises(ValueError):
+            ParallelSimulation(['bob'], [])
+        with self.assertRaises(ValueError):
+            ParallelSimulation(['bob'], [ThresholdPolicy()], num_workers=0)
+
+    def test_shards(self):
+        """
+        Tests that the rounds are split evenly across workers with distinct, repeatable seeds
+        """
+        sim = ParallelSimulation(['bob'], [ThresholdPolicy()], num_workers=3)
+        shards = sim.get_shards(10, 7)
+        self.assertListEqual([rounds for rounds, _ in shards], [4, 3, 3])
+        self.assertEqual(len(set(seed for _, seed in shards)), 3)
+        self.assertListEqual(shards, sim.get_shards(10, 7))
+
+    def test_deterministic(self):
+        """
+        Tests that the merged tallies are identical for the same seed and number of workers
+        """
+        names = ['bob', 'jane']
+        sim = ParallelSimulation(names, [ThresholdPolicy(16), ThresholdPolicy(18)], num_workers=2)
+        a, b = sim.run(101, seed=3), sim.run(101, seed=3)
+        self.assertEqual(a.rounds, 101)
+        self.assertDictEqual(a.wins, b.wins)
+        self.assertDictEqual(a.busts, b.busts)
+        self.assertDictEqual(a.total_best_score, b.total_best_score)
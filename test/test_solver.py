@@ -0,0 +1,89 @@
+import unittest
+from time import perf_counter
+from src.Solver import Solver, LRUCache
+from src.Deck import Deck
+from src.Hand import Hand
+from src.Card import Card
+
+ONLY_TENS = [0] * 9 + [4, 4, 4, 4]
+ONLY_ACES = [4] + [0] * 12
+
+
+class TestSolver(unittest.TestCase):
+    """
+    This class tests the Solver class
+    """
+
+    def test_forced_outcomes(self):
+        """
+        Tests decisions whose outcomes are certain given the cards left
+        """
+        solver = Solver()
+        decision = solver.solve_counts(12, 0, ONLY_TENS)  # any hit busts with 22
+        self.assertEqual(decision.action, 'stay')
+        self.assertEqual(decision.hit_ev, -22)
+        self.assertEqual(decision.stay_ev, 12)
+        decision = solver.solve_counts(20, 0, ONLY_ACES)  # a hit makes 21
+        self.assertEqual(decision.action, 'hit')
+        self.assertEqual(decision.hit_ev, 21)
+        decision = solver.solve_counts(11, 0, ONLY_TENS)  # a hit makes 21
+        self.assertEqual(decision.hit_ev, 21)
+
+    def test_cannot_hit(self):
+        """
+        Tests that hitting is never chosen for bust hands or when there are no cards left
+        """
+        solver = Solver()
+        self.assertEqual(solver.solve_counts(25, 0, ONLY_ACES).action, 'stay')
+        decision = solver.solve_counts(5, 0, [0] * 13)
+        self.assertEqual(decision.action, 'stay')
+        self.assertEqual(decision.hit_ev, float('-inf'))
+
+    def test_two_step(self):
+        """
+        Tests a decision that depends on the optimal follow-up decision
+        """
+        # 10 left with a five and a six: hitting gives 15 or 16, after which the other card makes 21
+        decision = Solver().solve_counts(10, 0, [0, 0, 0, 0, 1, 1] + [0] * 7)
+        self.assertEqual(decision.action, 'hit')
+        self.assertEqual(decision.hit_ev, 21)
+
+    def test_full_deck(self):
+        """
+        Tests that a decision against a full deck is fast, and that repeating it is answered from the cache
+        """
+        solver = Solver()
+        h = Hand()
+        h.add_card(Card('king', [10]))
+        h.add_card(Card('six', [6]))
+        start = perf_counter()
+        decision = solver.solve(h, Deck())
+        self.assertLess(perf_counter() - start, 1.0)
+        self.assertGreater(decision.stay_ev, decision.hit_ev)
+        misses = solver.cache_info()['misses']
+        self.assertEqual(solver.solve(h, Deck()), decision)
+        self.assertEqual(solver.cache_info()['misses'], misses)
+        self.assertGreaterEqual(solver.cache_info()['hits'], 1)
+
+    def test_bounded_cache(self):
+        """
+        Tests that a small cache gives the same decisions as a large one while holding at most its maximum size
+        """
+        counts = [4] * 13
+        small = Solver(max_cache_size=50)
+        self.assertEqual(small.solve_counts(4, 1, counts), Solver().solve_counts(4, 1, counts))
+        self.assertEqual(small.cache_info()['size'], 50)
+
+    def test_lru_eviction(self):
+        """
+        Tests that the least recently used entry is evicted first
+        """
+        cache = LRUCache(2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        self.assertEqual(cache.get('a'), 1)
+        cache.put('c', 3)  # evicts b
+        self.assertIsNone(cache.get('b'))
+        self.assertDictEqual(cache.info(), {'hits': 1, 'misses': 1, 'size': 2, 'max_size': 2})
+        with self.assertRaises(ValueError):
+            LRUCache(0)
@@ -0,0 +1,92 @@
+import unittest
+from math import sqrt
+from random import Random
+from src.Benchmark import run_benchmark
+from src.Simulation import Simulation, ThresholdPolicy
+try:
+    import numpy as np
+    from src.VectorSimulation import VectorSimulation
+    from src.BatchEvaluation import rank_hands
+except ImportError:  # numpy is optional
+    np = None
+
+
+@unittest.skipIf(np is None, 'numpy is not installed')
+class TestVectorSimulation(unittest.TestCase):
+    """
+    This class tests the VectorSimulation class
+    """
+
+    def test_initialization_edge(self):
+        """
+        Tests that invalid tables and policies are rejected
+        """
+        with self.assertRaises(ValueError):
+            VectorSimulation([], [])
+        with self.assertRaises(ValueError):
+            VectorSimulation(['bob'], [ThresholdPolicy(), ThresholdPolicy()])
+        with self.assertRaises(ValueError):
+            VectorSimulation(['bob'], [lambda hand: False])
+        names = ['Player {0}'.format(i) for i in range(27)]
+        with self.assertRaises(ValueError):
+            VectorSimulation(names, [ThresholdPolicy() for _ in names])
+
+    def test_play_rounds(self):
+        """
+        Tests that every hand follows its policy, and that rankings order the hands of each round by priority
+        """
+        sim = VectorSimulation(['bob', 'jane', 'joe'], [ThresholdPolicy(12), ThresholdPolicy(17), ThresholdPolicy(21)])
+        scores, rankings = sim.play_rounds(1000, np.random.default_rng(2))
+        self.assertEqual(scores.best_score.shape, (1000, 3))
+        self.assertTrue(np.all(scores.is_bust | (scores.best_score >= np.array([12, 17, 21]))))
+        self.assertTrue(np.array_equal(rankings, rank_hands(scores.priority)))
+        ranked = np.take_along_axis(scores.priority, rankings, axis=1)
+        self.assertTrue(np.all(ranked[:, :-1] >= ranked[:, 1:]))
+
+    def test_full_table_runs_out_of_cards(self):
+        """
+        Tests that 26 players can always be simulated, staying once the deck is out of cards
+        """
+        names = ['Player {0}'.format(i) for i in range(26)]
+        results = VectorSimulation(names, [ThresholdPolicy(21) for _ in names]).run(200)
+        self.assertEqual(results.rounds, 200)
+        self.assertEqual(sum(results.wins.values()), 200)
+
+    def test_deterministic(self):
+        """
+        Tests that the tallies are identical for the same seed
+        """
+        sim = VectorSimulation(['bob', 'jane'], [ThresholdPolicy(16), ThresholdPolicy(18)])
+        a, b = sim.run(5000, seed=3, batch_size=1000), sim.run(5000, seed=3, batch_size=1000)
+        self.assertEqual(a.rounds, 5000)
+        self.assertDictEqual(a.wins, b.wins)
+        self.assertDictEqual(a.busts, b.busts)
+        self.assertDictEqual(a.total_best_score, b.total_best_score)
+
+    def test_agrees_with_simulation(self):
+        """
+        Tests that the win rates, bust rates and average best scores agree with the object-based Simulation
+        (within 4 standard errors), with and without pre-dealing
+        """
+        names = ['bob', 'jane', 'joe']
+        policies = [ThresholdPolicy(15), ThresholdPolicy(17), ThresholdPolicy(19)]
+        for pre_deal in [True, False]:
+            expected = Simulation(names, policies, pre_deal, Random(11)).run(3000)
+            actual = VectorSimulation(names, policies, pre_deal).run(100000, seed=11)
+            tolerance = 4 * sqrt(0.25 / expected.rounds)
+            for name in names:
+                self.assertAlmostEqual(actual.get_win_rate(name), expected.get_win_rate(name), delta=tolerance)
+                self.assertAlmostEqual(actual.get_bust_rate(name), expected.get_bust_rate(name), delta=tolerance)
+                self.assertAlmostEqual(actual.get_average_best_score(name), expected.get_average_best_score(name),
+                                       delta=0.3)
+
+    def test_speedup(self):
+        """
+        Tests that the vector_round benchmarks outrun the game_round benchmarks of the same tables by a wide margin
+        (the speedup is well over 100 times on an idle machine, so only an order of magnitude is checked to stay
+        robust on a loaded one)
+        """
+        for num_players in [1, 8, 26]:
+            objects = run_benchmark('game_round_{0}'.format(num_players), scale=100, repeat=3)
+            vectors = run_benchmark('vector_round_{0}'.format(num_players), scale=20000, repeat=3)
+            self.assertGreater(vectors['ops_per_sec'], 10 * objects['ops_per_sec'])